@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Replay Archive
+Binary archive format for replays (arrays of GameBoard, see docs/API.md)
+
+A replay is stored as a keyframe plus one small record per step holding the
+robot state, the action that produced it and the cells that changed. Every
+keyframe_interval steps a full keyframe is repeated, and an offset table
+after the header locates every step, so step N is decoded from at most one
+keyframe and keyframe_interval deltas, straight out of an mmap. With
+full_frames every record is a keyframe, so records have a fixed size;
+robot_flower_replay_reader.py maps that layout as NumPy views.
+
+Layout (little-endian):
+    header   HEADER
+    index    frames x u32 absolute record offsets
+    records  RECORD, then w*h cell codes (keyframe)
+             or u16 count + count x (u16 cell index, u8 cell code) (delta)
+
+Decoding gives back the exact replay JSON ReplayGameImpl receives.
+"""
+
+import argparse
+import json
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+
+from robot_flower_engine import (
+    CLEAN, DROP_FLOWER, EMPTY, GIVE_FLOWER, MOVE, OBSTACLE, PICK_FLOWER,
+    ROTATE, Board,
+)
+
+MAGIC = b'RFPR'
+VERSION = 1
+FULL_FRAMES = 0x01
+
+# magic, version, flags, width, height, frames, keyframe interval,
+# princess x, princess y, total flowers, reserved
+HEADER = struct.Struct('<4sBBBBIHBBHH')
+# kind, action, direction, orientation, robot x, robot y, flowers held,
+# (pad), flowers delivered
+RECORD = struct.Struct('<BBBBBBBxH')
+CHANGE = struct.Struct('<HB')
+
+KEYFRAME, DELTA = 0, 1
+U8, U16, U32 = 0xFF, 0xFFFF, 0xFFFFFFFF
+# Action byte for the initial frame, or when the step cannot be told apart
+NO_ACTION = 0xFF
+
+
+class ArchiveError(ValueError):
+    """Raised for malformed archives and replays that cannot be archived losslessly"""
+
+
+def infer_action(before, after):
+    """(action, direction) codes that turned before into after
+
+    Replays do not carry the actions, but every valid action leaves a
+    distinct trace. An unchanged board (a no-op rotation, or the invalid
+    action that ended the game) gives NO_ACTION.
+    """
+    direction = after.orientation
+    if (after.robot_x, after.robot_y) != (before.robot_x, before.robot_y):
+        return MOVE, direction
+    if after.flowers_delivered > before.flowers_delivered:
+        return GIVE_FLOWER, direction
+    if after.flowers_held > before.flowers_held:
+        return PICK_FLOWER, direction
+    if after.flowers_held < before.flowers_held:
+        return DROP_FLOWER, direction
+    if after.cells != before.cells:
+        changed = next(i for i, (a, b) in enumerate(zip(before.cells, after.cells)) if a != b)
+        if before.cells[changed] == OBSTACLE and after.cells[changed] == EMPTY:
+            return CLEAN, direction
+        return NO_ACTION, NO_ACTION
+    if after.orientation != before.orientation:
+        return ROTATE, direction
+    return NO_ACTION, NO_ACTION
+
+
+def _check_fits(where, fields):
+    """Raise ArchiveError unless every (name, value, limit) fits its field"""
+    for name, value, limit in fields:
+        if not 0 <= value <= limit:
+            raise ArchiveError(f'{where}: {name} {value} does not fit the archive (0-{limit})')
+
+
+def _record(kind, board, action, direction):
+    return RECORD.pack(kind, action, direction, board.orientation, board.robot_x,
+                       board.robot_y, board.flowers_held, board.flowers_delivered)
+
+
+def encode_replay(replay, keyframe_interval=64, full_frames=False):
+    """Archive bytes for a replay (list of GameBoard JSON objects)"""
+    if not isinstance(replay, list) or not all(isinstance(data, dict) for data in replay):
+        raise ArchiveError('Not a replay (a JSON array of GameBoard objects)')
+    if not replay:
+        raise ArchiveError('Replay is empty')
+    if not full_frames and keyframe_interval > U16:
+        raise ArchiveError(f'Keyframe interval {keyframe_interval} does not fit the archive (1-{U16})')
+    boards = []
+    for step, data in enumerate(replay):
+        try:
+            board = Board.from_json(data)
+        except (KeyError, TypeError, ValueError, IndexError) as e:
+            raise ArchiveError(f'Step {step} is not a GameBoard ({type(e).__name__}: {e})')
+        if board.to_json() != data:
+            raise ArchiveError(f'Step {step} is not a canonical GameBoard (row-major, complete)')
+        boards.append(board)
+    first = boards[0]
+    _check_fits('Replay', (
+        ('width', first.width, U8), ('height', first.height, U8),
+        ('princess x', first.princess_x, U8), ('princess y', first.princess_y, U8),
+        ('total flowers', first.total_flowers, U16), ('frames', len(boards), U32),
+    ))
+    for step, board in enumerate(boards):
+        if (board.width, board.height, board.princess_x, board.princess_y, board.total_flowers) != \
+                (first.width, first.height, first.princess_x, first.princess_y, first.total_flowers):
+            raise ArchiveError(f'Step {step} changes the board geometry or flower total')
+        _check_fits(f'Step {step}', (
+            ('robot x', board.robot_x, U8), ('robot y', board.robot_y, U8),
+            ('flowers held', board.flowers_held, U8),
+            ('flowers delivered', board.flowers_delivered, U16),
+        ))
+    interval = 1 if full_frames else max(1, keyframe_interval)
+
+    records = []
+    previous = None
+    for step, board in enumerate(boards):
+        action, direction = (NO_ACTION, NO_ACTION) if previous is None else infer_action(previous, board)
+        if step % interval == 0:
+            records.append(_record(KEYFRAME, board, action, direction) + bytes(board.cells))
+        else:
+            changes = [CHANGE.pack(i, b) for i, (a, b) in enumerate(zip(previous.cells, board.cells)) if a != b]
+            records.append(b''.join([_record(DELTA, board, action, direction),
+                                     struct.pack('<H', len(changes))] + changes))
+        previous = board
+
+    header = HEADER.pack(MAGIC, VERSION, FULL_FRAMES if full_frames else 0,
+                         first.width, first.height, len(boards), interval,
+                         first.princess_x, first.princess_y, first.total_flowers, 0)
+    offset = HEADER.size + 4 * len(records)
+    index = []
+    for record in records:
+        index.append(offset)
+        offset += len(record)
+    if index[-1] > U32:
+        raise ArchiveError('Replay is too large for the u32 record index')
+    return b''.join([header, struct.pack(f'<{len(index)}I', *index)] + records)
+
+
+class ReplayArchive:
+    """Random access to the frames of an archive held in any buffer (bytes, mmap)"""
+
+    def __init__(self, buffer):
+        if len(buffer) < HEADER.size:
+            raise ArchiveError('Archive is truncated')
+        (magic, version, self.flags, self.width, self.height, self.frames,
+         self.keyframe_interval, princess_x, princess_y, self.total_flowers,
+         _) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ArchiveError('Not a replay archive')
+        if version != VERSION:
+            raise ArchiveError(f'Unsupported archive version {version}')
+        if not self.frames:
+            raise ArchiveError('Archive has no frames')
+        if HEADER.size + 4 * self.frames > len(buffer):
+            raise ArchiveError('Archive is truncated (offset index)')
+        self.buffer = buffer
+        self.princess = (princess_x, princess_y)
+        self.offsets = struct.unpack_from(f'<{self.frames}I', buffer, HEADER.size)
+        if max(self.offsets) + RECORD.size > len(buffer):
+            raise ArchiveError('Archive is truncated (records)')
+        self._mmap = None
+
+    @classmethod
+    def open(cls, path):
+        """Map an archive file read-only; close() releases it"""
+        with open(path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                # mmap refuses empty files
+                raise ArchiveError('Archive is truncated')
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            archive = cls(mapped)
+        except Exception:
+            mapped.close()
+            raise
+        archive._mmap = mapped
+        return archive
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.frames
+
+    def record(self, step):
+        """(kind, action, direction, orientation, x, y, held, delivered) of a step"""
+        return RECORD.unpack_from(self.buffer, self.offsets[step])
+
+    def actions(self):
+        """(action, direction) codes per step; step 0 is always NO_ACTION"""
+        return [self.record(step)[1:3] for step in range(self.frames)]
+
+    def _apply_delta(self, cells, step):
+        offset = self.offsets[step] + RECORD.size
+        (count,) = struct.unpack_from('<H', self.buffer, offset)
+        for index, code in CHANGE.iter_unpack(self.buffer[offset + 2:offset + 2 + count * CHANGE.size]):
+            cells[index] = code
+
+    def _board(self, cells, step):
+        _, _, _, orientation, x, y, held, delivered = self.record(step)
+        return Board(self.width, self.height, cells, robot=(x, y), orientation=orientation,
+                     flowers_held=held, princess=self.princess,
+                     total_flowers=self.total_flowers, flowers_delivered=delivered)
+
+    def _keyframe(self, step):
+        offset = self.offsets[step] + RECORD.size
+        return bytearray(self.buffer[offset:offset + self.width * self.height])
+
+    def board(self, step):
+        """The Board at a step, rebuilt from the nearest keyframe"""
+        if not 0 <= step < self.frames:
+            raise IndexError(f'Step {step} out of range (0-{self.frames - 1})')
+        start = step - step % self.keyframe_interval
+        cells = self._keyframe(start)
+        for current in range(start + 1, step + 1):
+            self._apply_delta(cells, current)
+        return self._board(cells, step)
+
+    def boards(self):
+        """Every Board in order, applying each delta once"""
+        cells = None
+        for step in range(self.frames):
+            if step % self.keyframe_interval == 0:
+                cells = self._keyframe(step)
+            else:
+                cells = bytearray(cells)
+                self._apply_delta(cells, step)
+            yield self._board(cells, step)
+
+    def to_json(self):
+        """The replay as the list of GameBoard JSON objects it was built from"""
+        return [board.to_json() for board in self.boards()]
+
+
+def decode_replay(data):
+    return ReplayArchive(data).to_json()
+
+
+# -- Conversion --
+
+def convert_file(job):
+    """Worker: JSON -> archive or archive -> JSON by extension; returns sizes"""
+    source, target, keyframe_interval, full_frames = job
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    try:
+        if source.endswith('.json'):
+            with open(source) as f:
+                body = encode_replay(json.load(f), keyframe_interval, full_frames)
+            with open(target, 'wb') as f:
+                f.write(body)
+        else:
+            # Decode fully first so a corrupt archive leaves no partial file
+            with ReplayArchive.open(source) as archive:
+                replay = archive.to_json()
+            with open(target, 'w') as f:
+                json.dump(replay, f, separators=(',', ':'))
+    except (OSError, ValueError, struct.error) as e:
+        # ArchiveError covers bad replays; struct.error a corrupt archive
+        return source, None, str(e)
+    return source, (os.path.getsize(source), os.path.getsize(target)), None
+
+
+def _target(source, src_root, dst_root):
+    relative = os.path.relpath(source, src_root)
+    stem, ext = os.path.splitext(relative)
+    return os.path.join(dst_root, stem + ('.rfpr' if ext == '.json' else '.json'))
+
+
+def convert_directory(src_root, dst_root, workers=None, keyframe_interval=64, full_frames=False):
+    """Convert every .json (or .rfpr) file under src_root in parallel"""
+    jobs = []
+    for directory, _, files in os.walk(src_root):
+        for name in sorted(files):
+            if name.endswith(('.json', '.rfpr')) and not name.endswith('.compact.json'):
+                source = os.path.join(directory, name)
+                jobs.append((source, _target(source, src_root, dst_root), keyframe_interval, full_frames))
+    converted, failed, size_in, size_out = 0, [], 0, 0
+    with multiprocessing.Pool(workers) as pool:
+        for source, sizes, error in pool.imap_unordered(convert_file, jobs, chunksize=8):
+            if error:
+                failed.append((source, error))
+                continue
+            converted += 1
+            size_in += sizes[0]
+            size_out += sizes[1]
+    return converted, failed, size_in, size_out
+
+
+def main():
+    """Convert replays between JSON and the binary archive format"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('source', help='replay .json / .rfpr file, or a directory of them')
+    parser.add_argument('target', help='output file or directory')
+    parser.add_argument('--keyframe-interval', type=int, default=64)
+    parser.add_argument('--full-frames', action='store_true',
+                        help='store every step as a keyframe (fixed-size records)')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    if not 1 <= args.keyframe_interval <= U16:
+        parser.error(f'--keyframe-interval must be between 1 and {U16}')
+
+    if os.path.isdir(args.source):
+        print(f"🚀 Converting replays in {args.source} -> {args.target}...")
+        converted, failed, size_in, size_out = convert_directory(
+            args.source, args.target, args.workers, args.keyframe_interval, args.full_frames)
+        for source, error in failed:
+            print(f"   ❌ {source}: {error}")
+        share = size_out / size_in if size_in else 0
+        print(f"✅ Converted {converted:,} replays: {size_in:,} -> {size_out:,} bytes "
+              f"({share:.1%} of the input)")
+        if failed:
+            sys.exit(1)
+        return
+
+    source, sizes, error = convert_file((args.source, args.target, args.keyframe_interval, args.full_frames))
+    if error:
+        raise SystemExit(f"❌ {source}: {error}")
+    print(f"✅ {args.source} ({sizes[0]:,} bytes) -> {args.target} ({sizes[1]:,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
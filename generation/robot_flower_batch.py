@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Batch Solver
+Solve large board corpora with the reference solver on a process pool
+
+Boards come from a JSONL corpus ({"id": ..., "board": GameBoard JSON} per
+line, or bare GameBoard objects) or are generated from a seed, in which case
+only (seed, index) pairs cross the process boundary. Work is handed out in
+chunks, results are appended to a JSONL file as soon as a chunk completes,
+and a rerun with the same output file skips the boards already solved.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from robot_flower_boards import MAX_BOARD_SIZE, MIN_BOARD_SIZE, generate_board
+from robot_flower_engine import ACTIONS, DIRECTIONS, STATUSES, Board
+from robot_flower_solver import solve
+
+
+def generated_tasks(count, seed, sizes):
+    """Lazy ('generate', id, seed, index, size) tasks for a seeded corpus"""
+    rng = random.Random(seed)
+    for index in range(count):
+        yield ('generate', f'{seed}-{index}', seed, index, rng.choice(sizes))
+
+
+def corpus_tasks(path):
+    """Lazy ('json', id, board) tasks read from a JSONL corpus"""
+    with open(path) as f:
+        for number, line in enumerate(f):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            board = record.get('board', record)
+            yield ('json', str(record.get('id', number)), board)
+
+
+def _board(task):
+    if task[0] == 'generate':
+        _, _, seed, index, size = task
+        return generate_board(size, random.Random(f'{seed}/{index}'))
+    return Board.from_json(task[2])
+
+
+def solve_chunk(chunk, with_plans=False):
+    """Worker: solve a chunk of tasks; returns (result lines, cpu seconds)"""
+    started = time.process_time()
+    lines = []
+    for task in chunk:
+        board = _board(task)
+        start = time.perf_counter()
+        plan = solve(board)
+        elapsed = time.perf_counter() - start
+        final = board.copy()
+        for action, direction in plan:
+            final.apply(action, direction)
+        result = {
+            'id': task[1],
+            'width': board.width,
+            'height': board.height,
+            'status': STATUSES[final.status],
+            'flowers': board.total_flowers,
+            'actions': len(plan),
+            'ms': round(elapsed * 1000, 3),
+        }
+        if with_plans:
+            result['plan'] = [[ACTIONS[a], DIRECTIONS[d]] for a, d in plan]
+        lines.append(json.dumps(result, separators=(',', ':')))
+    return lines, time.process_time() - started
+
+
+def _solve_chunk_with_plans(chunk):
+    return solve_chunk(chunk, with_plans=True)
+
+
+def chunked(tasks, size, done):
+    chunk = []
+    for task in tasks:
+        if task[1] in done:
+            continue
+        chunk.append(task)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_done(path):
+    """Ids already in an output file
+
+    A torn last line (crash mid-write) is cut off so that appends start on a
+    fresh line; complete lines that do not parse are skipped and left in
+    place, and their boards are solved again.
+    """
+    done = set()
+    if not os.path.exists(path):
+        return done
+    corrupt = 0
+    with open(path, 'rb+') as f:
+        complete = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            complete += len(line)
+            try:
+                done.add(json.loads(line)['id'])
+            except (ValueError, KeyError, TypeError):
+                corrupt += 1
+        f.truncate(complete)
+    if corrupt:
+        print(f"   ⚠️  {corrupt:,} corrupt lines in {path} skipped")
+    return done
+
+
+def run_batch(tasks, output, workers, chunk_size, with_plans=False):
+    """Solve tasks into output (JSONL, appended); returns a summary dict"""
+    done = load_done(output)
+    worker = _solve_chunk_with_plans if with_plans else solve_chunk
+    solved = won = chunks = 0
+    cpu = 0.0
+    started = time.perf_counter()
+    with open(output, 'a') as out, multiprocessing.Pool(workers) as pool:
+        for lines, seconds in pool.imap_unordered(worker, chunked(tasks, chunk_size, done)):
+            out.write('\n'.join(lines) + '\n')
+            out.flush()
+            solved += len(lines)
+            won += sum('"status":"won"' in line for line in lines)
+            cpu += seconds
+            chunks += 1
+            if chunks % 20 == 0:
+                rate = solved / (time.perf_counter() - started)
+                print(f"   {solved:>8,} solved  {rate:>8,.0f} boards/s")
+    elapsed = time.perf_counter() - started
+    return {
+        'skipped': len(done),
+        'solved': solved,
+        'won': won,
+        'seconds': elapsed,
+        'boardsPerSecond': solved / elapsed if elapsed else 0.0,
+        'boardsPerCoreSecond': solved / cpu if cpu else 0.0,
+    }
+
+
+def parse_sizes(text):
+    """'10', '3-50' or '10,25,50' into a list of board sizes"""
+    sizes = []
+    for part in text.split(','):
+        low, _, high = part.partition('-')
+        sizes.extend(range(int(low), int(high or low) + 1))
+    if not sizes or min(sizes) < MIN_BOARD_SIZE or max(sizes) > MAX_BOARD_SIZE:
+        raise argparse.ArgumentTypeError(
+            f'Board sizes must be between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}')
+    return sizes
+
+
+def main():
+    """Solve a board corpus in parallel and stream results to JSONL"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--corpus', help='JSONL file of boards to solve')
+    source.add_argument('--generate', type=int, default=10000, help='boards to generate from --seed')
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('3-50'),
+                        help="generated board sizes, e.g. '10', '3-50' or '10,25,50'")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='solutions.jsonl')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk', type=int, default=64, help='boards per work item')
+    parser.add_argument('--plans', action='store_true', help='include the action plans')
+    args = parser.parse_args()
+
+    tasks = corpus_tasks(args.corpus) if args.corpus else generated_tasks(args.generate, args.seed, args.sizes)
+    print(f"🚀 Solving into {args.output} with {args.workers} workers...")
+    summary = run_batch(tasks, args.output, args.workers, args.chunk, args.plans)
+    if summary['skipped']:
+        print(f"   ⏭️  {summary['skipped']:,} boards already solved, skipped")
+    print(f"\n✅ Solved {summary['solved']:,} boards ({summary['won']:,} won) "
+          f"in {summary['seconds']:.1f}s")
+    print(f"   {summary['boardsPerSecond']:,.0f} boards/s, "
+          f"{summary['boardsPerSecond'] / args.workers:,.0f} boards/s per worker, "
+          f"{summary['boardsPerCoreSecond']:,.0f} boards per CPU-second")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Contract Conformance Harness
+Check a backend against the REST contract and record latency per endpoint
+
+Two contracts can be checked:
+  frontend  what the generated GameRemoteDataSourceImpl sends and parses:
+            the Game/GameBoard models and error format of docs/API.md
+  openapi   the backend's own docs/open-api.json (wrapped responses, 422s)
+
+Each contract yields schema-valid requests (every action/direction pair,
+board sizes at and inside the limits) and edge cases (sizes out of range,
+wrong types, unknown enums, malformed JSON, unknown ids). Cases run
+concurrently; a case fails when the status class is wrong, the response does
+not match its schema or a board breaks a GameBoard invariant. Latency
+percentiles can be saved and compared against a baseline run.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+
+from robot_flower_loadgen import ENDPOINTS, Histogram, Pool
+
+DOCS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'docs')
+
+# Expected outcome of a case
+OK, REJECT, NOT_FOUND, TOLERATE = 'ok', 'reject', 'not found', 'tolerate'
+
+ACTION_NAMES = ['rotate', 'move', 'pickFlower', 'dropFlower', 'giveFlower', 'clean']
+DIRECTION_NAMES = ['NORTH', 'EAST', 'SOUTH', 'WEST']
+# AppConstants.maxActionBatch
+MAX_ACTION_BATCH = 50
+
+POSITION = {
+    'type': 'object', 'required': ['x', 'y'],
+    'properties': {'x': {'type': 'integer', 'minimum': 0}, 'y': {'type': 'integer', 'minimum': 0}},
+}
+GAME_BOARD = {
+    'type': 'object',
+    'required': ['width', 'height', 'cells', 'robot', 'princessPosition', 'totalFlowers'],
+    'properties': {
+        'width': {'type': 'integer', 'minimum': 3, 'maximum': 50},
+        'height': {'type': 'integer', 'minimum': 3, 'maximum': 50},
+        'cells': {'type': 'array', 'items': {
+            'type': 'object', 'required': ['position', 'type'],
+            'properties': {
+                'position': POSITION,
+                'type': {'enum': ['empty', 'robot', 'princess', 'flower', 'obstacle']},
+            },
+        }},
+        'robot': {
+            'type': 'object', 'required': ['position', 'orientation'],
+            'properties': {
+                'position': POSITION,
+                'orientation': {'enum': DIRECTION_NAMES},
+                'flowersHeld': {'type': 'integer', 'minimum': 0, 'maximum': 12},
+            },
+        },
+        'princessPosition': POSITION,
+        'totalFlowers': {'type': 'integer', 'minimum': 0},
+        'flowersDelivered': {'type': 'integer', 'minimum': 0},
+    },
+}
+GAME = {
+    'type': 'object',
+    'required': ['id', 'name', 'board', 'status', 'createdAt'],
+    'properties': {
+        'id': {'type': 'string'},
+        'name': {'type': 'string'},
+        'board': GAME_BOARD,
+        'status': {'enum': ['playing', 'won', 'gameOver']},
+        'actions': {'type': 'array', 'items': {
+            'type': 'object', 'required': ['type', 'direction', 'timestamp', 'success'],
+            'properties': {
+                'type': {'enum': ACTION_NAMES},
+                'direction': {'enum': DIRECTION_NAMES},
+                'timestamp': {'type': 'string'},
+                'success': {'type': 'boolean'},
+                'errorMessage': {'type': ['string', 'null']},
+            },
+        }},
+        'createdAt': {'type': 'string'},
+        'updatedAt': {'type': ['string', 'null']},
+    },
+}
+GAME_SUMMARY_PAGE = {
+    'type': 'object', 'required': ['items', 'nextCursor'],
+    'properties': {
+        'items': {'type': 'array', 'items': {
+            'type': 'object',
+            'required': ['id', 'name', 'status', 'boardWidth', 'boardHeight', 'totalFlowers', 'createdAt'],
+            'properties': {
+                'id': {'type': 'string'},
+                'name': {'type': 'string'},
+                'status': {'enum': ['playing', 'won', 'gameOver']},
+                'boardWidth': {'type': 'integer', 'minimum': 3, 'maximum': 50},
+                'boardHeight': {'type': 'integer', 'minimum': 3, 'maximum': 50},
+                'totalFlowers': {'type': 'integer', 'minimum': 0},
+                'flowersDelivered': {'type': 'integer', 'minimum': 0},
+                'actionCount': {'type': 'integer', 'minimum': 0},
+                'createdAt': {'type': 'string'},
+                'updatedAt': {'type': ['string', 'null']},
+            },
+        }},
+        'nextCursor': {'type': ['string', 'null']},
+    },
+}
+ACTION_BATCH = {
+    'type': 'object', 'required': ['game', 'applied'],
+    'properties': {
+        'game': GAME,
+        'applied': {'type': 'integer', 'minimum': 1, 'maximum': MAX_ACTION_BATCH},
+    },
+}
+ERROR = {
+    'type': 'object', 'required': ['message'],
+    'properties': {
+        'message': {'type': 'string'},
+        'statusCode': {'type': 'integer'},
+        'error': {'type': 'string'},
+    },
+}
+
+
+# -- Schema checks --
+
+_TYPES = {
+    'object': dict, 'array': list, 'string': str, 'boolean': bool,
+    'integer': int, 'number': (int, float), 'null': type(None),
+}
+
+
+def validate(value, schema, root=None, path='$'):
+    """Errors for value against the JSON Schema subset used by both contracts"""
+    root = root or schema
+    if '$ref' in schema:
+        target = root
+        for part in schema['$ref'].lstrip('#/').split('/'):
+            target = target[part]
+        return validate(value, target, root, path)
+    if 'anyOf' in schema:
+        options = [validate(value, option, root, path) for option in schema['anyOf']]
+        return [] if any(not errors for errors in options) else options[0]
+    errors = []
+    if 'type' in schema:
+        types = schema['type'] if isinstance(schema['type'], list) else [schema['type']]
+        matches = any(
+            isinstance(value, _TYPES[t]) and not (t in ('integer', 'number') and isinstance(value, bool))
+            for t in types
+        )
+        if not matches:
+            return [f'{path}: expected {"/".join(types)}, got {type(value).__name__}']
+    if 'enum' in schema and value not in schema['enum']:
+        errors.append(f'{path}: {value!r} not in {schema["enum"]}')
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if 'minimum' in schema and value < schema['minimum']:
+            errors.append(f'{path}: {value} < {schema["minimum"]}')
+        if 'maximum' in schema and value > schema['maximum']:
+            errors.append(f'{path}: {value} > {schema["maximum"]}')
+    if isinstance(value, dict):
+        for name in schema.get('required', []):
+            if name not in value:
+                errors.append(f'{path}: missing {name}')
+        for name, subschema in schema.get('properties', {}).items():
+            if name in value:
+                errors.extend(validate(value[name], subschema, root, f'{path}.{name}'))
+    if isinstance(value, list) and 'items' in schema:
+        for i, item in enumerate(value):
+            errors.extend(validate(item, schema['items'], root, f'{path}[{i}]'))
+            if len(errors) > 10:
+                break
+    return errors
+
+
+def board_invariants(board, path='$'):
+    """GameBoard rules the schema cannot express"""
+    errors = []
+    width, height = board['width'], board['height']
+    if len(board['cells']) not in (0, width * height):
+        errors.append(f'{path}.cells: {len(board["cells"])} cells for a {width}x{height} board')
+    for name, position in (('robot', board['robot']['position']), ('princessPosition', board['princessPosition'])):
+        if not (0 <= position['x'] < width and 0 <= position['y'] < height):
+            errors.append(f'{path}.{name}: {position} outside the board')
+    if board.get('flowersDelivered', 0) > board['totalFlowers']:
+        errors.append(f'{path}.flowersDelivered exceeds totalFlowers')
+    return errors
+
+
+# -- Contracts --
+
+class Case:
+    """One request with its expected outcome
+
+    path may contain {game}, replaced by the id of a freshly created game.
+    """
+
+    def __init__(self, name, endpoint, method, path, body=None, expect=OK, schema=None):
+        self.name = name
+        self.endpoint = endpoint
+        self.method = method
+        self.path = path
+        self.body = body
+        self.expect = expect
+        self.schema = schema
+
+
+class FrontendContract:
+    """docs/API.md as consumed by the generated data source"""
+
+    name = 'frontend'
+    games_path = '/api/games'
+    created = (200, 201)
+    reject = (400,)
+
+    def __init__(self, root=None):
+        self.root = root
+
+    def create_body(self, size, name='conformance'):
+        # GameRemoteDataSourceImpl.createGame sends boardSize
+        return {'name': name, 'boardSize': size}
+
+    def game_of(self, data):
+        return data
+
+    def schemas(self):
+        return {
+            'game': GAME, 'games': {'type': 'array', 'items': GAME},
+            'replay': {'type': 'array', 'items': GAME_BOARD}, 'error': ERROR,
+            'summaries': GAME_SUMMARY_PAGE, 'actions': ACTION_BATCH,
+        }
+
+    def boards_of(self, endpoint, data):
+        if endpoint == 'replay':
+            return data
+        if endpoint == 'list':
+            return [game['board'] for game in data] if isinstance(data, list) else []
+        if endpoint == 'actions':
+            return [data['game']['board']]
+        return [self.game_of(data)['board']]
+
+    def cases(self, rng):
+        s = self.schemas()
+        games = self.games_path
+        cases = [
+            Case(f'create size {size}', 'create', 'POST', games, self.create_body(size), OK, s['game'])
+            for size in (3, 4, rng.randint(5, 49), 50)
+        ]
+        cases += [
+            Case('create unicode name', 'create', 'POST', games, self.create_body(10, '🤖 Robot ✿ Princesse'), OK, s['game']),
+            Case('create long name', 'create', 'POST', games, self.create_body(10, 'x' * 1000), TOLERATE),
+            Case('create cols/rows', 'create', 'POST', games, {'name': 'conformance', 'cols': 10, 'rows': 10}, OK, s['game']),
+            Case('create size 2', 'create', 'POST', games, self.create_body(2), REJECT, s['error']),
+            Case('create size 51', 'create', 'POST', games, self.create_body(51), REJECT, s['error']),
+            Case('create size as string', 'create', 'POST', games, self.create_body('10'), REJECT, s['error']),
+            Case('create size null', 'create', 'POST', games, self.create_body(None), REJECT, s['error']),
+            Case('create empty object', 'create', 'POST', games, {}, REJECT, s['error']),
+            Case('create malformed JSON', 'create', 'POST', games, b'{"name": "broken"', REJECT, s['error']),
+            Case('list games', 'list', 'GET', games, None, OK, s['games']),
+            Case('list limit=1', 'list', 'GET', f'{games}?limit=1', None, OK, s['games']),
+            Case('list limit=-1', 'list', 'GET', f'{games}?limit=-1', None, TOLERATE),
+            Case('list limit=abc', 'list', 'GET', f'{games}?limit=abc', None, TOLERATE),
+        ]
+        if 'summaries' in s:
+            cases += [
+                Case('summaries first page', 'list', 'GET', f'{games}?view=summary&limit=20', None, OK, s['summaries']),
+                Case('summaries default limit', 'list', 'GET', f'{games}?view=summary', None, OK, s['summaries']),
+                Case('summaries limit=0', 'list', 'GET', f'{games}?view=summary&limit=0', None, REJECT, s['error']),
+                Case('summaries limit=101', 'list', 'GET', f'{games}?view=summary&limit=101', None, REJECT, s['error']),
+                Case('summaries bad cursor', 'list', 'GET', f'{games}?view=summary&cursor=nope', None, REJECT, s['error']),
+            ]
+        cases += [
+            Case('get game', 'get', 'GET', '/api/games/{game}', None, OK, s['game']),
+            Case('get unknown game', 'get', 'GET', '/api/games/does-not-exist', None, NOT_FOUND, s['error']),
+            Case('autoplay', 'autoplay', 'POST', '/api/games/{game}/autoplay', None, OK, s['game']),
+            Case('autoplay unknown game', 'autoplay', 'POST', '/api/games/does-not-exist/autoplay', None, NOT_FOUND, s['error']),
+        ]
+        cases += [
+            Case(f'action {a} {d}', 'action', 'POST', '/api/games/{game}/action',
+                 {'action': a, 'direction': d}, OK, s['game'])
+            for a in ACTION_NAMES for d in DIRECTION_NAMES
+        ]
+        cases += [
+            Case('action unknown type', 'action', 'POST', '/api/games/{game}/action',
+                 {'action': 'jump', 'direction': 'NORTH'}, REJECT, s['error']),
+            Case('action unknown direction', 'action', 'POST', '/api/games/{game}/action',
+                 {'action': 'move', 'direction': 'UP'}, REJECT, s['error']),
+            Case('action lowercase direction', 'action', 'POST', '/api/games/{game}/action',
+                 {'action': 'move', 'direction': 'north'}, REJECT, s['error']),
+            Case('action missing direction', 'action', 'POST', '/api/games/{game}/action',
+                 {'action': 'rotate'}, REJECT, s['error']),
+            Case('action malformed JSON', 'action', 'POST', '/api/games/{game}/action',
+                 b'not json', REJECT, s['error']),
+            Case('action unknown game', 'action', 'POST', '/api/games/does-not-exist/action',
+                 {'action': 'rotate', 'direction': 'NORTH'}, NOT_FOUND, s['error']),
+        ]
+        if 'actions' in s:
+            rotate = {'action': 'rotate', 'direction': 'EAST'}
+            cases += [
+                Case('actions batch of 1', 'actions', 'POST', '/api/games/{game}/actions',
+                     {'actions': [rotate]}, OK, s['actions']),
+                Case(f'actions batch of {MAX_ACTION_BATCH}', 'actions', 'POST', '/api/games/{game}/actions',
+                     {'actions': [rotate] * MAX_ACTION_BATCH}, OK, s['actions']),
+                Case('actions empty batch', 'actions', 'POST', '/api/games/{game}/actions',
+                     {'actions': []}, REJECT, s['error']),
+                Case(f'actions batch of {MAX_ACTION_BATCH + 1}', 'actions', 'POST', '/api/games/{game}/actions',
+                     {'actions': [rotate] * (MAX_ACTION_BATCH + 1)}, REJECT, s['error']),
+                Case('actions not a list', 'actions', 'POST', '/api/games/{game}/actions',
+                     {'actions': rotate}, REJECT, s['error']),
+                Case('actions unknown type in batch', 'actions', 'POST', '/api/games/{game}/actions',
+                     {'actions': [rotate, {'action': 'jump', 'direction': 'NORTH'}]}, REJECT, s['error']),
+                Case('actions unknown game', 'actions', 'POST', '/api/games/does-not-exist/actions',
+                     {'actions': [rotate]}, NOT_FOUND, s['error']),
+            ]
+        if 'replay' in s:
+            cases += [
+                Case('replay', 'replay', 'GET', '/api/games/{game}/replay', None, OK, s['replay']),
+                Case('replay unknown game', 'replay', 'GET', '/api/games/does-not-exist/replay', None, NOT_FOUND, s['error']),
+            ]
+        return cases
+
+
+class OpenApiContract(FrontendContract):
+    """The backend's docs/open-api.json (responses wrap the game)"""
+
+    name = 'openapi'
+    games_path = '/api/games/'
+    created = (201,)
+    reject = (400, 422)
+
+    def __init__(self, spec_path):
+        with open(spec_path) as f:
+            self.spec = json.load(f)
+        super().__init__(self.spec)
+
+    def create_body(self, size, name='conformance'):
+        return {'name': name, 'rows': size, 'cols': size}
+
+    def game_of(self, data):
+        return data['game']
+
+    def _response(self, path, method, status='200'):
+        content = self.spec['paths'][path][method]['responses'][status]['content']
+        return content['application/json']['schema']
+
+    def schemas(self):
+        return {
+            'game': self._response('/api/games/{game_id}', 'get'),
+            'created': self._response('/api/games/', 'post', '201'),
+            'games': self._response('/api/games/', 'get'),
+            'action': self._response('/api/games/{game_id}/action', 'post'),
+            'autoplay': self._response('/api/games/{game_id}/autoplay', 'post'),
+            'error': {'anyOf': [{'$ref': '#/components/schemas/HTTPValidationError'}, ERROR]},
+        }
+
+    def boards_of(self, endpoint, data):
+        if endpoint == 'list':
+            return [game['board'] for game in data['games'] if 'board' in game]
+        game = self.game_of(data)
+        return [game['board']] if 'board' in game else []
+
+    def cases(self, rng):
+        cases = super().cases(rng)
+        s = self.schemas()
+        for case in cases:
+            if case.expect == OK and case.endpoint in ('create', 'action', 'autoplay'):
+                case.schema = s['created' if case.endpoint == 'create' else case.endpoint]
+        return cases
+
+
+# -- Runner --
+
+# Games created for cases on /api/games/{game}: timed apart from the create
+# cases and left out of the report and baselines
+SETUP = 'setup'
+
+class Result:
+    def __init__(self, case, status, failures):
+        self.case = case
+        self.status = status
+        self.failures = failures
+
+
+async def run_case(pool, contract, case):
+    path = case.path
+    if '{game}' in path:
+        status, data = await pool.call(SETUP, 'POST', contract.games_path, contract.create_body(8))
+        if status not in contract.created:
+            return Result(case, status, [f'setup: creating a game returned {status}'])
+        try:
+            game_id = contract.game_of(json.loads(data))['id']
+        except (ValueError, KeyError, TypeError):
+            return Result(case, status, ['setup: unexpected create response'])
+        path = path.replace('{game}', str(game_id))
+    status, data = await pool.call(case.endpoint, case.method, path, case.body)
+    if status is None:
+        return Result(case, None, ['connection failed'])
+
+    failures = []
+    expected = {
+        OK: lambda s: 200 <= s < 300,
+        REJECT: lambda s: s in contract.reject,
+        NOT_FOUND: lambda s: s == 404,
+        TOLERATE: lambda s: s < 500,
+    }[case.expect]
+    if not expected(status):
+        failures.append(f'expected {case.expect}, got {status}')
+    if case.schema is not None and expected(status):
+        try:
+            body = json.loads(data)
+        except ValueError:
+            failures.append('response is not JSON')
+        else:
+            failures += validate(body, case.schema, contract.root)
+            if not failures and case.expect == OK:
+                for i, board in enumerate(contract.boards_of(case.endpoint, body)):
+                    failures += board_invariants(board, f'$board[{i}]')
+    return Result(case, status, failures)
+
+
+async def run_contract(url, contract, repeat, concurrency, seed):
+    pool = Pool(url, concurrency)
+    pool.stats[SETUP] = Histogram()
+    rng = random.Random(seed)
+    cases = contract.cases(rng) * repeat
+    rng.shuffle(cases)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def limited(case):
+        async with slots:
+            return await run_case(pool, contract, case)
+
+    try:
+        results = await asyncio.gather(*[limited(case) for case in cases])
+    finally:
+        pool.close()
+    return results, pool.stats
+
+
+def compare(stats, baseline, tolerance):
+    """Endpoints whose p99 regressed beyond tolerance against a saved run"""
+    regressions = []
+    for name, histogram in stats.items():
+        before = baseline.get(name)
+        if not histogram.count or not before:
+            continue
+        p99 = histogram.percentile(0.99) / 1000
+        if p99 > before['p99Ms'] * (1 + tolerance):
+            regressions.append(f'{name}: p99 {p99:.2f} ms vs baseline {before["p99Ms"]:.2f} ms')
+    return regressions
+
+
+def main():
+    """Run the conformance cases against a backend"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8080')
+    parser.add_argument('--contract', choices=('frontend', 'openapi'), default='frontend')
+    parser.add_argument('--spec', default=os.path.join(DOCS_DIR, 'open-api.json'))
+    parser.add_argument('--repeat', type=int, default=5, help='runs of every case, for latency')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', metavar='FILE', help='write latency percentiles as a baseline')
+    parser.add_argument('--baseline', metavar='FILE', help='fail if p99 regresses against this file')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed p99 regression (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    contract = OpenApiContract(args.spec) if args.contract == 'openapi' else FrontendContract()
+    print(f"🚀 Checking {args.url} against the {contract.name} contract...")
+    results, stats = asyncio.run(run_contract(args.url, contract, args.repeat, args.concurrency, args.seed))
+
+    failed = {}
+    for result in results:
+        if result.failures:
+            failed.setdefault(result.case.name, result)
+    passed = len({r.case.name for r in results}) - len(failed)
+    for name, result in sorted(failed.items()):
+        print(f"   ❌ {name} ({result.status}): {'; '.join(result.failures[:3])}")
+    print(f"\n📋 {passed} cases passed, {len(failed)} failed")
+
+    print(f"\n   {'endpoint':<10}{'count':>8}{'p50 ms':>9}{'p99 ms':>9}{'p999 ms':>9}")
+    summary = {}
+    for name in ENDPOINTS:
+        histogram = stats[name]
+        if histogram.count:
+            summary[name] = histogram.summary()
+            print(f"   {name:<10}{histogram.count:>8}{summary[name]['p50Ms']:>9.2f}"
+                  f"{summary[name]['p99Ms']:>9.2f}{summary[name]['p999Ms']:>9.2f}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(stats, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"   🐢 {line}")
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"\n💾 Latency baseline written to {args.save}")
+    if failed or regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
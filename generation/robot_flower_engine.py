@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Reference Game Engine
+Python mirror of the generated Dart domain (Robot, GameBoard, GameRules)
+
+Boards are stored as a row-major bytearray of cell codes, so a single game
+is cheap to copy and step. BatchBoards steps many independent games at once
+with NumPy arrays and is the mode to use for load tests and fuzzing.
+"""
+
+import argparse
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for BatchBoards
+    np = None
+
+# Value objects, in the same order as the Dart enums
+CELL_TYPES = ('empty', 'robot', 'princess', 'flower', 'obstacle')
+DIRECTIONS = ('NORTH', 'EAST', 'SOUTH', 'WEST')
+ACTIONS = ('rotate', 'move', 'pickFlower', 'dropFlower', 'giveFlower', 'clean')
+STATUSES = ('playing', 'won', 'gameOver')
+
+EMPTY, ROBOT, PRINCESS, FLOWER, OBSTACLE = range(len(CELL_TYPES))
+NORTH, EAST, SOUTH, WEST = range(len(DIRECTIONS))
+ROTATE, MOVE, PICK_FLOWER, DROP_FLOWER, GIVE_FLOWER, CLEAN = range(len(ACTIONS))
+PLAYING, WON, GAME_OVER = range(len(STATUSES))
+
+CELL_CODES = {name: code for code, name in enumerate(CELL_TYPES)}
+DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTIONS)}
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+STATUS_CODES = {name: code for code, name in enumerate(STATUSES)}
+
+# One character per cell type for the compact encoding, in CELL_TYPES order
+CELL_CHARS = '.RPFO'
+
+# Grid offsets per direction (rows grow southward), matching Direction.dx/dy
+DX = (0, 1, 0, -1)
+DY = (-1, 0, 1, 0)
+
+# Robot.canPickMore in the Dart domain
+MAX_FLOWERS_HELD = 12
+
+
+class InvalidActionError(Exception):
+    """Raised by Board.apply(strict=True) when an action breaks the rules"""
+
+
+class Board:
+    """A single game board, mutable in place for speed"""
+
+    __slots__ = (
+        'width', 'height', 'cells',
+        'robot_x', 'robot_y', 'orientation', 'flowers_held',
+        'princess_x', 'princess_y',
+        'total_flowers', 'flowers_delivered', 'status',
+    )
+
+    def __init__(self, width, height, cells=None, robot=(0, 0), orientation=NORTH,
+                 flowers_held=0, princess=None, total_flowers=0,
+                 flowers_delivered=0, status=PLAYING):
+        self.width = width
+        self.height = height
+        self.cells = cells if cells is not None else bytearray(width * height)
+        self.robot_x, self.robot_y = robot
+        self.orientation = orientation
+        self.flowers_held = flowers_held
+        self.princess_x, self.princess_y = princess if princess else (width - 1, height - 1)
+        self.total_flowers = total_flowers
+        self.flowers_delivered = flowers_delivered
+        self.status = status
+
+    # -- Serialization (GameBoard JSON shape from docs/API.md) --
+
+    @classmethod
+    def from_json(cls, data, status='playing'):
+        width = data['width']
+        height = data['height']
+        cells = bytearray(width * height)
+        for cell in data['cells']:
+            position = cell['position']
+            cells[position['y'] * width + position['x']] = CELL_CODES[cell['type']]
+        robot = data['robot']
+        princess = data['princessPosition']
+        return cls(
+            width, height, cells,
+            robot=(robot['position']['x'], robot['position']['y']),
+            orientation=DIRECTION_CODES[robot['orientation']],
+            flowers_held=robot.get('flowersHeld', 0),
+            princess=(princess['x'], princess['y']),
+            total_flowers=data['totalFlowers'],
+            flowers_delivered=data.get('flowersDelivered', 0),
+            status=STATUS_CODES[status],
+        )
+
+    def to_json(self):
+        width = self.width
+        cells = self.cells
+        return {
+            'width': width,
+            'height': self.height,
+            'cells': [
+                {'position': {'x': i % width, 'y': i // width}, 'type': CELL_TYPES[cells[i]]}
+                for i in range(len(cells))
+            ],
+            'robot': {
+                'position': {'x': self.robot_x, 'y': self.robot_y},
+                'orientation': DIRECTIONS[self.orientation],
+                'flowersHeld': self.flowers_held,
+            },
+            'princessPosition': {'x': self.princess_x, 'y': self.princess_y},
+            'totalFlowers': self.total_flowers,
+            'flowersDelivered': self.flowers_delivered,
+        }
+
+    @classmethod
+    def from_compact(cls, data, status='playing'):
+        robot_x, robot_y, orientation, held = data['r']
+        return cls(
+            data['w'], data['h'], bytearray(CELL_CHARS.index(c) for c in data['g']),
+            robot=(robot_x, robot_y),
+            orientation=DIRECTION_CODES[orientation],
+            flowers_held=held,
+            princess=tuple(data['p']),
+            total_flowers=data['t'],
+            flowers_delivered=data['d'],
+            status=STATUS_CODES[status],
+        )
+
+    def to_compact(self):
+        """Compact GameBoard: the grid as one string of CELL_CHARS, row-major"""
+        return {
+            'w': self.width,
+            'h': self.height,
+            'g': ''.join([CELL_CHARS[c] for c in self.cells]),
+            'r': [self.robot_x, self.robot_y, DIRECTIONS[self.orientation], self.flowers_held],
+            'p': [self.princess_x, self.princess_y],
+            't': self.total_flowers,
+            'd': self.flowers_delivered,
+        }
+
+    def copy(self):
+        return Board(
+            self.width, self.height, bytearray(self.cells),
+            robot=(self.robot_x, self.robot_y),
+            orientation=self.orientation,
+            flowers_held=self.flowers_held,
+            princess=(self.princess_x, self.princess_y),
+            total_flowers=self.total_flowers,
+            flowers_delivered=self.flowers_delivered,
+            status=self.status,
+        )
+
+    # -- Queries --
+
+    def cell_at(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        return None
+
+    def is_free(self, x, y):
+        return (x, y) != (self.princess_x, self.princess_y) and self.cell_at(x, y) == EMPTY
+
+    @property
+    def is_complete(self):
+        return self.flowers_delivered >= self.total_flowers
+
+    # -- Rules (mirror of GameRules.applyToBoard) --
+
+    def apply(self, action, direction, strict=False):
+        """Apply one action in place; returns None on success or an error message
+
+        An invalid action leaves the board untouched and ends the game, as
+        the backend and GameRules.apply do (the rules/invalid_action fixture
+        pins this down); finished games are never changed. With strict=True
+        it raises InvalidActionError instead of returning the message.
+        """
+        if self.status != PLAYING:
+            error = 'Game is already finished'
+        else:
+            error = self._apply(action, direction)
+            if error is not None:
+                self.status = GAME_OVER
+        if error is not None and strict:
+            raise InvalidActionError(error)
+        return error
+
+    def _apply(self, action, direction):
+        x = self.robot_x + DX[direction]
+        y = self.robot_y + DY[direction]
+
+        if action == ROTATE:
+            pass
+        elif action == MOVE:
+            if not self.is_free(x, y):
+                return f'Cannot move to ({x}, {y})'
+            source = self.robot_y * self.width + self.robot_x
+            if self.cells[source] == ROBOT:
+                self.cells[source] = EMPTY
+                self.cells[y * self.width + x] = ROBOT
+            self.robot_x, self.robot_y = x, y
+        elif action == PICK_FLOWER:
+            if self.cell_at(x, y) != FLOWER:
+                return f'No flower to pick at ({x}, {y})'
+            if self.flowers_held >= MAX_FLOWERS_HELD:
+                return 'Robot cannot hold more flowers'
+            self.cells[y * self.width + x] = EMPTY
+            self.flowers_held += 1
+        elif action == DROP_FLOWER:
+            if self.flowers_held == 0:
+                return 'Robot has no flower to drop'
+            if not self.is_free(x, y):
+                return f'Cannot drop a flower at ({x}, {y})'
+            self.cells[y * self.width + x] = FLOWER
+            self.flowers_held -= 1
+        elif action == GIVE_FLOWER:
+            if self.flowers_held == 0:
+                return 'Robot has no flower to give'
+            if (x, y) != (self.princess_x, self.princess_y):
+                return f'Princess is not at ({x}, {y})'
+            self.flowers_delivered += self.flowers_held
+            self.flowers_held = 0
+        elif action == CLEAN:
+            if self.cell_at(x, y) != OBSTACLE:
+                return f'No obstacle to clean at ({x}, {y})'
+            self.cells[y * self.width + x] = EMPTY
+        else:
+            return f'Unknown action {action}'
+
+        self.orientation = direction
+        if self.is_complete:
+            self.status = WON
+        return None
+
+    def apply_named(self, action, direction, strict=False):
+        """apply() taking the wire names used by the API ('move', 'NORTH')"""
+        return self.apply(ACTION_CODES[action], DIRECTION_CODES[direction], strict)
+
+
+_cell_fragments = {}
+
+
+def _fragments(width, height):
+    """Pre-encoded cell JSON for every (index, type) on a board size"""
+    key = (width, height)
+    table = _cell_fragments.get(key)
+    if table is None:
+        table = [
+            tuple(
+                b'{"position":{"x":%d,"y":%d},"type":"%s"}' % (i % width, i // width, name.encode())
+                for name in CELL_TYPES
+            )
+            for i in range(width * height)
+        ]
+        _cell_fragments[key] = table
+    return table
+
+
+def encode_board(board):
+    """GameBoard JSON bytes, same shape as to_json() without going through json"""
+    table = _fragments(board.width, board.height)
+    cells = b','.join([table[i][code] for i, code in enumerate(board.cells)])
+    return b''.join((
+        b'{"width":%d,"height":%d,"cells":[' % (board.width, board.height),
+        cells,
+        b'],"robot":{"position":{"x":%d,"y":%d},"orientation":"%s","flowersHeld":%d},'
+        % (board.robot_x, board.robot_y, DIRECTIONS[board.orientation].encode(), board.flowers_held),
+        b'"princessPosition":{"x":%d,"y":%d},"totalFlowers":%d,"flowersDelivered":%d}'
+        % (board.princess_x, board.princess_y, board.total_flowers, board.flowers_delivered),
+    ))
+
+
+# Cell code -> CELL_CHARS byte, for bytes.translate
+_COMPACT_CELLS = CELL_CHARS.encode() + bytes(range(len(CELL_CHARS), 256))
+
+
+def encode_compact_board(board):
+    """Compact GameBoard JSON bytes, same as to_compact() dumped without spaces"""
+    return (
+        b'{"w":%d,"h":%d,"g":"%s","r":[%d,%d,"%s",%d],"p":[%d,%d],"t":%d,"d":%d}'
+        % (board.width, board.height, bytes(board.cells).translate(_COMPACT_CELLS),
+           board.robot_x, board.robot_y, DIRECTIONS[board.orientation].encode(), board.flowers_held,
+           board.princess_x, board.princess_y, board.total_flowers, board.flowers_delivered)
+    )
+
+
+def replay(board_json, actions):
+    """Yield the GameBoard JSON after each (action, direction) name pair
+
+    The first yielded board is the initial state, matching the shape of the
+    replay endpoint. Stops after the first invalid action.
+    """
+    board = Board.from_json(board_json)
+    yield board.to_json()
+    for action, direction in actions:
+        error = board.apply_named(action, direction)
+        yield board.to_json()
+        if error is not None:
+            return
+
+
+def validate_response(before_json, action, direction, after_json):
+    """Check a server's post-action board against the reference rules
+
+    Returns a list of mismatch descriptions (empty when they agree).
+    """
+    expected = Board.from_json(before_json)
+    expected.apply_named(action, direction)
+    actual = Board.from_json(after_json)
+    mismatches = []
+    for field in Board.__slots__:
+        if field == 'status':
+            continue
+        if getattr(expected, field) != getattr(actual, field):
+            mismatches.append(f'{field}: expected {getattr(expected, field)!r}, '
+                              f'got {getattr(actual, field)!r}')
+    return mismatches
+
+
+class BatchBoards:
+    """Many independent games stepped together with NumPy
+
+    Every game gets its own width/height; grids are padded to the largest
+    board in the batch. step() takes one action and one direction per game.
+    """
+
+    def __init__(self, boards):
+        if np is None:
+            raise RuntimeError('NumPy is required for batch mode: pip install numpy')
+        count = len(boards)
+        max_width = max(board.width for board in boards)
+        max_height = max(board.height for board in boards)
+
+        self.cells = np.full((count, max_height, max_width), OBSTACLE, dtype=np.uint8)
+        for i, board in enumerate(boards):
+            grid = np.frombuffer(bytes(board.cells), dtype=np.uint8)
+            self.cells[i, :board.height, :board.width] = grid.reshape(board.height, board.width)
+
+        def column(attr, dtype=np.int32):
+            return np.fromiter((getattr(board, attr) for board in boards), dtype=dtype, count=count)
+
+        self.width = column('width')
+        self.height = column('height')
+        self.robot_x = column('robot_x')
+        self.robot_y = column('robot_y')
+        self.orientation = column('orientation', np.uint8)
+        self.flowers_held = column('flowers_held')
+        self.princess_x = column('princess_x')
+        self.princess_y = column('princess_y')
+        self.total_flowers = column('total_flowers')
+        self.flowers_delivered = column('flowers_delivered')
+        self.status = column('status', np.uint8)
+        self._index = np.arange(count)
+        self._dx = np.array(DX, dtype=np.int32)
+        self._dy = np.array(DY, dtype=np.int32)
+
+    def __len__(self):
+        return len(self._index)
+
+    def step(self, actions, directions):
+        """Apply actions[i] in directions[i] to game i; returns the success mask"""
+        actions = np.asarray(actions)
+        directions = np.asarray(directions)
+        idx = self._index
+        playing = self.status == PLAYING
+
+        x = self.robot_x + self._dx[directions]
+        y = self.robot_y + self._dy[directions]
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        cx = np.clip(x, 0, self.cells.shape[2] - 1)
+        cy = np.clip(y, 0, self.cells.shape[1] - 1)
+        target = np.where(inside, self.cells[idx, cy, cx], 255)
+        at_princess = (x == self.princess_x) & (y == self.princess_y)
+        free = inside & (target == EMPTY) & ~at_princess
+        has_flowers = self.flowers_held > 0
+
+        move = playing & (actions == MOVE) & free
+        pick = playing & (actions == PICK_FLOWER) & (target == FLOWER) & \
+            (self.flowers_held < MAX_FLOWERS_HELD)
+        drop = playing & (actions == DROP_FLOWER) & has_flowers & free
+        give = playing & (actions == GIVE_FLOWER) & has_flowers & at_princess
+        clean = playing & (actions == CLEAN) & (target == OBSTACLE)
+        rotate = playing & (actions == ROTATE)
+        ok = rotate | move | pick | drop | give | clean
+
+        robot_cell = self.cells[idx, self.robot_y, self.robot_x] == ROBOT
+        carry = move & robot_cell
+        self.cells[idx[carry], self.robot_y[carry], self.robot_x[carry]] = EMPTY
+        self.cells[idx[carry], y[carry], x[carry]] = ROBOT
+        self.robot_x = np.where(move, x, self.robot_x)
+        self.robot_y = np.where(move, y, self.robot_y)
+
+        cleared = pick | clean
+        self.cells[idx[cleared], y[cleared], x[cleared]] = EMPTY
+        self.cells[idx[drop], y[drop], x[drop]] = FLOWER
+        self.flowers_held += pick.astype(np.int32) - drop.astype(np.int32)
+        self.flowers_delivered += np.where(give, self.flowers_held, 0)
+        self.flowers_held = np.where(give, 0, self.flowers_held)
+
+        self.orientation = np.where(ok, directions, self.orientation).astype(np.uint8)
+        won = ok & (self.flowers_delivered >= self.total_flowers)
+        self.status = np.where(won, WON, np.where(playing & ~ok, GAME_OVER, self.status)).astype(np.uint8)
+        return ok
+
+    def board(self, i):
+        """Materialize game i as a scalar Board"""
+        width = int(self.width[i])
+        height = int(self.height[i])
+        return Board(
+            width, height, bytearray(self.cells[i, :height, :width].tobytes()),
+            robot=(int(self.robot_x[i]), int(self.robot_y[i])),
+            orientation=int(self.orientation[i]),
+            flowers_held=int(self.flowers_held[i]),
+            princess=(int(self.princess_x[i]), int(self.princess_y[i])),
+            total_flowers=int(self.total_flowers[i]),
+            flowers_delivered=int(self.flowers_delivered[i]),
+            status=int(self.status[i]),
+        )
+
+
+def random_board(size, rng):
+    """Open board with a few flowers, for benchmarking the engine"""
+    board = Board(size, size, robot=(0, 0), princess=(size - 1, size - 1))
+    flowers = 0
+    for i in range(1, size * size - 1):
+        roll = rng.random()
+        if roll < 0.05:
+            board.cells[i] = FLOWER
+            flowers += 1
+        elif roll < 0.20:
+            board.cells[i] = OBSTACLE
+    board.total_flowers = max(flowers, 1)
+    return board
+
+
+# Relative frequency of each action in the benchmark, roughly what players
+# send: mostly moves, with picks, drops, gives and cleans in between
+ACTION_MIX = (2, 8, 2, 2, 1, 2)
+
+
+def benchmark(games, steps, size, seed):
+    """Step random games with a mix of actions, invalid ones included
+
+    An invalid action ends a game; finished games are restarted from their
+    initial board so every step keeps doing real work.
+    """
+    rng = random.Random(seed)
+    boards = [random_board(size, rng) for _ in range(games)]
+    plan = list(zip(
+        rng.choices(range(len(ACTIONS)), weights=ACTION_MIX, k=steps),
+        (rng.randrange(4) for _ in range(steps)),
+    ))
+
+    scalar = [board.copy() for board in boards[:min(games, 1000)]]
+    invalid = 0
+    start = time.perf_counter()
+    for initial, board in zip(boards, scalar):
+        for action, direction in plan:
+            if board.apply(action, direction) is not None:
+                invalid += 1
+            if board.status != PLAYING:
+                board = initial.copy()
+    elapsed = time.perf_counter() - start
+    total = len(scalar) * steps
+    print(f"   Scalar: {total / elapsed:,.0f} actions/s ({invalid / total:.0%} invalid)")
+
+    if np is None:
+        print("   Batch:  skipped (NumPy not installed)")
+        return
+    initial = BatchBoards(boards)
+    batch = BatchBoards(boards)
+    np_rng = np.random.default_rng(seed)
+    weights = np.array(ACTION_MIX) / sum(ACTION_MIX)
+    invalid = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        ok = batch.step(np_rng.choice(len(ACTIONS), games, p=weights), np_rng.integers(0, 4, games))
+        invalid += games - int(ok.sum())
+        done = batch.status != PLAYING
+        for name, column in vars(initial).items():
+            if not name.startswith('_'):
+                getattr(batch, name)[done] = column[done]
+    elapsed = time.perf_counter() - start
+    total = games * steps
+    print(f"   Batch:  {total / elapsed:,.0f} actions/s ({games} games, {invalid / total:.0%} invalid)")
+
+
+def main():
+    """Benchmark the reference engine"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--size', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("🚀 Benchmarking reference engine...")
+    benchmark(args.games, args.steps, args.size, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Test Fixture Corpus
+Write realistic boards, games, replays and rule cases under test/fixtures/
+
+Fixtures are derived from a seed only (ids and timestamps included), so the
+same seed always produces byte-identical files. Every fixture is written in
+the verbose API encoding (docs/API.md) and in the compact encoding
+(Board.to_compact). A manifest records the seed and a hash per file; fixtures
+whose files still match are not regenerated.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from robot_flower_boards import generate_board
+from robot_flower_engine import ACTIONS, DIRECTIONS, PLAYING, STATUSES
+
+FIXTURES_DIR = 'test/fixtures'
+MANIFEST = 'manifest.json'
+# Bump when the fixture layout or encodings change, to force regeneration
+FIXTURE_VERSION = 2
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# name -> (kind, board size, actions)
+FIXTURES = {
+    'boards/small': ('board', 3, 0),
+    'boards/medium': ('board', 10, 0),
+    'boards/large': ('board', 25, 0),
+    'boards/max': ('board', 50, 0),
+    'games/long_game': ('game', 50, 500),
+    'replays/long_replay': ('replay', 10, 500),
+    'rules/invalid_action': ('rule', 10, 40),
+}
+
+
+def _timestamp(seconds):
+    return (EPOCH + timedelta(seconds=seconds)).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def random_walk(board, steps, rng):
+    """Up to `steps` valid (action, direction) codes that keep the game going
+
+    Returns the plan and the board after each action.
+    """
+    candidates = [(a, d) for a in range(len(ACTIONS)) for d in range(len(DIRECTIONS))]
+    plan, boards = [], []
+    for _ in range(steps):
+        for action, direction in rng.sample(candidates, len(candidates)):
+            trial = board.copy()
+            if trial.apply(action, direction) is None and trial.status == PLAYING:
+                break
+        else:
+            break
+        board = trial
+        plan.append((action, direction))
+        boards.append(board)
+    return plan, boards
+
+
+def build_fixture(name, seed):
+    """(verbose, compact) JSON-ready objects for one fixture"""
+    kind, size, steps = FIXTURES[name]
+    rng = random.Random(f'{seed}/{name}')
+    board = generate_board(size, rng)
+    if kind == 'board':
+        return board.to_json(), board.to_compact()
+
+    plan, boards = random_walk(board, steps, rng)
+    if kind == 'replay':
+        frames = [board] + boards
+        return [b.to_json() for b in frames], [b.to_compact() for b in frames]
+
+    final = boards[-1] if boards else board
+    actions = [
+        (ACTIONS[action], DIRECTIONS[direction], _timestamp(60 + i), None)
+        for i, (action, direction) in enumerate(plan)
+    ]
+    game_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    if kind == 'game':
+        return _game(name, game_id, final, actions)
+
+    # rule: the game before an invalid action, the action, and the game after
+    # it (board untouched, failed action recorded, status gameOver)
+    candidates = [(a, d) for a in range(len(ACTIONS)) for d in range(len(DIRECTIONS))]
+    for action, direction in rng.sample(candidates, len(candidates)):
+        after = final.copy()
+        error = after.apply(action, direction)
+        if error is not None:
+            break
+    else:
+        raise ValueError(f'{name}: no invalid action on the final board')
+    failed = (ACTIONS[action], DIRECTIONS[direction], _timestamp(60 + len(actions)), error)
+    before = _game(name, game_id, final, actions)
+    expected = _game(name, game_id, after, actions + [failed])
+    move = {'type': failed[0], 'direction': failed[1]}
+    return ({'game': before[0], 'action': move, 'expected': expected[0]},
+            {'game': before[1], 'action': move, 'expected': expected[1]})
+
+
+def _game(name, game_id, board, actions):
+    """(verbose, compact) Game objects for a board and its (type, direction, timestamp, error) history"""
+    game = {
+        'id': game_id,
+        'name': f'Fixture {name}',
+        'status': STATUSES[board.status],
+        'createdAt': _timestamp(0),
+        'updatedAt': actions[-1][2] if actions else None,
+    }
+    verbose = dict(game, board=board.to_json(), actions=[
+        {'type': a, 'direction': d, 'timestamp': t, 'success': e is None, 'errorMessage': e}
+        for a, d, t, e in actions
+    ])
+    compact = dict(game, board=board.to_compact(), actions=[list(action) for action in actions])
+    return verbose, compact
+
+
+def write_fixture(job):
+    """Worker: write both encodings of one fixture; returns {path: sha256}"""
+    root, name, seed = job
+    hashes = {}
+    for suffix, data in zip(('.json', '.compact.json'), build_fixture(name, seed)):
+        path = f'{name}{suffix}'
+        body = json.dumps(data, separators=(',', ':')).encode()
+        full_path = os.path.join(root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as f:
+            f.write(body)
+        hashes[path] = hashlib.sha256(body).hexdigest()
+    return name, hashes
+
+
+def _cached(root, manifest, name):
+    """True if the manifest lists this fixture and its files are unchanged"""
+    entry = manifest.get('fixtures', {}).get(name)
+    if not entry:
+        return False
+    for path, digest in entry.items():
+        try:
+            with open(os.path.join(root, path), 'rb') as f:
+                if hashlib.sha256(f.read()).hexdigest() != digest:
+                    return False
+        except OSError:
+            return False
+    return True
+
+
+def generate_corpus(project, seed, workers=None, force=False):
+    """Write missing or stale fixtures; returns (written, cached) names"""
+    root = os.path.join(project, FIXTURES_DIR)
+    manifest_path = os.path.join(root, MANIFEST)
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if force or manifest.get('seed') != seed or manifest.get('version') != FIXTURE_VERSION:
+        manifest = {}
+
+    cached = [name for name in FIXTURES if _cached(root, manifest, name)]
+    jobs = [(root, name, seed) for name in FIXTURES if name not in cached]
+    fixtures = {name: manifest['fixtures'][name] for name in cached}
+    if jobs:
+        with multiprocessing.Pool(min(workers or os.cpu_count(), len(jobs))) as pool:
+            fixtures.update(pool.map(write_fixture, jobs))
+    os.makedirs(root, exist_ok=True)
+    with open(manifest_path, 'w') as f:
+        json.dump({'version': FIXTURE_VERSION, 'seed': seed,
+                   'fixtures': dict(sorted(fixtures.items()))}, f, indent=2)
+        f.write('\n')
+    return [name for _, name, _ in jobs], cached
+
+
+def main():
+    """Generate the fixture corpus into a generated project"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--project', default='robot-flower-princess-front',
+                        help='generated Flutter project root')
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help='ignore the cache')
+    args = parser.parse_args()
+
+    print(f"🚀 Generating test fixtures in {os.path.join(args.project, FIXTURES_DIR)}...")
+    written, cached = generate_corpus(args.project, args.seed, args.workers, args.force)
+    for name in written:
+        print(f"   ✅ {name}")
+    if cached:
+        print(f"   ⏭️  {len(cached)} fixtures unchanged for seed {args.seed}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Load Generator
+asyncio client replaying the front-end request pattern against a backend
+
+Every simulated player follows the path GameRemoteDataSourceImpl takes
+through the API: list games, create one, open it, play a run of actions
+(picked with the reference engine so the game stays alive), then optionally
+auto-play and watch the replay. Players arrive open-loop at a fixed rate, or
+a fixed number of them loop back-to-back (closed loop). Latency is measured
+from the moment a request is due, including the wait for a pooled
+connection, so a saturated backend shows up in the tail instead of being
+hidden by slower arrivals.
+
+With --conditional the pool behaves like the app's HTTP cache: it keeps the
+ETag of every GET and revalidates with If-None-Match, and the report shows
+how many responses came back 304 and how many body bytes were transferred.
+--compact asks for the compact wire encoding (ApiClient(compactWire: true))
+and --compress for gzip bodies; bytes are counted as sent on the wire.
+
+--retries, --hedge-ms, --breaker and --timeout-ms apply the app's
+TransportPolicy, so its effect on the latency tail can be measured against
+serve --fault-* on the stand-in backend. Latency then spans every attempt.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import time
+from urllib.parse import urlsplit
+
+from robot_flower_engine import ACTIONS, DIRECTIONS, PLAYING, Board
+
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional speed-up
+    uvloop = None
+
+# WireFormat.compactType in the generated app
+COMPACT_TYPE = b'application/vnd.rfp.compact+json'
+ENDPOINTS = ('list', 'create', 'get', 'action', 'actions', 'autoplay', 'replay')
+CANDIDATES = [(a, d) for a in range(len(ACTIONS)) for d in range(len(DIRECTIONS))]
+# Players mostly walk around; rotations are rare because moves turn the robot
+WEIGHTS = [0.2 if ACTIONS[a] == 'rotate' else 3.0 if ACTIONS[a] == 'move' else 1.0
+           for a, _ in CANDIDATES]
+
+
+# Retried and counted as circuit breaker failures, like in RetryInterceptor
+RETRY_STATUSES = (502, 503, 504)
+
+
+class HttpError(Exception):
+    """Transport-level failure (closed connection, malformed response)"""
+
+
+class Policy:
+    """Client transport policy; mirrors TransportPolicy in the generated app
+
+    GETs that fail in transit or with RETRY_STATUSES are retried up to
+    retries times after a full-jitter backoff: uniform up to
+    min(max_delay_ms, base_delay_ms * 2**attempt). After breaker failures
+    in a row (no response or 5xx) requests fail at once for open_ms, then a
+    single probe goes out. With hedge_ms, a game GET that has not answered
+    in time is sent again on another connection and the first answer wins.
+    timeout_ms bounds each attempt.
+    """
+
+    def __init__(self, retries=0, base_delay_ms=200.0, max_delay_ms=2000.0,
+                 breaker=0, open_ms=10_000.0, hedge_ms=None, timeout_ms=None):
+        self.retries = retries
+        self.base_delay_ms = base_delay_ms
+        self.max_delay_ms = max_delay_ms
+        self.breaker = breaker
+        self.open_ms = open_ms
+        self.hedge_ms = hedge_ms
+        self.timeout_ms = timeout_ms
+
+    def backoff(self, attempt, rng):
+        return rng.uniform(0, min(self.max_delay_ms, self.base_delay_ms * 2 ** attempt)) / 1000
+
+    def to_json(self):
+        return dict(vars(self))
+
+
+# -- Histogram --
+
+class Histogram:
+    """Log-linear latency histogram in microseconds, about 3% relative error
+
+    Values are bucketed by their bit length and their top five mantissa bits,
+    so recording is O(1) and memory stays small however long the run is.
+    """
+
+    SUB_BITS = 5
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.errors = 0
+        self.max = 0
+        self.total = 0
+
+    def record(self, micros):
+        micros = max(1, int(micros))
+        shift = max(0, micros.bit_length() - self.SUB_BITS - 1)
+        key = (shift, micros >> shift)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += micros
+        if micros > self.max:
+            self.max = micros
+
+    def merge(self, other):
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += other.count
+        self.errors += other.errors
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, fraction):
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for shift, top in sorted(self.buckets, key=lambda k: k[1] << k[0]):
+            seen += self.buckets[(shift, top)]
+            if seen >= rank:
+                # Upper edge of the bucket, never above the observed maximum
+                return min(((top + 1) << shift) - 1, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'meanMs': self.total / self.count / 1000 if self.count else 0,
+            'p50Ms': self.percentile(0.50) / 1000,
+            'p99Ms': self.percentile(0.99) / 1000,
+            'p999Ms': self.percentile(0.999) / 1000,
+            'maxMs': self.max / 1000,
+        }
+
+
+# -- HTTP client --
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, reader, writer, host, accept=b'application/json', accept_encoding=None):
+        self.reader = reader
+        self.writer = writer
+        self.host = host
+        self.accept = accept
+        self.accept_encoding = accept_encoding
+
+    async def request(self, method, path, body=None, etag=None):
+        """(status, decoded body, keep-alive, ETag, body bytes on the wire)"""
+        if body is None:
+            payload = b''
+        elif isinstance(body, bytes):
+            payload = body  # sent as-is, e.g. deliberately malformed JSON
+        else:
+            payload = json.dumps(body).encode()
+        self.writer.write(
+            b'%s %s HTTP/1.1\r\nHost: %s\r\nAccept: %s\r\n%s%s'
+            b'Content-Type: application/json\r\nContent-Length: %d\r\n\r\n%s'
+            % (method.encode(), path.encode(), self.host.encode(), self.accept,
+               b'Accept-Encoding: %s\r\n' % self.accept_encoding if self.accept_encoding else b'',
+               b'If-None-Match: %s\r\n' % etag.encode() if etag else b'', len(payload), payload)
+        )
+        try:
+            head = await self.reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            raise HttpError('Connection closed by server') from e
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            status = int(lines[0].split(' ', 2)[1])
+        except (IndexError, ValueError) as e:
+            raise HttpError(f'Malformed status line: {lines[0]!r}') from e
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if status == 304:
+            data = b''
+        elif headers.get('transfer-encoding', '').lower() == 'chunked':
+            data = await self._read_chunked()
+        else:
+            data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        keep_alive = headers.get('connection', '').lower() != 'close'
+        wire_bytes = len(data)
+        if headers.get('content-encoding', '').lower() == 'gzip':
+            data = gzip.decompress(data)
+        return status, data, keep_alive, headers.get('etag'), wire_bytes
+
+    async def _read_chunked(self):
+        parts = []
+        while True:
+            size = int((await self.reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+            if size == 0:
+                await self.reader.readuntil(b'\r\n')
+                return b''.join(parts)
+            parts.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+    def close(self):
+        self.writer.close()
+
+
+class Pool:
+    """Bounded pool of keep-alive connections to one host
+
+    Requests queue for a free connection once `size` are open, the way a
+    browser caps connections per origin. With conditional, GET bodies are
+    kept per path and revalidated; a 304 is returned as a 200 with the
+    stored body, as the app's cache interceptor does. Retries, hedging and
+    circuit breaking follow policy.
+    """
+
+    def __init__(self, base_url, size, conditional=False, compact=False, compress=False,
+                 policy=None, seed=0):
+        url = urlsplit(base_url)
+        self.host = url.hostname or '127.0.0.1'
+        self.port = url.port or 80
+        self.prefix = url.path.rstrip('/')
+        self.authority = url.netloc or self.host
+        self.idle = []
+        self.slots = asyncio.Semaphore(size)
+        self.stats = {name: Histogram() for name in ENDPOINTS}
+        self.conditional = conditional
+        self.accept = b'%s, application/json;q=0.9' % COMPACT_TYPE if compact else b'application/json'
+        self.accept_encoding = b'gzip' if compress else None
+        self.cached = {}
+        self.not_modified = 0
+        self.bytes_received = 0
+        self.policy = policy or Policy()
+        self.rng = random.Random(seed)
+        self.retries = 0
+        self.hedged = 0
+        self.short_circuited = 0
+        self.failures = 0
+        self.open_until = None
+        self.probing = False
+
+    async def call(self, endpoint, method, path, body=None):
+        """Timed request; returns (status, body) or (None, None) on failure"""
+        histogram = self.stats[endpoint]
+        cached = self.cached.get(path) if self.conditional and method == 'GET' else None
+        etag = cached[0] if cached else None
+        hedged = self.policy.hedge_ms is not None and endpoint == 'get'
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            if self._circuit_open():
+                self.short_circuited += 1
+                histogram.errors += 1
+                return None, None
+            try:
+                if hedged:
+                    result = await self._hedged(method, path, body, etag)
+                else:
+                    result = await self._timed_attempt(method, path, body, etag)
+            except (OSError, EOFError, HttpError, asyncio.TimeoutError):
+                result = None
+            self._circuit_result(result is None or result[0] >= 500)
+            if (method == 'GET' and attempt < self.policy.retries
+                    and (result is None or result[0] in RETRY_STATUSES)):
+                await asyncio.sleep(self.policy.backoff(attempt, self.rng))
+                attempt += 1
+                self.retries += 1
+                continue
+            break
+        if result is None:
+            histogram.errors += 1
+            return None, None
+        status, data, etag, wire_bytes = result
+        histogram.record((time.perf_counter() - started) * 1_000_000)
+        self.bytes_received += wire_bytes
+        if status == 304 and cached:
+            self.not_modified += 1
+            status, data = 200, cached[1]
+        elif self.conditional and method == 'GET' and status == 200 and etag:
+            self.cached[path] = (etag, data)
+        if status >= 400:
+            histogram.errors += 1
+        return status, data
+
+    async def _attempt(self, method, path, body, etag):
+        """One request on a pooled connection: (status, body, ETag, wire bytes)"""
+        async with self.slots:
+            connection = self.idle.pop() if self.idle else None
+            try:
+                if connection is None:
+                    reader, writer = await asyncio.open_connection(self.host, self.port)
+                    connection = Connection(reader, writer, self.authority,
+                                            self.accept, self.accept_encoding)
+                status, data, keep_alive, etag, wire_bytes = await connection.request(
+                    method, self.prefix + path, body, etag)
+            except BaseException:
+                # Includes timeouts and lost hedges: the answer may still come
+                if connection is not None:
+                    connection.close()
+                raise
+            if keep_alive:
+                self.idle.append(connection)
+            else:
+                connection.close()
+        return status, data, etag, wire_bytes
+
+    async def _timed_attempt(self, method, path, body, etag):
+        if self.policy.timeout_ms is None:
+            return await self._attempt(method, path, body, etag)
+        return await asyncio.wait_for(self._attempt(method, path, body, etag),
+                                      self.policy.timeout_ms / 1000)
+
+    async def _hedged(self, method, path, body, etag):
+        """First answer of the request and, if it is late, a second copy"""
+        first = asyncio.ensure_future(self._timed_attempt(method, path, body, etag))
+        done, _ = await asyncio.wait({first}, timeout=self.policy.hedge_ms / 1000)
+        if done:
+            return first.result()
+        self.hedged += 1
+        pending = {first, asyncio.ensure_future(self._timed_attempt(method, path, body, etag))}
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    return task.result()
+                error = task.exception()
+        raise error
+
+    def _circuit_open(self):
+        if self.open_until is None:
+            return False
+        if time.perf_counter() < self.open_until or self.probing:
+            return True
+        self.probing = True
+        return False
+
+    def _circuit_result(self, failed):
+        if not self.policy.breaker:
+            return
+        if not failed:
+            self.failures, self.open_until, self.probing = 0, None, False
+            return
+        self.failures += 1
+        if self.probing or self.failures >= self.policy.breaker:
+            self.open_until = time.perf_counter() + self.policy.open_ms / 1000
+            self.probing = False
+
+    def close(self):
+        for connection in self.idle:
+            connection.close()
+        self.idle.clear()
+
+
+# -- Players --
+
+class Profile:
+    """What one simulated player does; mirrors a session in the app"""
+
+    def __init__(self, board_size=10, actions=30, think_ms=500.0,
+                 autoplay=0.3, replay=0.5, batch=1):
+        self.board_size = board_size
+        self.actions = actions
+        # Actions per request; above 1 the player is a scripted bot using
+        # POST /api/games/{id}/actions like CurrentGameNotifier's queue
+        self.batch = batch
+        self.think_ms = think_ms
+        self.autoplay = autoplay
+        self.replay = replay
+
+
+def next_action(board, rng):
+    """Random action that the engine accepts, or None when stuck"""
+    order = rng.choices(CANDIDATES, WEIGHTS, k=8) + rng.sample(CANDIDATES, len(CANDIDATES))
+    for action, direction in order:
+        trial = board.copy()
+        if trial.apply(action, direction) is None:
+            return action, direction, trial
+    return None
+
+
+async def think(profile, rng):
+    if profile.think_ms > 0:
+        await asyncio.sleep(rng.expovariate(1000.0 / profile.think_ms))
+
+
+async def play_session(pool, profile, rng, player):
+    """One player's visit: list, create, open, play, maybe autoplay and replay"""
+    # HomePage loads the first page of game summaries
+    await pool.call('list', 'GET', '/api/games?view=summary&limit=20')
+    await think(profile, rng)
+    status, data = await pool.call('create', 'POST', '/api/games',
+                                   {'name': f'load-{player}', 'boardSize': profile.board_size})
+    if status not in (200, 201):
+        return
+    game = json.loads(data)
+    game_id = game['id']
+    decode = Board.from_compact if 'g' in game['board'] else Board.from_json
+    board = decode(game['board'], game.get('status', 'playing'))
+    await pool.call('get', 'GET', f'/api/games/{game_id}')
+
+    remaining = rng.randint(1, 2 * profile.actions)
+    while remaining > 0 and board.status == PLAYING:
+        batch = []
+        while len(batch) < min(profile.batch, remaining) and board.status == PLAYING:
+            choice = next_action(board, rng)
+            if choice is None:
+                break
+            action, direction, board = choice
+            batch.append({'action': ACTIONS[action], 'direction': DIRECTIONS[direction]})
+        if not batch:
+            break
+        remaining -= len(batch)
+        await think(profile, rng)
+        if len(batch) == 1:
+            status, _ = await pool.call('action', 'POST', f'/api/games/{game_id}/action', batch[0])
+        else:
+            status, _ = await pool.call('actions', 'POST', f'/api/games/{game_id}/actions',
+                                        {'actions': batch})
+        if status != 200:
+            break
+
+    if board.status == PLAYING and rng.random() < profile.autoplay:
+        await think(profile, rng)
+        await pool.call('autoplay', 'POST', f'/api/games/{game_id}/autoplay')
+    if rng.random() < profile.replay:
+        await think(profile, rng)
+        await pool.call('replay', 'GET', f'/api/games/{game_id}/replay')
+
+
+async def open_loop(pool, profile, rate, duration, seed, max_players):
+    """Players arrive as a Poisson process, whatever the backend's pace"""
+    rng = random.Random(seed)
+    tasks = set()
+    dropped = 0
+    deadline = time.perf_counter() + duration
+    due = time.perf_counter()
+    player = 0
+    while True:
+        due += rng.expovariate(rate)
+        if due >= deadline:
+            break
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(tasks) >= max_players:
+            dropped += 1
+            continue
+        player += 1
+        task = asyncio.ensure_future(
+            play_session(pool, profile, random.Random(rng.random()), player))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+    return player, dropped
+
+
+async def closed_loop(pool, profile, players, duration, seed):
+    """A fixed population of players, each starting a new session when done"""
+    deadline = time.perf_counter() + duration
+    sessions = [0]
+
+    async def player_loop(index):
+        rng = random.Random(seed * 1_000_003 + index)
+        while time.perf_counter() < deadline:
+            sessions[0] += 1
+            await play_session(pool, profile, rng, f'{index}-{sessions[0]}')
+
+    await asyncio.gather(*[player_loop(i) for i in range(players)])
+    return sessions[0], 0
+
+
+async def run_load(base_url, profile, connections, duration, seed=0,
+                   rate=None, players=100, max_players=10_000, conditional=False,
+                   compact=False, compress=False, policy=None):
+    """Drive the backend and return the report as a JSON-ready dict"""
+    pool = Pool(base_url, connections, conditional, compact, compress, policy, seed)
+    started = time.perf_counter()
+    try:
+        if rate:
+            sessions, dropped = await open_loop(pool, profile, rate, duration, seed, max_players)
+        else:
+            sessions, dropped = await closed_loop(pool, profile, players, duration, seed)
+    finally:
+        pool.close()
+    elapsed = time.perf_counter() - started
+    total = Histogram()
+    for histogram in pool.stats.values():
+        total.merge(histogram)
+    report = {
+        'target': base_url,
+        'mode': 'open' if rate else 'closed',
+        'seconds': elapsed,
+        'sessions': sessions,
+        'droppedArrivals': dropped,
+        'requestsPerSecond': total.count / elapsed,
+        'conditional': conditional,
+        'compact': compact,
+        'compress': compress,
+        'notModified': pool.not_modified,
+        'bodyBytesReceived': pool.bytes_received,
+        'policy': pool.policy.to_json(),
+        'retries': pool.retries,
+        'hedged': pool.hedged,
+        'shortCircuited': pool.short_circuited,
+        'endpoints': {name: h.summary() for name, h in pool.stats.items() if h.count or h.errors},
+        'total': total.summary(),
+    }
+    return report
+
+
+def print_report(report):
+    print(f"\n📊 {report['sessions']:,} sessions in {report['seconds']:.1f}s "
+          f"({report['mode']} loop) against {report['target']}")
+    if report['droppedArrivals']:
+        print(f"   ⚠️  {report['droppedArrivals']:,} arrivals dropped at the player cap")
+    print(f"   {'endpoint':<10}{'count':>9}{'errors':>8}{'req/s':>10}"
+          f"{'p50 ms':>9}{'p99 ms':>9}{'p999 ms':>9}{'max ms':>9}")
+    rows = list(report['endpoints'].items()) + [('total', report['total'])]
+    for name, s in rows:
+        print(f"   {name:<10}{s['count']:>9,}{s['errors']:>8,}{s['count'] / report['seconds']:>10,.0f}"
+              f"{s['p50Ms']:>9.2f}{s['p99Ms']:>9.2f}{s['p999Ms']:>9.2f}{s['maxMs']:>9.2f}")
+    revalidated = f", {report['notModified']:,} served as 304" if report['conditional'] else ''
+    print(f"   📦 {report['bodyBytesReceived'] / 1024 / 1024:,.1f} MiB of response bodies{revalidated}")
+    if report['retries'] or report['hedged'] or report['shortCircuited']:
+        print(f"   🛡️  {report['retries']:,} retries, {report['hedged']:,} hedged GETs, "
+              f"{report['shortCircuited']:,} failed fast on an open circuit")
+
+
+def main():
+    """Replay front-end traffic against a backend and report latencies"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8080', help='backend base URL')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds of arrivals')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='open loop: new players per second (default: closed loop)')
+    parser.add_argument('--players', type=int, default=100, help='closed loop: concurrent players')
+    parser.add_argument('--max-players', type=int, default=10_000,
+                        help='open loop: cap on concurrent players')
+    parser.add_argument('--connections', type=int, default=256, help='connection pool size')
+    parser.add_argument('--think-ms', type=float, default=500.0, help='mean think time between steps')
+    parser.add_argument('--actions', type=int, default=30, help='mean actions per game')
+    parser.add_argument('--batch', type=int, default=1,
+                        help='actions per request (batch endpoint above 1)')
+    parser.add_argument('--size', type=int, default=10, help='board size of created games')
+    parser.add_argument('--autoplay', type=float, default=0.3, help='share of sessions using autoplay')
+    parser.add_argument('--replay', type=float, default=0.5, help='share of sessions watching the replay')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--conditional', action='store_true',
+                        help='revalidate GETs with If-None-Match, like the app\'s HTTP cache')
+    parser.add_argument('--compact', action='store_true', help='ask for the compact wire encoding')
+    parser.add_argument('--compress', action='store_true', help='ask for gzip response bodies')
+    parser.add_argument('--retries', type=int, default=0,
+                        help='retry failed GETs this many times with jittered backoff')
+    parser.add_argument('--hedge-ms', type=float, default=None,
+                        help='send a second game GET when the first is this late')
+    parser.add_argument('--breaker', type=int, default=0,
+                        help='open the circuit after this many failures in a row')
+    parser.add_argument('--timeout-ms', type=float, default=None, help='give up on an attempt after this')
+    parser.add_argument('--json', metavar='FILE', help='also write the report as JSON')
+    args = parser.parse_args()
+
+    profile = Profile(args.size, args.actions, args.think_ms, args.autoplay, args.replay, args.batch)
+    mode = f"{args.rate:g} players/s" if args.rate else f"{args.players} players"
+    print(f"🚀 Load against {args.url}: {mode} for {args.duration:g}s, "
+          f"{args.connections} connections...")
+    if uvloop is not None:
+        uvloop.install()
+    report = asyncio.run(run_load(
+        args.url, profile, args.connections, args.duration, args.seed,
+        args.rate, args.players, args.max_players, args.conditional,
+        args.compact, args.compress,
+        Policy(args.retries, breaker=args.breaker, hedge_ms=args.hedge_ms, timeout_ms=args.timeout_ms),
+    ))
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -60,6 +60,7 @@ dependencies:
   # HTTP & Network
   http: ^1.1.2
   dio: ^5.4.0
+  web_socket_channel: ^2.4.0
 
   # Functional Programming
   dartz: ^0.10.1
@@ -321,7 +322,46 @@ jobs:
     'API_BASE_URL',
     defaultValue: 'http://localhost:8080',
   );
-  static const Duration apiTimeout = Duration(seconds: 30);
+  // A dead host is given up on quickly; a slow answer gets longer. Reads
+  // are retried, so they get a shorter budget than writes, which are not
+  // (a non-streamed autoplay answers only once the whole game is played).
+  static const Duration connectTimeout = Duration(seconds: 3);
+  static const Duration receiveTimeout = Duration(seconds: 10);
+  static const Duration writeReceiveTimeout = Duration(seconds: 30);
+  static const bool compactWire = bool.fromEnvironment('COMPACT_WIRE');
+  // GET /api/games without view=summary returns this many by default
+  static const int gamesListLimit = 10;
+  static const int gamesPageSize = 20;
+  static const int maxGamesPageSize = 100;
+  static const int maxActionBatch = 50;
+
+  // Game streams: the open game follows the server's WebSocket events
+  // (--dart-define=GAME_STREAMING=false falls back to request/response).
+  // A closed stream is reopened after the delay, which doubles (up to 16x)
+  // while reconnects keep failing.
+  static const bool gameStreaming = bool.fromEnvironment(
+    'GAME_STREAMING',
+    defaultValue: true,
+  );
+  static const Duration streamReconnectDelay = Duration(seconds: 2);
+  // A streamed autoplay answers once the last step has been played
+  static const Duration streamedAutoPlayTimeout = Duration(minutes: 5);
+
+  // HTTP logging: off, error, info or debug; info and debug lines are
+  // sampled. Release builds (dart.vm.product, i.e. kReleaseMode) strip the
+  // interceptor unless built with --dart-define=STRIP_HTTP_LOGGING=false.
+  static const String httpLogLevel = String.fromEnvironment(
+    'HTTP_LOG_LEVEL',
+    defaultValue: 'info',
+  );
+  static const int httpLogSamplePercent = int.fromEnvironment(
+    'HTTP_LOG_SAMPLE_PERCENT',
+    defaultValue: 100,
+  );
+  static const bool stripHttpLogging = bool.fromEnvironment(
+    'STRIP_HTTP_LOGGING',
+    defaultValue: bool.fromEnvironment('dart.vm.product'),
+  );
 
   // Game Configuration
   static const int minBoardSize = 3;
@@ -345,7 +385,10 @@ jobs:
   static const String games = '/api/games';
   static String game(String id) => '/api/games/$id';
   static String gameAction(String id) => '/api/games/$id/action';
-  static String autoPlay(String id) => '/api/games/$id/autoplay';
+  static String gameActions(String id) => '/api/games/$id/actions';
+  static String autoPlay(String id, {bool stream = false}) =>
+      '/api/games/$id/autoplay${stream ? '?stream=true' : ''}';
+  static String gameStream(String id) => '/api/games/$id/stream';
   static String replay(String id) => '/api/games/$id/replay';
 }
 ''',
@@ -571,53 +614,896 @@ class Logger {
 }
 ''',
 
-        'lib/core/network/api_client.dart': '''import 'package:dio/dio.dart';
+        'lib/core/network/http_cache_interceptor.dart': '''import 'dart:collection';
+
+import 'package:dio/dio.dart';
+
+class _CachedResponse {
+  const _CachedResponse({
+    required this.data,
+    required this.headers,
+    this.etag,
+    this.lastModified,
+  });
+
+  final dynamic data;
+  final Headers headers;
+  final String? etag;
+  final String? lastModified;
+}
+
+/// Conditional GET requests backed by a local response cache.
+///
+/// The ETag and Last-Modified of every successful GET are stored per URL,
+/// together with the response body. The next GET of that URL sends
+/// If-None-Match / If-Modified-Since, and a 304 is answered from the stored
+/// body, so callers always see a 200 with the full data.
+class HttpCacheInterceptor extends Interceptor {
+  HttpCacheInterceptor({this.maxEntries = 100});
+
+  /// Set in Response.extra when the body came from the cache.
+  static const fromCacheKey = 'httpCache.fromCache';
+  static const _entryKey = 'httpCache.entry';
+
+  final int maxEntries;
+  final LinkedHashMap<String, _CachedResponse> _entries = LinkedHashMap();
+
+  int revalidations = 0;
+  int notModified = 0;
+
+  int get length => _entries.length;
+
+  // Representations differ per Accept header, so it is part of the key
+  static String _key(RequestOptions options) =>
+      '${options.headers['Accept'] ?? ''} ${options.uri}';
+
+  void clear() => _entries.clear();
+
+  @override
+  void onRequest(RequestOptions options, RequestInterceptorHandler handler) {
+    final cached = options.method == 'GET' ? _entries[_key(options)] : null;
+    if (cached != null) {
+      if (cached.etag != null) {
+        options.headers['If-None-Match'] = cached.etag;
+      }
+      if (cached.lastModified != null) {
+        options.headers['If-Modified-Since'] = cached.lastModified;
+      }
+      final validateStatus = options.validateStatus;
+      options.validateStatus = (status) => status == 304 || validateStatus(status);
+      options.extra[_entryKey] = cached;
+      revalidations++;
+    }
+    handler.next(options);
+  }
+
+  @override
+  void onResponse(Response response, ResponseInterceptorHandler handler) {
+    final options = response.requestOptions;
+    if (options.method != 'GET') return handler.next(response);
+    final key = _key(options);
+
+    final cached = options.extra[_entryKey] as _CachedResponse?;
+    if (response.statusCode == 304 && cached != null) {
+      notModified++;
+      _store(key, cached);
+      return handler.next(Response(
+        requestOptions: options,
+        data: cached.data,
+        statusCode: 200,
+        headers: cached.headers,
+        extra: {fromCacheKey: true},
+      ));
+    }
+
+    final etag = response.headers.value('etag');
+    final lastModified = response.headers.value('last-modified');
+    if (response.statusCode == 200 && (etag != null || lastModified != null)) {
+      _store(
+        key,
+        _CachedResponse(
+          data: response.data,
+          headers: response.headers,
+          etag: etag,
+          lastModified: lastModified,
+        ),
+      );
+    } else {
+      _entries.remove(key);
+    }
+    handler.next(response);
+  }
+
+  void _store(String key, _CachedResponse entry) {
+    _entries.remove(key);
+    _entries[key] = entry;
+    while (_entries.length > maxEntries) {
+      _entries.remove(_entries.keys.first);
+    }
+  }
+}
+''',
+
+        'lib/core/network/single_flight.dart': '''import 'dart:async';
+
+/// Shares one in-flight future between identical concurrent calls.
+///
+/// While a call for [key] is running, further calls with the same key get
+/// its future instead of starting another; once it completes, the next call
+/// starts afresh. Results are not cached beyond that.
+class SingleFlight {
+  final Map<String, Future<Object?>> _inFlight = {};
+
+  int started = 0;
+  int coalesced = 0;
+
+  bool isInFlight(String key) => _inFlight.containsKey(key);
+
+  Future<T> run<T>(String key, Future<T> Function() task) {
+    final running = _inFlight[key];
+    if (running != null) {
+      coalesced++;
+      return running.then((value) => value as T);
+    }
+    started++;
+    final future = task();
+    _inFlight[key] = future;
+    future.then<void>(
+      (_) => _inFlight.remove(key),
+      onError: (Object _) => _inFlight.remove(key),
+    );
+    return future;
+  }
+}
+
+/// Runs tasks one at a time per key, in call order.
+///
+/// Tasks for different keys run concurrently. A failing task does not stop
+/// the ones queued behind it.
+class KeyedSerialQueue {
+  final Map<String, Future<void>> _tails = {};
+
+  bool isBusy(String key) => _tails.containsKey(key);
+
+  Future<T> run<T>(String key, Future<T> Function() task) {
+    final previous = _tails[key] ?? Future<void>.value();
+    final result = previous.then((_) => task());
+    final tail = result.then<void>((_) {}, onError: (Object _) {});
+    _tails[key] = tail;
+    tail.then((_) {
+      if (identical(_tails[key], tail)) _tails.remove(key);
+    });
+    return result;
+  }
+}
+''',
+
+        'lib/core/network/logging_interceptor.dart': '''import 'dart:math';
+
+import 'package:dio/dio.dart';
+import 'package:flutter/foundation.dart';
+
+/// How much HTTP traffic [LoggingInterceptor] reports, from least to most.
+enum HttpLogLevel {
+  off,
+  error,
+  info,
+  debug;
+
+  static HttpLogLevel fromName(String name) {
+    for (final level in HttpLogLevel.values) {
+      if (level.name == name) return level;
+    }
+    throw FormatException('Unknown HttpLogLevel: $name');
+  }
+}
+
+typedef HttpLogSink = void Function(String message, Object? error);
+
+/// Logs HTTP requests at a level fixed when it is built.
+///
+/// error logs every failed request; info adds one line per completed
+/// request with its duration; debug also logs each request as it is sent.
+/// Info and debug lines are sampled per request with [sampleRate], so a
+/// request and its response are logged together or not at all. Nothing is
+/// formatted for requests that are not logged.
+///
+/// Unlike Logger, the default sink also prints in release builds, for
+/// builds that keep the interceptor (see AppConstants.stripHttpLogging).
+class LoggingInterceptor extends Interceptor {
+  LoggingInterceptor({
+    HttpLogLevel level = HttpLogLevel.info,
+    double sampleRate = 1.0,
+    Random? random,
+    HttpLogSink? sink,
+  })  : _logErrors = level.index >= HttpLogLevel.error.index,
+        _logResponses = level.index >= HttpLogLevel.info.index,
+        _logRequests = level.index >= HttpLogLevel.debug.index,
+        _sampleAll = sampleRate >= 1,
+        _sampleRate = sampleRate,
+        _random = random ?? Random(),
+        _sink = sink ?? _print;
+
+  static const _stopwatchKey = 'httpLog.stopwatch';
+
+  final bool _logErrors;
+  final bool _logResponses;
+  final bool _logRequests;
+  final bool _sampleAll;
+  final double _sampleRate;
+  final Random _random;
+  final HttpLogSink _sink;
+
+  static void _print(String message, Object? error) {
+    debugPrint(error == null ? '[HTTP] $message' : '[HTTP] $message: $error');
+  }
+
+  @override
+  void onRequest(RequestOptions options, RequestInterceptorHandler handler) {
+    if (_logResponses && (_sampleAll || _random.nextDouble() < _sampleRate)) {
+      options.extra[_stopwatchKey] = Stopwatch()..start();
+      if (_logRequests) {
+        _sink('--> ${options.method} ${options.uri}', null);
+      }
+    }
+    handler.next(options);
+  }
+
+  @override
+  void onResponse(Response response, ResponseInterceptorHandler handler) {
+    final options = response.requestOptions;
+    final stopwatch = options.extra[_stopwatchKey] as Stopwatch?;
+    if (stopwatch != null) {
+      _sink(
+        '<-- ${response.statusCode} ${options.method} ${options.path} '
+        '(${stopwatch.elapsedMilliseconds}ms)',
+        null,
+      );
+    }
+    handler.next(response);
+  }
+
+  @override
+  void onError(DioException err, ErrorInterceptorHandler handler) {
+    if (_logErrors) {
+      final options = err.requestOptions;
+      _sink(
+        '<-- ${err.response?.statusCode ?? err.type.name} '
+        '${options.method} ${options.path}',
+        err.message ?? err.error,
+      );
+    }
+    handler.next(err);
+  }
+}
+''',
+
+        'lib/core/network/network_metrics.dart': '''import 'dart:convert';
+import 'dart:math' as math;
+import 'dart:typed_data';
+
+import 'package:dio/dio.dart';
+import 'package:flutter/foundation.dart';
+import 'http_cache_interceptor.dart';
+
+const _stopwatchKey = 'metrics.stopwatch';
+const _networkKey = 'metrics.networkMicros';
+const _parseKey = 'metrics.parseMicros';
+const _receivedKey = 'metrics.responseBytes';
+const _sentKey = 'metrics.requestBytes';
+
+/// Value counts in fixed buckets, so percentiles need no stored samples.
+class Histogram {
+  Histogram(this.bounds) : _counts = List.filled(bounds.length + 1, 0);
+
+  /// Bucket bounds for durations in milliseconds.
+  static const latencyBounds = <double>[
+    0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000,
+  ];
+
+  /// Bucket bounds for payload sizes in bytes.
+  static const sizeBounds = <double>[
+    256, 1024, 4096, 16384, 65536, 262144, 1048576,
+  ];
+
+  /// Inclusive upper bounds; one more bucket holds larger values.
+  final List<double> bounds;
+  final List<int> _counts;
+
+  int count = 0;
+  double sum = 0;
+  double max = 0;
+
+  double get mean => count == 0 ? 0 : sum / count;
+
+  void record(double value) {
+    var bucket = 0;
+    while (bucket < bounds.length && value > bounds[bucket]) {
+      bucket++;
+    }
+    _counts[bucket]++;
+    count++;
+    sum += value;
+    max = math.max(max, value);
+  }
+
+  /// Upper bound of the bucket holding quantile [q] (0 to 1), at most [max].
+  double percentile(double q) {
+    if (count == 0) return 0;
+    final rank = math.max(1, (q * count).ceil());
+    var seen = 0;
+    for (var i = 0; i < bounds.length; i++) {
+      seen += _counts[i];
+      if (seen >= rank) return math.min(bounds[i], max);
+    }
+    return max;
+  }
+
+  static String _label(double bound) =>
+      bound == bound.roundToDouble() ? '${bound.round()}' : '$bound';
+
+  Map<String, Object> toJson() => {
+        'count': count,
+        'mean': mean,
+        'p50': percentile(0.5),
+        'p95': percentile(0.95),
+        'p99': percentile(0.99),
+        'max': max,
+        'buckets': {
+          for (var i = 0; i < _counts.length; i++)
+            if (_counts[i] > 0)
+              (i < bounds.length
+                  ? '<=${_label(bounds[i])}'
+                  : '>${_label(bounds.last)}'): _counts[i],
+        },
+      };
+}
+
+/// Client-side measurements of one endpoint (method and path template).
+///
+/// network runs from sending the request to the last body byte, parse is
+/// the JSON decoding and build the conversion of that JSON into models, all
+/// in milliseconds. Bodies answered from the HTTP cache count as notModified.
+class EndpointMetrics {
+  int requests = 0;
+  int errors = 0;
+  int notModified = 0;
+  int requestBytes = 0;
+  final Histogram network = Histogram(Histogram.latencyBounds);
+  final Histogram parse = Histogram(Histogram.latencyBounds);
+  final Histogram build = Histogram(Histogram.latencyBounds);
+  final Histogram responseBytes = Histogram(Histogram.sizeBounds);
+
+  double get errorRate => requests == 0 ? 0 : errors / requests;
+
+  Map<String, Object> toJson() => {
+        'requests': requests,
+        'errors': errors,
+        'errorRate': errorRate,
+        'notModified': notModified,
+        'requestBytes': requestBytes,
+        'networkMs': network.toJson(),
+        'parseMs': parse.toJson(),
+        'buildMs': build.toJson(),
+        'responseBytes': responseBytes.toJson(),
+      };
+}
+
+/// Per-endpoint latency, size and error measurements of the API client.
+class NetworkMetrics extends ChangeNotifier {
+  final Map<String, EndpointMetrics> endpoints = {};
+
+  static final _gameId = RegExp('/games/[^/]+');
+
+  /// 'GET /api/games/{id}' for any game id.
+  static String endpointOf(RequestOptions options) =>
+      '${options.method} ${options.uri.path.replaceAll(_gameId, '/games/{id}')}';
+
+  EndpointMetrics _endpoint(RequestOptions options) =>
+      endpoints.putIfAbsent(endpointOf(options), EndpointMetrics.new);
+
+  /// Records a finished request from what [MetricsTransformer] and
+  /// [MetricsInterceptor] stored in its options.
+  void record(
+    RequestOptions options, {
+    required bool failed,
+    bool notModified = false,
+  }) {
+    final endpoint = _endpoint(options)..requests++;
+    if (failed) endpoint.errors++;
+    if (notModified) endpoint.notModified++;
+
+    final extra = options.extra;
+    final network = extra[_networkKey] as int? ??
+        (extra[_stopwatchKey] as Stopwatch?)?.elapsedMicroseconds;
+    if (network != null) endpoint.network.record(network / 1000);
+    final parse = extra[_parseKey] as int?;
+    if (parse != null) endpoint.parse.record(parse / 1000);
+    final received = extra[_receivedKey] as int?;
+    if (received != null) endpoint.responseBytes.record(received.toDouble());
+    endpoint.requestBytes += extra[_sentKey] as int? ?? 0;
+    notifyListeners();
+  }
+
+  /// Records the time spent turning a response body into models.
+  void recordBuild(RequestOptions options, Duration elapsed) {
+    _endpoint(options).build.record(elapsed.inMicroseconds / 1000);
+    notifyListeners();
+  }
+
+  void reset() {
+    endpoints.clear();
+    notifyListeners();
+  }
+
+  Map<String, Object> toJson() => {
+        'generatedAt': DateTime.now().toUtc().toIso8601String(),
+        'endpoints': {
+          for (final key in endpoints.keys.toList()..sort())
+            key: endpoints[key]!.toJson(),
+        },
+      };
+
+  String exportJson() => const JsonEncoder.withIndent('  ').convert(toJson());
+}
+
+/// Times requests for [NetworkMetrics]; add it after the other interceptors.
+class MetricsInterceptor extends Interceptor {
+  MetricsInterceptor(this.metrics);
+
+  final NetworkMetrics metrics;
+
+  @override
+  void onRequest(RequestOptions options, RequestInterceptorHandler handler) {
+    options.extra[_stopwatchKey] = Stopwatch()..start();
+    handler.next(options);
+  }
+
+  @override
+  void onResponse(Response response, ResponseInterceptorHandler handler) {
+    metrics.record(
+      response.requestOptions,
+      failed: false,
+      notModified: response.extra[HttpCacheInterceptor.fromCacheKey] == true,
+    );
+    handler.next(response);
+  }
+
+  @override
+  void onError(DioException err, ErrorInterceptorHandler handler) {
+    // Hedged requests that lost are cancelled, not failed
+    if (err.type != DioExceptionType.cancel) {
+      metrics.record(err.requestOptions, failed: true);
+    }
+    handler.next(err);
+  }
+}
+
+/// Dio's default transformer, with the body read in full before it is
+/// decoded, so network time (until the last byte) and JSON parse time are
+/// measured apart. Sizes are of the decompressed body.
+class MetricsTransformer extends BackgroundTransformer {
+  @override
+  Future<String> transformRequest(RequestOptions options) async {
+    final body = await super.transformRequest(options);
+    // JSON bodies are ASCII, so characters are bytes
+    options.extra[_sentKey] = body.length;
+    return body;
+  }
+
+  @override
+  Future<dynamic> transformResponse(
+    RequestOptions options,
+    ResponseBody responseBody,
+  ) async {
+    final stopwatch = options.extra[_stopwatchKey] as Stopwatch?;
+    if (stopwatch == null || options.responseType == ResponseType.stream) {
+      return super.transformResponse(options, responseBody);
+    }
+    final bytes = BytesBuilder(copy: false);
+    await for (final chunk in responseBody.stream) {
+      bytes.add(chunk);
+    }
+    options.extra[_networkKey] = stopwatch.elapsedMicroseconds;
+    options.extra[_receivedKey] = bytes.length;
+
+    final parse = Stopwatch()..start();
+    final data = await super.transformResponse(
+      options,
+      ResponseBody.fromBytes(
+        bytes.takeBytes(),
+        responseBody.statusCode,
+        statusMessage: responseBody.statusMessage,
+        isRedirect: responseBody.isRedirect,
+        redirects: responseBody.redirects,
+        headers: responseBody.headers,
+      ),
+    );
+    options.extra[_parseKey] = parse.elapsedMicroseconds;
+    return data;
+  }
+}
+''',
+
+        'lib/core/network/transport_policy.dart': '''import 'dart:async';
+import 'dart:math';
+
+import 'package:dio/dio.dart';
 import '../constants/app_constants.dart';
-import '../utils/logger.dart';
 
+/// How the API client rides out slow or failing backends.
+///
+/// Connects give up after [connectTimeout] instead of the whole receive
+/// budget, which is [receiveTimeout] for reads and [writeReceiveTimeout]
+/// for writes. GETs that fail in transit or with 502/503/504 are retried up to
+/// [maxRetries] times after a full-jitter backoff. After [failureThreshold]
+/// consecutive failures a host's circuit opens and requests fail at once
+/// for [openDuration]. Reads on the critical path are hedged after
+/// [hedgeDelay]. A zero count or a null delay turns that part off.
+class TransportPolicy {
+  const TransportPolicy({
+    this.connectTimeout = AppConstants.connectTimeout,
+    this.receiveTimeout = AppConstants.receiveTimeout,
+    this.writeReceiveTimeout = AppConstants.writeReceiveTimeout,
+    this.maxRetries = 2,
+    this.retryBaseDelay = const Duration(milliseconds: 200),
+    this.retryMaxDelay = const Duration(seconds: 2),
+    this.failureThreshold = 5,
+    this.openDuration = const Duration(seconds: 10),
+    this.hedgeDelay = const Duration(milliseconds: 300),
+  });
+
+  /// Timeouts only: no retries, circuit breaking or hedging.
+  static const none = TransportPolicy(
+    maxRetries: 0,
+    failureThreshold: 0,
+    hedgeDelay: null,
+  );
+
+  final Duration connectTimeout;
+  final Duration receiveTimeout;
+  final Duration writeReceiveTimeout;
+  final int maxRetries;
+  final Duration retryBaseDelay;
+  final Duration retryMaxDelay;
+  final int failureThreshold;
+  final Duration openDuration;
+  final Duration? hedgeDelay;
+
+  /// Delay before retry [attempt] (0-based): uniform between zero and
+  /// min(retryMaxDelay, retryBaseDelay * 2^attempt), so clients that failed
+  /// together do not come back together.
+  Duration backoff(int attempt, Random random) {
+    final ceiling = min(
+      retryMaxDelay.inMilliseconds,
+      retryBaseDelay.inMilliseconds << min(attempt, 20),
+    );
+    return Duration(milliseconds: random.nextInt(ceiling + 1));
+  }
+}
+
+/// Set as the error of requests refused by an open [CircuitBreaker].
+class CircuitOpenException implements Exception {
+  const CircuitOpenException(this.host, this.retryAfter);
+
+  final String host;
+  final Duration retryAfter;
+
+  @override
+  String toString() =>
+      'Server $host is unavailable, retrying in ${retryAfter.inSeconds + 1}s';
+}
+
+class _Circuit {
+  int failures = 0;
+  DateTime? openUntil;
+  bool probing = false;
+}
+
+/// Per-host circuit breaker.
+///
+/// Failures are requests without a response or with a 5xx. Once a host has
+/// [TransportPolicy.failureThreshold] of them in a row its circuit opens:
+/// requests are rejected without going out until
+/// [TransportPolicy.openDuration] has passed. Then one probe request is let
+/// through; its success closes the circuit, its failure opens it again.
+class CircuitBreaker extends Interceptor {
+  CircuitBreaker(this.policy, {DateTime Function()? clock})
+      : _clock = clock ?? DateTime.now;
+
+  final TransportPolicy policy;
+  final DateTime Function() _clock;
+  final Map<String, _Circuit> _circuits = {};
+
+  int shortCircuited = 0;
+
+  bool isOpen(String host) => _circuits[host]?.openUntil != null;
+
+  @override
+  void onRequest(RequestOptions options, RequestInterceptorHandler handler) {
+    final host = options.uri.host;
+    final circuit = _circuits[host];
+    final openUntil = circuit?.openUntil;
+    if (circuit != null && openUntil != null) {
+      final now = _clock();
+      if (now.isBefore(openUntil) || circuit.probing) {
+        shortCircuited++;
+        final error = CircuitOpenException(
+          host,
+          circuit.probing ? policy.openDuration : openUntil.difference(now),
+        );
+        return handler.reject(DioException(
+          requestOptions: options,
+          type: DioExceptionType.connectionError,
+          error: error,
+          message: error.toString(),
+        ));
+      }
+      circuit.probing = true;
+    }
+    handler.next(options);
+  }
+
+  @override
+  void onResponse(Response response, ResponseInterceptorHandler handler) {
+    _circuits.remove(response.requestOptions.uri.host);
+    handler.next(response);
+  }
+
+  @override
+  void onError(DioException err, ErrorInterceptorHandler handler) {
+    final host = err.requestOptions.uri.host;
+    final status = err.response?.statusCode;
+    if (err.type == DioExceptionType.cancel) {
+      // A cancelled probe proves nothing; let the next request probe
+      _circuits[host]?.probing = false;
+    } else if (status != null && status < 500) {
+      _circuits.remove(host);
+    } else {
+      final circuit = _circuits.putIfAbsent(host, _Circuit.new)..failures++;
+      if (circuit.probing || circuit.failures >= policy.failureThreshold) {
+        circuit
+          ..openUntil = _clock().add(policy.openDuration)
+          ..probing = false;
+      }
+    }
+    handler.next(err);
+  }
+}
+
+/// Retries GETs that failed in transit or with 502/503/504.
+///
+/// Add it last: failed attempts still pass the other interceptors, and the
+/// retry goes through all of them again.
+class RetryInterceptor extends Interceptor {
+  RetryInterceptor(
+    this._dio,
+    this.policy, {
+    Random? random,
+    Future<void> Function(Duration delay)? sleep,
+  })  : _random = random ?? Random(),
+        _sleep = sleep ?? Future<void>.delayed;
+
+  static const _attemptKey = 'retry.attempt';
+
+  final Dio _dio;
+  final TransportPolicy policy;
+  final Random _random;
+  final Future<void> Function(Duration delay) _sleep;
+
+  int retries = 0;
+
+  static bool isRetryable(DioException err) {
+    if (err.requestOptions.method != 'GET') return false;
+    switch (err.type) {
+      case DioExceptionType.connectionTimeout:
+      case DioExceptionType.receiveTimeout:
+      case DioExceptionType.connectionError:
+        return err.error is! CircuitOpenException;
+      case DioExceptionType.badResponse:
+        return const {502, 503, 504}.contains(err.response?.statusCode);
+      default:
+        return false;
+    }
+  }
+
+  @override
+  Future<void> onError(DioException err, ErrorInterceptorHandler handler) async {
+    final options = err.requestOptions;
+    final attempt = options.extra[_attemptKey] as int? ?? 0;
+    if (attempt >= policy.maxRetries ||
+        !isRetryable(err) ||
+        (options.cancelToken?.isCancelled ?? false)) {
+      return handler.next(err);
+    }
+    await _sleep(policy.backoff(attempt, _random));
+    options.extra[_attemptKey] = attempt + 1;
+    retries++;
+    try {
+      handler.resolve(await _dio.fetch(options));
+    } on DioException catch (e) {
+      handler.next(e);
+    }
+  }
+}
+
+/// Runs [request], and once more if it has not completed after [delay].
+///
+/// The first response wins and the other request is cancelled. An error
+/// is returned once no request is left running; a failure before [delay]
+/// is not hedged, as retries already happened inside [request].
+Future<T> hedge<T>(
+  Future<T> Function(CancelToken cancelToken) request,
+  Duration delay, {
+  void Function()? onHedge,
+}) {
+  final result = Completer<T>();
+  final running = <CancelToken>[];
+  Timer? timer;
+
+  void start() {
+    final token = CancelToken();
+    running.add(token);
+    request(token).then((value) {
+      if (result.isCompleted) return;
+      timer?.cancel();
+      for (final other in running) {
+        if (other != token) other.cancel('Hedged request lost');
+      }
+      result.complete(value);
+    }, onError: (Object error, StackTrace stack) {
+      running.remove(token);
+      if (result.isCompleted || running.isNotEmpty) return;
+      timer?.cancel();
+      result.completeError(error, stack);
+    });
+  }
+
+  start();
+  timer = Timer(delay, () {
+    onHedge?.call();
+    start();
+  });
+  return result.future;
+}
+''',
+
+        'lib/core/network/wire_format.dart': '''/// Media types the API can answer with.
+///
+/// The compact encoding carries the same games and replays with short
+/// board keys (w, h, g, r, p, t, d), the grid as one string with a
+/// [CellType.compactChars] character per cell, and actions as
+/// [type, direction, timestamp, errorMessage] arrays. Summaries and errors
+/// are the same in both.
+class WireFormat {
+  static const jsonType = 'application/json';
+  static const compactType = 'application/vnd.rfp.compact+json';
+
+  /// Accept header value; a server without the compact encoding falls back
+  /// to plain JSON.
+  static String accept({required bool compact}) =>
+      compact ? '$compactType, $jsonType;q=0.9' : jsonType;
+}
+''',
+
+        'lib/core/network/api_client.dart': '''import 'package:dio/dio.dart';
+import 'package:flutter/foundation.dart';
+import 'package:web_socket_channel/web_socket_channel.dart';
+import '../constants/app_constants.dart';
+import 'http_cache_interceptor.dart';
+import 'logging_interceptor.dart';
+import 'network_metrics.dart';
+import 'transport_policy.dart';
+import 'wire_format.dart';
+
+/// HTTP client of the app.
+///
+/// With [compactWire] the compact encoding is requested through Accept
+/// (see [WireFormat]); GameModel and GameBoard decode either encoding.
+/// Native builds ask for gzip bodies, which dart:io decodes before Dio sees
+/// them. On the web the browser negotiates gzip or br itself and does not
+/// let the app set Accept-Encoding.
+///
+/// Every request is measured into [metrics]: network time, JSON parse time
+/// and body size per endpoint.
+///
+/// Timeouts, GET retries and the per-host circuit breaker follow [policy];
+/// [getHedged] adds hedging for reads the user is waiting on.
+///
+/// [openStream] opens a WebSocket on the same host; none of the above
+/// applies to it.
 class ApiClient {
   late final Dio _dio;
-
-  ApiClient() {
+  final HttpCacheInterceptor httpCache;
+  final NetworkMetrics metrics;
+  final TransportPolicy policy;
+  final bool compactWire;
+  late final CircuitBreaker breaker = CircuitBreaker(policy);
+  late final RetryInterceptor retry = RetryInterceptor(_dio, policy);
+
+  int hedged = 0;
+
+  ApiClient({
+    HttpCacheInterceptor? httpCache,
+    NetworkMetrics? metrics,
+    this.policy = const TransportPolicy(),
+    this.compactWire = AppConstants.compactWire,
+  })  : httpCache = httpCache ?? HttpCacheInterceptor(),
+        metrics = metrics ?? NetworkMetrics() {
     _dio = Dio(
       BaseOptions(
         baseUrl: AppConstants.baseUrl,
-        connectTimeout: AppConstants.apiTimeout,
-        receiveTimeout: AppConstants.apiTimeout,
+        connectTimeout: policy.connectTimeout,
+        receiveTimeout: policy.receiveTimeout,
         headers: {
-          'Content-Type': 'application/json',
-          'Accept': 'application/json',
+          'Content-Type': WireFormat.jsonType,
+          'Accept': WireFormat.accept(compact: compactWire),
+          if (!kIsWeb) 'Accept-Encoding': 'gzip',
         },
       ),
-    );
-
-    _dio.interceptors.add(
-      InterceptorsWrapper(
-        onRequest: (options, handler) {
-          Logger.info('Request: ${options.method} ${options.path}');
-          return handler.next(options);
-        },
-        onResponse: (response, handler) {
-          Logger.info('Response: ${response.statusCode} ${response.requestOptions.path}');
-          return handler.next(response);
-        },
-        onError: (error, handler) {
-          Logger.error(
-            'Error: ${error.response?.statusCode} ${error.requestOptions.path}',
-            error: error,
-          );
-          return handler.next(error);
-        },
-      ),
-    );
+    )..transformer = MetricsTransformer();
+
+    // A const condition: release builds compile the interceptor out
+    if (!AppConstants.stripHttpLogging) {
+      final level = HttpLogLevel.fromName(AppConstants.httpLogLevel);
+      if (level != HttpLogLevel.off) {
+        _dio.interceptors.add(LoggingInterceptor(
+          level: level,
+          sampleRate: AppConstants.httpLogSamplePercent / 100,
+        ));
+      }
+    }
+    if (policy.failureThreshold > 0) {
+      _dio.interceptors.add(breaker);
+    }
+    _dio.interceptors
+      ..add(httpCache)
+      ..add(MetricsInterceptor(this.metrics));
+    if (policy.maxRetries > 0) {
+      _dio.interceptors.add(retry);
+    }
   }
 
   Future<Response> get(String path, {Map<String, dynamic>? queryParameters}) async {
     return await _dio.get(path, queryParameters: queryParameters);
   }
 
-  Future<Response> post(String path, {dynamic data}) async {
-    return await _dio.post(path, data: data);
+  /// GET sent a second time when the first has not answered after
+  /// [TransportPolicy.hedgeDelay]; the first answer wins.
+  Future<Response> getHedged(String path) {
+    final delay = policy.hedgeDelay;
+    if (delay == null) return get(path);
+    return hedge(
+      (cancelToken) => _dio.get(path, cancelToken: cancelToken),
+      delay,
+      onHedge: () => hedged++,
+    );
+  }
+
+  Future<Response> post(
+    String path, {
+    dynamic data,
+    Duration? receiveTimeout,
+  }) async {
+    return await _dio.post(
+      path,
+      data: data,
+      options: Options(
+        receiveTimeout: receiveTimeout ?? policy.writeReceiveTimeout,
+      ),
+    );
+  }
+
+  /// WebSocket on [path] of the API host (ws for http, wss for https).
+  /// Browsers cannot set headers on a WebSocket, so the compact encoding is
+  /// asked for in the query.
+  WebSocketChannel openStream(String path) {
+    final base = Uri.parse(_dio.options.baseUrl);
+    return WebSocketChannel.connect(base.replace(
+      scheme: base.scheme == 'https' ? 'wss' : 'ws',
+      path: path,
+      queryParameters: compactWire ? const {'compact': 'true'} : null,
+    ));
   }
 
   Future<Response> put(String path, {dynamic data}) async {
@@ -628,6 +1514,598 @@ class ApiClient {
     return await _dio.delete(path);
   }
 }
+''',
+
+        'test/unit/core/network/http_cache_interceptor_test.dart': '''import 'dart:convert';
+import 'dart:typed_data';
+
+import 'package:dio/dio.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/core/network/http_cache_interceptor.dart';
+
+/// Serves one JSON body with an ETag and honours If-None-Match.
+class _EtagAdapter implements HttpClientAdapter {
+  String body = '[]';
+  String etag = '"v1"';
+  final List<String?> sentTags = [];
+
+  @override
+  Future<ResponseBody> fetch(
+    RequestOptions options,
+    Stream<Uint8List>? requestStream,
+    Future<void>? cancelFuture,
+  ) async {
+    final tag = options.headers['If-None-Match'] as String?;
+    sentTags.add(tag);
+    if (tag == etag) {
+      return ResponseBody.fromString('', 304, headers: {
+        'etag': [etag],
+      });
+    }
+    return ResponseBody.fromString(body, 200, headers: {
+      'etag': [etag],
+      Headers.contentTypeHeader: [Headers.jsonContentType],
+    });
+  }
+
+  @override
+  void close({bool force = false}) {}
+}
+
+void main() {
+  late Dio dio;
+  late _EtagAdapter adapter;
+  late HttpCacheInterceptor cache;
+
+  setUp(() {
+    adapter = _EtagAdapter();
+    cache = HttpCacheInterceptor(maxEntries: 2);
+    dio = Dio()
+      ..httpClientAdapter = adapter
+      ..interceptors.add(cache);
+  });
+
+  group('HttpCacheInterceptor', () {
+    test('should revalidate with the stored ETag', () async {
+      adapter.body = jsonEncode([{'id': '1'}]);
+
+      await dio.get('http://test/api/games');
+      final response = await dio.get('http://test/api/games');
+
+      expect(adapter.sentTags, [null, '"v1"']);
+      expect(response.statusCode, 200);
+      expect(response.data, [{'id': '1'}]);
+      expect(response.extra[HttpCacheInterceptor.fromCacheKey], true);
+      expect(cache.notModified, 1);
+    });
+
+    test('should replace the stored body when the resource changed', () async {
+      await dio.get('http://test/api/games');
+      adapter
+        ..body = jsonEncode([{'id': '2'}])
+        ..etag = '"v2"';
+
+      final changed = await dio.get('http://test/api/games');
+      final revalidated = await dio.get('http://test/api/games');
+
+      expect(changed.data, [{'id': '2'}]);
+      expect(revalidated.data, [{'id': '2'}]);
+      expect(adapter.sentTags, [null, '"v1"', '"v2"']);
+    });
+
+    test('should not send validators for other methods', () async {
+      await dio.get('http://test/api/games');
+      await dio.post('http://test/api/games', data: {'name': 'x'});
+
+      expect(adapter.sentTags.last, isNull);
+    });
+
+    test('should evict the least recently used URL', () async {
+      await dio.get('http://test/a');
+      await dio.get('http://test/b');
+      await dio.get('http://test/c');
+      await dio.get('http://test/a');
+
+      expect(adapter.sentTags.last, isNull);
+      expect(cache.length, 2);
+    });
+  });
+}
+''',
+
+        'test/unit/core/network/logging_interceptor_test.dart': '''import 'dart:math';
+import 'dart:typed_data';
+
+import 'package:dio/dio.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/core/network/logging_interceptor.dart';
+
+/// Answers every request with [status].
+class _StatusAdapter implements HttpClientAdapter {
+  int status = 200;
+
+  @override
+  Future<ResponseBody> fetch(
+    RequestOptions options,
+    Stream<Uint8List>? requestStream,
+    Future<void>? cancelFuture,
+  ) async {
+    return ResponseBody.fromString('{}', status, headers: {
+      Headers.contentTypeHeader: [Headers.jsonContentType],
+    });
+  }
+
+  @override
+  void close({bool force = false}) {}
+}
+
+/// Random whose nextDouble walks through [values].
+class _FixedRandom implements Random {
+  _FixedRandom(this.values);
+
+  final List<double> values;
+  int _next = 0;
+
+  @override
+  double nextDouble() => values[_next++ % values.length];
+
+  @override
+  int nextInt(int max) => 0;
+
+  @override
+  bool nextBool() => false;
+}
+
+void main() {
+  late _StatusAdapter adapter;
+  late List<String> lines;
+  late List<Object?> errors;
+
+  setUp(() {
+    adapter = _StatusAdapter();
+    lines = [];
+    errors = [];
+  });
+
+  Dio dioWith(LoggingInterceptor logging) => Dio()
+    ..httpClientAdapter = adapter
+    ..interceptors.add(logging);
+
+  void sink(String message, Object? error) {
+    lines.add(message);
+    errors.add(error);
+  }
+
+  group('LoggingInterceptor', () {
+    test('should log one line per completed request at info', () async {
+      final dio = dioWith(LoggingInterceptor(sink: sink));
+
+      await dio.get('http://test/api/games');
+
+      expect(lines, hasLength(1));
+      expect(lines.single, startsWith('<-- 200 GET /api/games ('));
+    });
+
+    test('should also log the request as it is sent at debug', () async {
+      final dio = dioWith(
+        LoggingInterceptor(level: HttpLogLevel.debug, sink: sink),
+      );
+
+      await dio.post('http://test/api/games');
+
+      expect(lines.first, '--> POST http://test/api/games');
+      expect(lines, hasLength(2));
+    });
+
+    test('should log nothing when off', () async {
+      final dio = dioWith(
+        LoggingInterceptor(level: HttpLogLevel.off, sink: sink),
+      );
+      adapter.status = 500;
+
+      await expectLater(dio.get('http://test/api/games'), throwsA(isA<DioException>()));
+
+      expect(lines, isEmpty);
+    });
+
+    test('should only log failures at error', () async {
+      final dio = dioWith(
+        LoggingInterceptor(level: HttpLogLevel.error, sink: sink),
+      );
+
+      await dio.get('http://test/api/games');
+      adapter.status = 404;
+      await expectLater(dio.get('http://test/api/games/x'), throwsA(isA<DioException>()));
+
+      expect(lines, ['<-- 404 GET /api/games/x']);
+      expect(errors.single, isNotNull);
+    });
+
+    test('should sample requests but keep every failure', () async {
+      final dio = dioWith(LoggingInterceptor(
+        sampleRate: 0.5,
+        random: _FixedRandom([0.9, 0.1, 0.9]),
+        sink: sink,
+      ));
+
+      await dio.get('http://test/a');
+      await dio.get('http://test/b');
+      adapter.status = 500;
+      await expectLater(dio.get('http://test/c'), throwsA(isA<DioException>()));
+
+      expect(lines, hasLength(2));
+      expect(lines[0], startsWith('<-- 200 GET /b'));
+      expect(lines[1], '<-- 500 GET /c');
+    });
+  });
+
+  group('HttpLogLevel', () {
+    test('should parse level names', () {
+      expect(HttpLogLevel.fromName('debug'), HttpLogLevel.debug);
+      expect(() => HttpLogLevel.fromName('verbose'), throwsFormatException);
+    });
+  });
+}
+''',
+
+        'test/unit/core/network/network_metrics_test.dart': '''import 'dart:convert';
+import 'dart:typed_data';
+
+import 'package:dio/dio.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/core/network/network_metrics.dart';
+
+/// Answers every request with a JSON body and [status].
+class _JsonAdapter implements HttpClientAdapter {
+  int status = 200;
+  String body = jsonEncode({'id': '1', 'name': 'Game 1'});
+
+  @override
+  Future<ResponseBody> fetch(
+    RequestOptions options,
+    Stream<Uint8List>? requestStream,
+    Future<void>? cancelFuture,
+  ) async {
+    return ResponseBody.fromString(body, status, headers: {
+      Headers.contentTypeHeader: [Headers.jsonContentType],
+    });
+  }
+
+  @override
+  void close({bool force = false}) {}
+}
+
+void main() {
+  group('Histogram', () {
+    test('should estimate percentiles from the buckets', () {
+      final histogram = Histogram(Histogram.latencyBounds);
+      for (final ms in [0.05, 3, 4, 4, 7, 40, 40, 60, 90, 1500]) {
+        histogram.record(ms.toDouble());
+      }
+
+      expect(histogram.count, 10);
+      expect(histogram.percentile(0.5), 10);
+      expect(histogram.percentile(0.9), 100);
+      expect(histogram.percentile(1), 1500);
+      expect(histogram.max, 1500);
+    });
+
+    test('should report only the buckets that were hit', () {
+      final histogram = Histogram(Histogram.sizeBounds)
+        ..record(100)
+        ..record(2000000);
+
+      expect(histogram.toJson()['buckets'], {'<=256': 1, '>1048576': 1});
+    });
+  });
+
+  group('NetworkMetrics', () {
+    late _JsonAdapter adapter;
+    late NetworkMetrics metrics;
+    late Dio dio;
+
+    setUp(() {
+      adapter = _JsonAdapter();
+      metrics = NetworkMetrics();
+      dio = Dio()
+        ..httpClientAdapter = adapter
+        ..transformer = MetricsTransformer()
+        ..interceptors.add(MetricsInterceptor(metrics));
+    });
+
+    test('should group games under one endpoint template', () async {
+      await dio.get('http://test/api/games/1');
+      await dio.get('http://test/api/games/2');
+      await dio.post('http://test/api/games/2/action', data: {'action': 'move'});
+
+      expect(metrics.endpoints.keys, unorderedEquals([
+        'GET /api/games/{id}',
+        'POST /api/games/{id}/action',
+      ]));
+      expect(metrics.endpoints['GET /api/games/{id}']!.requests, 2);
+    });
+
+    test('should split network and parse time and record sizes', () async {
+      final response = await dio.get('http://test/api/games/1');
+      final endpoint = metrics.endpoints['GET /api/games/{id}']!;
+
+      expect(response.data, {'id': '1', 'name': 'Game 1'});
+      expect(endpoint.network.count, 1);
+      expect(endpoint.parse.count, 1);
+      expect(endpoint.responseBytes.sum, adapter.body.length);
+    });
+
+    test('should count failed requests in the error rate', () async {
+      await dio.get('http://test/api/games/1');
+      adapter.status = 404;
+      await expectLater(dio.get('http://test/api/games/x'), throwsA(isA<DioException>()));
+
+      expect(metrics.endpoints['GET /api/games/{id}']!.errorRate, 0.5);
+    });
+
+    test('should export the report as JSON', () async {
+      await dio.get('http://test/api/games/1');
+      metrics.recordBuild(
+        RequestOptions(path: 'http://test/api/games/1'),
+        const Duration(microseconds: 1500),
+      );
+
+      final report = jsonDecode(metrics.exportJson()) as Map<String, dynamic>;
+      final endpoint = report['endpoints']['GET /api/games/{id}'];
+
+      expect(endpoint['requests'], 1);
+      expect(endpoint['buildMs']['max'], 1.5);
+    });
+  });
+}
+''',
+
+        'test/unit/core/network/transport_policy_test.dart': '''import 'dart:async';
+import 'dart:math';
+import 'dart:typed_data';
+
+import 'package:dio/dio.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/core/network/transport_policy.dart';
+
+/// Answers with the next status of [statuses], then repeats the last one.
+class _StatusAdapter implements HttpClientAdapter {
+  _StatusAdapter(this.statuses);
+
+  final List<int> statuses;
+  int calls = 0;
+
+  @override
+  Future<ResponseBody> fetch(
+    RequestOptions options,
+    Stream<Uint8List>? requestStream,
+    Future<void>? cancelFuture,
+  ) async {
+    final status = statuses[min(calls++, statuses.length - 1)];
+    return ResponseBody.fromString('{}', status, headers: {
+      Headers.contentTypeHeader: [Headers.jsonContentType],
+    });
+  }
+
+  @override
+  void close({bool force = false}) {}
+}
+
+void main() {
+  group('TransportPolicy', () {
+    test('should keep the jittered backoff under the capped exponential', () {
+      const policy = TransportPolicy();
+      final random = Random(1);
+
+      for (var attempt = 0; attempt < 8; attempt++) {
+        final ceiling = min(200 << attempt, 2000);
+        expect(policy.backoff(attempt, random).inMilliseconds,
+            inInclusiveRange(0, ceiling));
+      }
+    });
+  });
+
+  group('RetryInterceptor', () {
+    Dio dioWith(_StatusAdapter adapter, TransportPolicy policy) {
+      final dio = Dio()..httpClientAdapter = adapter;
+      return dio
+        ..interceptors.add(RetryInterceptor(dio, policy, sleep: (_) async {}));
+    }
+
+    test('should retry a GET until it succeeds', () async {
+      final adapter = _StatusAdapter([503, 502, 200]);
+      final dio = dioWith(adapter, const TransportPolicy());
+
+      final response = await dio.get('http://test/api/games/1');
+
+      expect(response.statusCode, 200);
+      expect(adapter.calls, 3);
+    });
+
+    test('should give up after maxRetries', () async {
+      final adapter = _StatusAdapter([503]);
+      final dio = dioWith(adapter, const TransportPolicy(maxRetries: 1));
+
+      await expectLater(dio.get('http://test/api/games/1'), throwsA(isA<DioException>()));
+      expect(adapter.calls, 2);
+    });
+
+    test('should not retry actions or client errors', () async {
+      final adapter = _StatusAdapter([503, 404]);
+      final dio = dioWith(adapter, const TransportPolicy());
+
+      await expectLater(dio.post('http://test/api/games/1/action'), throwsA(isA<DioException>()));
+      await expectLater(dio.get('http://test/api/games/x'), throwsA(isA<DioException>()));
+      expect(adapter.calls, 2);
+    });
+  });
+
+  group('CircuitBreaker', () {
+    late DateTime now;
+    late _StatusAdapter adapter;
+    late CircuitBreaker breaker;
+    late Dio dio;
+
+    setUp(() {
+      now = DateTime(2024);
+      adapter = _StatusAdapter([500, 500, 200]);
+      breaker = CircuitBreaker(
+        const TransportPolicy(failureThreshold: 2),
+        clock: () => now,
+      );
+      dio = Dio()
+        ..httpClientAdapter = adapter
+        ..interceptors.add(breaker);
+    });
+
+    Future<void> fail() =>
+        expectLater(dio.get('http://test/api/games'), throwsA(isA<DioException>()));
+
+    test('should fail fast once the threshold is reached', () async {
+      await fail();
+      await fail();
+      await expectLater(
+        dio.get('http://test/api/games'),
+        throwsA(isA<DioException>().having(
+            (e) => e.error, 'error', isA<CircuitOpenException>())),
+      );
+
+      expect(adapter.calls, 2);
+      expect(breaker.shortCircuited, 1);
+    });
+
+    test('should close again after a successful probe', () async {
+      await fail();
+      await fail();
+      now = now.add(const Duration(seconds: 11));
+
+      final response = await dio.get('http://test/api/games');
+
+      expect(response.statusCode, 200);
+      expect(breaker.isOpen('test'), false);
+    });
+  });
+
+  group('hedge', () {
+    test('should take the hedged request when the first is slow', () async {
+      final tokens = <CancelToken>[];
+      var hedges = 0;
+
+      final result = await hedge<String>(
+        (token) {
+          tokens.add(token);
+          return tokens.length == 1 ? Completer<String>().future : Future.value('second');
+        },
+        const Duration(milliseconds: 10),
+        onHedge: () => hedges++,
+      );
+
+      expect(result, 'second');
+      expect(hedges, 1);
+      expect(tokens.first.isCancelled, true);
+    });
+
+    test('should not hedge a fast request', () async {
+      var calls = 0;
+
+      final result = await hedge<String>(
+        (_) async {
+          calls++;
+          return 'first';
+        },
+        const Duration(milliseconds: 10),
+      );
+      await Future<void>.delayed(const Duration(milliseconds: 20));
+
+      expect(result, 'first');
+      expect(calls, 1);
+    });
+  });
+}
+''',
+
+        'test/unit/core/network/single_flight_test.dart': '''import 'dart:async';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/core/network/single_flight.dart';
+
+void main() {
+  group('SingleFlight', () {
+    test('should share one call between concurrent identical keys', () async {
+      final flight = SingleFlight();
+      final completer = Completer<int>();
+      var calls = 0;
+      Future<int> task() {
+        calls++;
+        return completer.future;
+      }
+
+      final first = flight.run('GET /api/games/1', task);
+      final second = flight.run('GET /api/games/1', task);
+      completer.complete(42);
+
+      expect(await first, 42);
+      expect(await second, 42);
+      expect(calls, 1);
+      expect(flight.coalesced, 1);
+    });
+
+    test('should start a new call once the previous one completed', () async {
+      final flight = SingleFlight();
+      var calls = 0;
+
+      await flight.run('a', () async => ++calls);
+      await flight.run('a', () async => ++calls);
+
+      expect(calls, 2);
+    });
+
+    test('should share failures and then forget them', () async {
+      final flight = SingleFlight();
+      final completer = Completer<int>();
+
+      final first = flight.run('a', () => completer.future);
+      final second = flight.run('a', () => completer.future);
+      completer.completeError(StateError('boom'));
+
+      await expectLater(first, throwsStateError);
+      await expectLater(second, throwsStateError);
+      expect(flight.isInFlight('a'), false);
+    });
+  });
+
+  group('KeyedSerialQueue', () {
+    test('should run tasks for one key in call order', () async {
+      final queue = KeyedSerialQueue();
+      final log = <String>[];
+      final slow = Completer<void>();
+
+      final first = queue.run('game-1', () async {
+        await slow.future;
+        log.add('first');
+      });
+      final second = queue.run('game-1', () async => log.add('second'));
+      final other = queue.run('game-2', () async => log.add('other'));
+
+      await other;
+      expect(log, ['other']);
+      slow.complete();
+      await Future.wait([first, second]);
+      expect(log, ['other', 'first', 'second']);
+      expect(queue.isBusy('game-1'), false);
+    });
+
+    test('should keep going after a failed task', () async {
+      final queue = KeyedSerialQueue();
+
+      final failed = queue.run<int>('g', () async => throw StateError('boom'));
+      final next = queue.run('g', () async => 1);
+
+      await expectLater(failed, throwsStateError);
+      expect(await next, 1);
+    });
+  });
+}
 ''',
 
         'test/unit/core/utils/logger_test.dart': '''import 'package:flutter_test/flutter_test.dart';
@@ -681,6 +2159,12 @@ def main():
     print("   - Project structure created")
     print("   - Configuration files added")
     print("   - Core utilities implemented")
+    print("   - Conditional GET cache (ETag / Last-Modified) added")
+    print("   - Single-flight GETs and per-key serial queues added")
+    print("   - Compact wire encoding and gzip negotiation added")
+    print("   - Level-gated, sampled HTTP logging (stripped in release) added")
+    print("   - Per-endpoint network, parse and size metrics added")
+    print("   - Transport policy: retries with backoff, circuit breaker, hedged GETs")
     print("   - Theme and colors defined")
     print("   - Docker setup ready")
     print("   - CI/CD workflow configured")
@@ -16,6 +16,7 @@ def create_directory_structure(base_path):
         'lib/domain/ports/inbound',
         'lib/domain/ports/outbound',
         'lib/domain/use_cases',
+        'lib/domain/services',
     ]
 
     for directory in directories:
@@ -26,6 +27,29 @@ def generate_files(base_path):
 
     files = {
         # Value Objects
+        'lib/domain/value_objects/action_command.dart': '''import 'package:equatable/equatable.dart';
+import 'action_type.dart';
+import 'direction.dart';
+
+/// One action to send to the server, as queued by the player.
+class ActionCommand extends Equatable {
+  final ActionType action;
+  final Direction direction;
+
+  const ActionCommand(this.action, this.direction);
+
+  @override
+  List<Object?> get props => [action, direction];
+
+  Map<String, dynamic> toJson() {
+    return {
+      'action': action.name,
+      'direction': direction.name,
+    };
+  }
+}
+''',
+
         'lib/domain/value_objects/position.dart': '''import 'package:equatable/equatable.dart';
 
 class Position extends Equatable {
@@ -64,6 +88,18 @@ class Position extends Equatable {
   SOUTH,
   WEST;
 
+  static final Map<String, Direction> _byName = {
+    for (final direction in Direction.values) direction.name: direction,
+  };
+
+  static Direction fromName(String name) {
+    final direction = _byName[name];
+    if (direction == null) {
+      throw FormatException('Unknown Direction: $name');
+    }
+    return direction;
+  }
+
   String get displayName {
     switch (this) {
       case Direction.NORTH:
@@ -77,6 +113,32 @@ class Position extends Equatable {
     }
   }
 
+  /// Column offset of the adjacent cell in this direction.
+  int get dx {
+    switch (this) {
+      case Direction.EAST:
+        return 1;
+      case Direction.WEST:
+        return -1;
+      case Direction.NORTH:
+      case Direction.SOUTH:
+        return 0;
+    }
+  }
+
+  /// Row offset of the adjacent cell in this direction (rows grow southward).
+  int get dy {
+    switch (this) {
+      case Direction.SOUTH:
+        return 1;
+      case Direction.NORTH:
+        return -1;
+      case Direction.EAST:
+      case Direction.WEST:
+        return 0;
+    }
+  }
+
   String get icon {
     switch (this) {
       case Direction.NORTH:
@@ -99,6 +161,37 @@ class Position extends Equatable {
   flower,
   obstacle;
 
+  static final Map<String, CellType> _byName = {
+    for (final type in CellType.values) type.name: type,
+  };
+
+  static CellType fromName(String name) {
+    final type = _byName[name];
+    if (type == null) {
+      throw FormatException('Unknown CellType: $name');
+    }
+    return type;
+  }
+
+  /// One character per type in the compact wire encoding, in enum order.
+  static const compactChars = '.RPFO';
+
+  static final Map<int, CellType> _byCompactCode = {
+    for (final type in CellType.values) compactChars.codeUnitAt(type.index): type,
+  };
+
+  /// Type of a code unit of a compact grid string.
+  static CellType fromCompactCode(int codeUnit) {
+    final type = _byCompactCode[codeUnit];
+    if (type == null) {
+      throw FormatException(
+          'Unknown compact cell: ${String.fromCharCode(codeUnit)}');
+    }
+    return type;
+  }
+
+  String get compactChar => compactChars[index];
+
   String get displayName {
     switch (this) {
       case CellType.empty:
@@ -136,6 +229,18 @@ class Position extends Equatable {
   won,
   gameOver;
 
+  static final Map<String, GameStatus> _byName = {
+    for (final status in GameStatus.values) status.name: status,
+  };
+
+  static GameStatus fromName(String name) {
+    final status = _byName[name];
+    if (status == null) {
+      throw FormatException('Unknown GameStatus: $name');
+    }
+    return status;
+  }
+
   String get displayName {
     switch (this) {
       case GameStatus.playing:
@@ -159,6 +264,18 @@ class Position extends Equatable {
   giveFlower,
   clean;
 
+  static final Map<String, ActionType> _byName = {
+    for (final type in ActionType.values) type.name: type,
+  };
+
+  static ActionType fromName(String name) {
+    final type = _byName[name];
+    if (type == null) {
+      throw FormatException('Unknown ActionType: $name');
+    }
+    return type;
+  }
+
   String get displayName {
     switch (this) {
       case ActionType.rotate:
@@ -232,7 +349,7 @@ class Cell extends Equatable {
   factory Cell.fromJson(Map<String, dynamic> json) {
     return Cell(
       position: Position.fromJson(json['position'] as Map<String, dynamic>),
-      type: CellType.values.firstWhere((e) => e.name == json['type']),
+      type: CellType.fromName(json['type'] as String),
     );
   }
 }
@@ -282,16 +399,110 @@ class Robot extends Equatable {
   factory Robot.fromJson(Map<String, dynamic> json) {
     return Robot(
       position: Position.fromJson(json['position'] as Map<String, dynamic>),
-      orientation: Direction.values.firstWhere((e) => e.name == json['orientation']),
+      orientation: Direction.fromName(json['orientation'] as String),
       flowersHeld: json['flowersHeld'] as int? ?? 0,
     );
   }
 }
+''',
+
+        'lib/domain/entities/chunked_cells.dart': '''import 'dart:collection';
+import 'cell.dart';
+
+/// Immutable list of cells stored as fixed-size chunks.
+///
+/// [replace] copies only the chunk holding the replaced cell plus the chunk
+/// index, and shares every other chunk with the original list. Boards built
+/// step by step (optimistic updates, replay reconstruction) therefore keep
+/// most of their storage in common.
+///
+/// Each chunk's hash is computed once and handed on by [replace] for the
+/// chunks it shares, so [contentHash] of a derived list only rehashes the
+/// copied chunk.
+class ChunkedCells extends ListBase<Cell> {
+  static const int chunkSize = 64;
+
+  final List<List<Cell>> _chunks;
+  final List<int?> _chunkHashes;
+  final int _length;
+  int? _contentHash;
+
+  ChunkedCells._(this._chunks, this._chunkHashes, this._length);
+
+  factory ChunkedCells.from(Iterable<Cell> cells) {
+    if (cells is ChunkedCells) return cells;
+    final list = List<Cell>.of(cells, growable: false);
+    final chunks = <List<Cell>>[
+      for (var start = 0; start < list.length; start += chunkSize)
+        List<Cell>.unmodifiable(
+          list.sublist(
+            start,
+            start + chunkSize < list.length ? start + chunkSize : list.length,
+          ),
+        ),
+    ];
+    return ChunkedCells._(
+      List<List<Cell>>.unmodifiable(chunks),
+      List<int?>.filled(chunks.length, null),
+      list.length,
+    );
+  }
+
+  /// [contentHash] of any list of cells; equal lists hash alike however
+  /// they are stored.
+  static int hashOf(List<Cell> cells) => ChunkedCells.from(cells).contentHash;
+
+  int get chunkCount => _chunks.length;
+
+  List<Cell> chunk(int chunkIndex) => _chunks[chunkIndex];
+
+  int chunkHash(int chunkIndex) =>
+      _chunkHashes[chunkIndex] ??= Object.hashAll(_chunks[chunkIndex]);
+
+  int get contentHash => _contentHash ??= Object.hash(
+        _length,
+        Object.hashAll([for (var c = 0; c < chunkCount; c++) chunkHash(c)]),
+      );
+
+  @override
+  int get length => _length;
+
+  @override
+  set length(int newLength) {
+    throw UnsupportedError('ChunkedCells is immutable');
+  }
+
+  @override
+  Cell operator [](int index) {
+    RangeError.checkValidIndex(index, this);
+    return _chunks[index ~/ chunkSize][index % chunkSize];
+  }
+
+  @override
+  void operator []=(int index, Cell value) {
+    throw UnsupportedError('ChunkedCells is immutable');
+  }
+
+  ChunkedCells replace(int index, Cell cell) {
+    RangeError.checkValidIndex(index, this);
+    final chunkIndex = index ~/ chunkSize;
+    final chunk = List<Cell>.of(_chunks[chunkIndex], growable: false);
+    chunk[index % chunkSize] = cell;
+    final chunks = List<List<Cell>>.of(_chunks, growable: false);
+    chunks[chunkIndex] = List<Cell>.unmodifiable(chunk);
+    final hashes = List<int?>.of(_chunkHashes, growable: false);
+    hashes[chunkIndex] = null;
+    return ChunkedCells._(chunks, hashes, _length);
+  }
+}
 ''',
 
         'lib/domain/entities/game_board.dart': '''import 'package:equatable/equatable.dart';
 import 'cell.dart';
+import 'chunked_cells.dart';
 import 'robot.dart';
+import '../value_objects/cell_type.dart';
+import '../value_objects/direction.dart';
 import '../value_objects/position.dart';
 
 class GameBoard extends Equatable {
@@ -314,13 +525,34 @@ class GameBoard extends Equatable {
   });
 
   Cell? getCellAt(Position position) {
-    try {
-      return cells.firstWhere(
-        (cell) => cell.position.x == position.x && cell.position.y == position.y,
-      );
-    } catch (e) {
-      return null;
+    final index = _indexOf(position);
+    return index == null ? null : cells[index];
+  }
+
+  /// Returns a board with the cell at [position] set to [type].
+  ///
+  /// Only the chunk holding that cell is copied; the other chunks are
+  /// shared with this board, so a single-cell change does not copy the grid.
+  GameBoard withCell(Position position, CellType type) {
+    final cell = Cell(position: position, type: type);
+    final index = _indexOf(position);
+    if (index == null) {
+      return copyWith(cells: ChunkedCells.from([...cells, cell]));
+    }
+    return copyWith(cells: ChunkedCells.from(cells).replace(index, cell));
+  }
+
+  /// Boards from the API are row-major and dense, so the cell for a position
+  /// is usually at `y * width + x`; sparse boards fall back to a scan.
+  int? _indexOf(Position position) {
+    final guess = position.y * width + position.x;
+    if (isValidPosition(position) &&
+        guess < cells.length &&
+        cells[guess].position == position) {
+      return guess;
     }
+    final index = cells.indexWhere((cell) => cell.position == position);
+    return index == -1 ? null : index;
   }
 
   bool isValidPosition(Position position) {
@@ -364,6 +596,58 @@ class GameBoard extends Equatable {
         flowersDelivered,
       ];
 
+  /// Compares scalar fields before the cells, so boards that differ in
+  /// robot or score are rejected without touching the grid.
+  @override
+  bool operator ==(Object other) {
+    if (identical(this, other)) return true;
+    return other is GameBoard &&
+        other.runtimeType == runtimeType &&
+        width == other.width &&
+        height == other.height &&
+        totalFlowers == other.totalFlowers &&
+        flowersDelivered == other.flowersDelivered &&
+        robot == other.robot &&
+        princessPosition == other.princessPosition &&
+        _cellsEqual(cells, other.cells);
+  }
+
+  @override
+  int get hashCode => Object.hash(
+        width,
+        height,
+        // Per-chunk hashes, so a board from withCell rehashes one chunk
+        ChunkedCells.hashOf(cells),
+        robot,
+        princessPosition,
+        totalFlowers,
+        flowersDelivered,
+      );
+
+  /// Chunks shared between the two lists are skipped; the rest are compared
+  /// cell by cell, stopping at the first difference.
+  static bool _cellsEqual(List<Cell> a, List<Cell> b) {
+    if (identical(a, b)) return true;
+    if (a.length != b.length) return false;
+    if (a is ChunkedCells &&
+        b is ChunkedCells &&
+        a.chunkCount == b.chunkCount) {
+      for (var c = 0; c < a.chunkCount; c++) {
+        if (identical(a.chunk(c), b.chunk(c))) continue;
+        final left = a.chunk(c);
+        final right = b.chunk(c);
+        for (var i = 0; i < left.length; i++) {
+          if (left[i] != right[i]) return false;
+        }
+      }
+      return true;
+    }
+    for (var i = 0; i < a.length; i++) {
+      if (a[i] != b[i]) return false;
+    }
+    return true;
+  }
+
   Map<String, dynamic> toJson() {
     return {
       'width': width,
@@ -376,13 +660,35 @@ class GameBoard extends Equatable {
     };
   }
 
+  /// The compact wire encoding (see WireFormat); cells must be dense and
+  /// row-major, as boards from the API are.
+  Map<String, dynamic> toCompactJson() {
+    return {
+      'w': width,
+      'h': height,
+      'g': cells.map((c) => c.type.compactChar).join(),
+      'r': [
+        robot.position.x,
+        robot.position.y,
+        robot.orientation.name,
+        robot.flowersHeld,
+      ],
+      'p': [princessPosition.x, princessPosition.y],
+      't': totalFlowers,
+      'd': flowersDelivered,
+    };
+  }
+
+  /// Decodes either encoding; compact boards are told apart by their grid.
   factory GameBoard.fromJson(Map<String, dynamic> json) {
+    if (json.containsKey('g')) return GameBoard.fromCompactJson(json);
     return GameBoard(
       width: json['width'] as int,
       height: json['height'] as int,
-      cells: (json['cells'] as List)
-          .map((c) => Cell.fromJson(c as Map<String, dynamic>))
-          .toList(),
+      cells: ChunkedCells.from(
+        (json['cells'] as List)
+            .map((c) => Cell.fromJson(c as Map<String, dynamic>)),
+      ),
       robot: Robot.fromJson(json['robot'] as Map<String, dynamic>),
       princessPosition: Position.fromJson(
         json['princessPosition'] as Map<String, dynamic>,
@@ -391,6 +697,32 @@ class GameBoard extends Equatable {
       flowersDelivered: json['flowersDelivered'] as int? ?? 0,
     );
   }
+
+  factory GameBoard.fromCompactJson(Map<String, dynamic> json) {
+    final width = json['w'] as int;
+    final grid = json['g'] as String;
+    final robot = json['r'] as List;
+    final princess = json['p'] as List;
+    return GameBoard(
+      width: width,
+      height: json['h'] as int,
+      cells: ChunkedCells.from([
+        for (var i = 0; i < grid.length; i++)
+          Cell(
+            position: Position(x: i % width, y: i ~/ width),
+            type: CellType.fromCompactCode(grid.codeUnitAt(i)),
+          ),
+      ]),
+      robot: Robot(
+        position: Position(x: robot[0] as int, y: robot[1] as int),
+        orientation: Direction.fromName(robot[2] as String),
+        flowersHeld: robot[3] as int,
+      ),
+      princessPosition: Position(x: princess[0] as int, y: princess[1] as int),
+      totalFlowers: json['t'] as int,
+      flowersDelivered: json['d'] as int? ?? 0,
+    );
+  }
 }
 ''',
 
@@ -444,13 +776,29 @@ class GameAction extends Equatable {
 
   factory GameAction.fromJson(Map<String, dynamic> json) {
     return GameAction(
-      type: ActionType.values.firstWhere((e) => e.name == json['type']),
-      direction: Direction.values.firstWhere((e) => e.name == json['direction']),
+      type: ActionType.fromName(json['type'] as String),
+      direction: Direction.fromName(json['direction'] as String),
       timestamp: DateTime.parse(json['timestamp'] as String),
       success: json['success'] as bool? ?? true,
       errorMessage: json['errorMessage'] as String?,
     );
   }
+
+  /// Compact wire encoding: [type, direction, timestamp, errorMessage].
+  List<Object?> toCompactJson() {
+    return [type.name, direction.name, timestamp.toIso8601String(), errorMessage];
+  }
+
+  factory GameAction.fromCompactJson(List<dynamic> json) {
+    final errorMessage = json[3] as String?;
+    return GameAction(
+      type: ActionType.fromName(json[0] as String),
+      direction: Direction.fromName(json[1] as String),
+      timestamp: DateTime.parse(json[2] as String),
+      success: errorMessage == null,
+      errorMessage: errorMessage,
+    );
+  }
 }
 ''',
 
@@ -509,6 +857,45 @@ class Game extends Equatable {
         updatedAt,
       ];
 
+  /// Compares scalar fields first, then the histories by length and from
+  /// the newest action back, where two diverging games differ.
+  @override
+  bool operator ==(Object other) {
+    if (identical(this, other)) return true;
+    return other is Game &&
+        other.runtimeType == runtimeType &&
+        id == other.id &&
+        status == other.status &&
+        name == other.name &&
+        createdAt == other.createdAt &&
+        updatedAt == other.updatedAt &&
+        _actionsEqual(actions, other.actions) &&
+        board == other.board;
+  }
+
+  @override
+  int get hashCode => Object.hash(
+        id,
+        name,
+        board,
+        status,
+        // Only the length and newest action of the history are hashed,
+        // so hashing a game never walks it
+        actions.length,
+        actions.isEmpty ? null : actions.last,
+        createdAt,
+        updatedAt,
+      );
+
+  static bool _actionsEqual(List<GameAction> a, List<GameAction> b) {
+    if (identical(a, b)) return true;
+    if (a.length != b.length) return false;
+    for (var i = a.length - 1; i >= 0; i--) {
+      if (a[i] != b[i]) return false;
+    }
+    return true;
+  }
+
   Map<String, dynamic> toJson() {
     return {
       'id': id,
@@ -526,9 +913,11 @@ class Game extends Equatable {
       id: json['id'] as String,
       name: json['name'] as String,
       board: GameBoard.fromJson(json['board'] as Map<String, dynamic>),
-      status: GameStatus.values.firstWhere((e) => e.name == json['status']),
+      status: GameStatus.fromName(json['status'] as String),
       actions: (json['actions'] as List?)
-              ?.map((a) => GameAction.fromJson(a as Map<String, dynamic>))
+              ?.map((a) => a is List
+                  ? GameAction.fromCompactJson(a)
+                  : GameAction.fromJson(a as Map<String, dynamic>))
               .toList() ??
           [],
       createdAt: DateTime.parse(json['createdAt'] as String),
@@ -538,6 +927,209 @@ class Game extends Equatable {
     );
   }
 }
+''',
+
+        'lib/domain/entities/game_event.dart': '''import 'package:equatable/equatable.dart';
+import 'game.dart';
+import 'game_action.dart';
+import 'game_board.dart';
+import '../value_objects/game_status.dart';
+
+/// Update pushed on a game's stream (GET /api/games/{id}/stream).
+///
+/// A stream opens with a [GameSnapshot]; every action applied afterwards,
+/// by this client, another viewer or a streamed autoplay, follows as a
+/// [GameStep].
+sealed class GameEvent extends Equatable {
+  const GameEvent();
+
+  /// Decodes either wire encoding (see WireFormat).
+  factory GameEvent.fromJson(Map<String, dynamic> json) {
+    switch (json['type']) {
+      case 'snapshot':
+        return GameSnapshot(
+            Game.fromJson(json['game'] as Map<String, dynamic>));
+      case 'step':
+        return GameStep.fromJson(json);
+    }
+    throw FormatException('Unknown GameEvent type: ${json['type']}');
+  }
+}
+
+class GameSnapshot extends GameEvent {
+  final Game game;
+
+  const GameSnapshot(this.game);
+
+  @override
+  List<Object?> get props => [game];
+}
+
+/// One applied action and the state it left; [step] is the length of the
+/// actions list once it is applied.
+class GameStep extends GameEvent {
+  final int step;
+  final GameAction action;
+  final GameBoard board;
+  final GameStatus status;
+  final DateTime updatedAt;
+
+  const GameStep({
+    required this.step,
+    required this.action,
+    required this.board,
+    required this.status,
+    required this.updatedAt,
+  });
+
+  @override
+  List<Object?> get props => [step, action, board, status, updatedAt];
+
+  factory GameStep.fromJson(Map<String, dynamic> json) {
+    final action = json['action'];
+    return GameStep(
+      step: json['step'] as int,
+      action: action is List
+          ? GameAction.fromCompactJson(action)
+          : GameAction.fromJson(action as Map<String, dynamic>),
+      board: GameBoard.fromJson(json['board'] as Map<String, dynamic>),
+      status: GameStatus.fromName(json['status'] as String),
+      updatedAt: DateTime.parse(json['updatedAt'] as String),
+    );
+  }
+
+  /// True if this is the next step of [game].
+  bool follows(Game game) => step == game.actions.length + 1;
+
+  Game applyTo(Game game) {
+    return game.copyWith(
+      board: board,
+      status: status,
+      actions: [...game.actions, action],
+      updatedAt: updatedAt,
+    );
+  }
+}
+''',
+
+        'lib/domain/entities/game_summary.dart': '''import 'package:equatable/equatable.dart';
+import 'game.dart';
+import '../value_objects/game_status.dart';
+
+/// What the games list shows of a game: no cells, no action history.
+class GameSummary extends Equatable {
+  final String id;
+  final String name;
+  final GameStatus status;
+  final int boardWidth;
+  final int boardHeight;
+  final int totalFlowers;
+  final int flowersDelivered;
+  final int actionCount;
+  final DateTime createdAt;
+  final DateTime? updatedAt;
+
+  const GameSummary({
+    required this.id,
+    required this.name,
+    required this.status,
+    required this.boardWidth,
+    required this.boardHeight,
+    required this.totalFlowers,
+    this.flowersDelivered = 0,
+    this.actionCount = 0,
+    required this.createdAt,
+    this.updatedAt,
+  });
+
+  factory GameSummary.fromGame(Game game) {
+    return GameSummary(
+      id: game.id,
+      name: game.name,
+      status: game.status,
+      boardWidth: game.board.width,
+      boardHeight: game.board.height,
+      totalFlowers: game.board.totalFlowers,
+      flowersDelivered: game.board.flowersDelivered,
+      actionCount: game.actions.length,
+      createdAt: game.createdAt,
+      updatedAt: game.updatedAt,
+    );
+  }
+
+  @override
+  List<Object?> get props => [
+        id,
+        name,
+        status,
+        boardWidth,
+        boardHeight,
+        totalFlowers,
+        flowersDelivered,
+        actionCount,
+        createdAt,
+        updatedAt,
+      ];
+
+  Map<String, dynamic> toJson() {
+    return {
+      'id': id,
+      'name': name,
+      'status': status.name,
+      'boardWidth': boardWidth,
+      'boardHeight': boardHeight,
+      'totalFlowers': totalFlowers,
+      'flowersDelivered': flowersDelivered,
+      'actionCount': actionCount,
+      'createdAt': createdAt.toIso8601String(),
+      'updatedAt': updatedAt?.toIso8601String(),
+    };
+  }
+
+  factory GameSummary.fromJson(Map<String, dynamic> json) {
+    return GameSummary(
+      id: json['id'] as String,
+      name: json['name'] as String,
+      status: GameStatus.fromName(json['status'] as String),
+      boardWidth: json['boardWidth'] as int,
+      boardHeight: json['boardHeight'] as int,
+      totalFlowers: json['totalFlowers'] as int,
+      flowersDelivered: json['flowersDelivered'] as int? ?? 0,
+      actionCount: json['actionCount'] as int? ?? 0,
+      createdAt: DateTime.parse(json['createdAt'] as String),
+      updatedAt: json['updatedAt'] != null
+          ? DateTime.parse(json['updatedAt'] as String)
+          : null,
+    );
+  }
+}
+
+/// One page of the games list, newest first.
+///
+/// [nextCursor] is opaque and null on the last page.
+class GameSummaryPage extends Equatable {
+  final List<GameSummary> items;
+  final String? nextCursor;
+
+  const GameSummaryPage({
+    required this.items,
+    this.nextCursor,
+  });
+
+  bool get hasMore => nextCursor != null;
+
+  @override
+  List<Object?> get props => [items, nextCursor];
+
+  factory GameSummaryPage.fromJson(Map<String, dynamic> json) {
+    return GameSummaryPage(
+      items: (json['items'] as List)
+          .map((item) => GameSummary.fromJson(item as Map<String, dynamic>))
+          .toList(),
+      nextCursor: json['nextCursor'] as String?,
+    );
+  }
+}
 ''',
 
         # Ports - Inbound (Use Case Interfaces)
@@ -557,6 +1149,15 @@ import '../../entities/game.dart';
 abstract class GetGamesUseCase {
   Future<Either<Failure, List<Game>>> call();
 }
+''',
+
+        'lib/domain/ports/inbound/get_game_summaries_use_case.dart': '''import 'package:dartz/dartz.dart';
+import '../../../core/error/failures.dart';
+import '../../entities/game_summary.dart';
+
+abstract class GetGameSummariesUseCase {
+  Future<Either<Failure, GameSummaryPage>> call({String? cursor, int? limit});
+}
 ''',
 
         'lib/domain/ports/inbound/get_game_use_case.dart': '''import 'package:dartz/dartz.dart';
@@ -581,6 +1182,16 @@ abstract class ExecuteActionUseCase {
     Direction direction,
   );
 }
+''',
+
+        'lib/domain/ports/inbound/execute_actions_use_case.dart': '''import 'package:dartz/dartz.dart';
+import '../../../core/error/failures.dart';
+import '../../entities/game.dart';
+import '../../value_objects/action_command.dart';
+
+abstract class ExecuteActionsUseCase {
+  Future<Either<Failure, Game>> call(String gameId, List<ActionCommand> actions);
+}
 ''',
 
         'lib/domain/ports/inbound/auto_play_use_case.dart': '''import 'package:dartz/dartz.dart';
@@ -588,7 +1199,18 @@ import '../../../core/error/failures.dart';
 import '../../entities/game.dart';
 
 abstract class AutoPlayUseCase {
-  Future<Either<Failure, Game>> call(String gameId);
+  /// With [stream], the server plays one step at a time and pushes each
+  /// on the game's stream before answering.
+  Future<Either<Failure, Game>> call(String gameId, {bool stream = false});
+}
+''',
+
+        'lib/domain/ports/inbound/watch_game_use_case.dart': '''import 'package:dartz/dartz.dart';
+import '../../../core/error/failures.dart';
+import '../../entities/game_event.dart';
+
+abstract class WatchGameUseCase {
+  Stream<Either<Failure, GameEvent>> call(String gameId);
 }
 ''',
 
@@ -606,20 +1228,38 @@ abstract class ReplayGameUseCase {
 import '../../../core/error/failures.dart';
 import '../../entities/game.dart';
 import '../../entities/game_board.dart';
+import '../../entities/game_event.dart';
+import '../../entities/game_summary.dart';
+import '../../value_objects/action_command.dart';
 import '../../value_objects/action_type.dart';
 import '../../value_objects/direction.dart';
 
 abstract class GameRepository {
   Future<Either<Failure, Game>> createGame(String name, int boardSize);
   Future<Either<Failure, List<Game>>> getGames();
+  Future<Either<Failure, GameSummaryPage>> getGameSummaries({
+    String? cursor,
+    required int limit,
+  });
   Future<Either<Failure, Game>> getGame(String gameId);
   Future<Either<Failure, Game>> executeAction(
     String gameId,
     ActionType action,
     Direction direction,
   );
-  Future<Either<Failure, Game>> autoPlay(String gameId);
+
+  /// Applies [actions] in order in one request; the server stops at the
+  /// first one that ends the game.
+  Future<Either<Failure, Game>> executeActions(
+    String gameId,
+    List<ActionCommand> actions,
+  );
+  Future<Either<Failure, Game>> autoPlay(String gameId, {bool stream = false});
   Future<Either<Failure, List<GameBoard>>> replayGame(String gameId);
+
+  /// Snapshot of the game, then a step per applied action, until the
+  /// subscription is cancelled or the connection is lost.
+  Stream<Either<Failure, GameEvent>> watchGame(String gameId);
 }
 ''',
 
@@ -664,6 +1304,33 @@ class GetGamesImpl implements GetGamesUseCase {
     return await repository.getGames();
   }
 }
+''',
+
+        'lib/domain/use_cases/get_game_summaries_impl.dart': '''import 'package:dartz/dartz.dart';
+import '../../core/constants/app_constants.dart';
+import '../../core/error/failures.dart';
+import '../entities/game_summary.dart';
+import '../ports/inbound/get_game_summaries_use_case.dart';
+import '../ports/outbound/game_repository.dart';
+
+class GetGameSummariesImpl implements GetGameSummariesUseCase {
+  final GameRepository repository;
+
+  GetGameSummariesImpl(this.repository);
+
+  @override
+  Future<Either<Failure, GameSummaryPage>> call({
+    String? cursor,
+    int? limit,
+  }) async {
+    final pageSize = limit ?? AppConstants.gamesPageSize;
+    if (pageSize < 1 || pageSize > AppConstants.maxGamesPageSize) {
+      return const Left(ValidationFailure(
+          'Page size must be between 1 and ${AppConstants.maxGamesPageSize}'));
+    }
+    return await repository.getGameSummaries(cursor: cursor, limit: pageSize);
+  }
+}
 ''',
 
         'lib/domain/use_cases/get_game_impl.dart': '''import 'package:dartz/dartz.dart';
@@ -712,6 +1379,36 @@ class ExecuteActionImpl implements ExecuteActionUseCase {
     return await repository.executeAction(gameId, action, direction);
   }
 }
+''',
+
+        'lib/domain/use_cases/execute_actions_impl.dart': '''import 'package:dartz/dartz.dart';
+import '../../core/constants/app_constants.dart';
+import '../../core/error/failures.dart';
+import '../entities/game.dart';
+import '../ports/inbound/execute_actions_use_case.dart';
+import '../ports/outbound/game_repository.dart';
+import '../value_objects/action_command.dart';
+
+class ExecuteActionsImpl implements ExecuteActionsUseCase {
+  final GameRepository repository;
+
+  ExecuteActionsImpl(this.repository);
+
+  @override
+  Future<Either<Failure, Game>> call(
+    String gameId,
+    List<ActionCommand> actions,
+  ) async {
+    if (gameId.isEmpty) {
+      return const Left(ValidationFailure('Game ID cannot be empty'));
+    }
+    if (actions.isEmpty || actions.length > AppConstants.maxActionBatch) {
+      return const Left(ValidationFailure(
+          'A batch holds 1 to ${AppConstants.maxActionBatch} actions'));
+    }
+    return await repository.executeActions(gameId, actions);
+  }
+}
 ''',
 
         'lib/domain/use_cases/auto_play_impl.dart': '''import 'package:dartz/dartz.dart';
@@ -726,11 +1423,188 @@ class AutoPlayImpl implements AutoPlayUseCase {
   AutoPlayImpl(this.repository);
 
   @override
-  Future<Either<Failure, Game>> call(String gameId) async {
+  Future<Either<Failure, Game>> call(String gameId, {bool stream = false}) async {
     if (gameId.isEmpty) {
       return const Left(ValidationFailure('Game ID cannot be empty'));
     }
-    return await repository.autoPlay(gameId);
+    return await repository.autoPlay(gameId, stream: stream);
+  }
+}
+''',
+
+        'lib/domain/use_cases/watch_game_impl.dart': '''import 'package:dartz/dartz.dart';
+import '../../core/error/failures.dart';
+import '../entities/game_event.dart';
+import '../ports/inbound/watch_game_use_case.dart';
+import '../ports/outbound/game_repository.dart';
+
+class WatchGameImpl implements WatchGameUseCase {
+  final GameRepository repository;
+
+  WatchGameImpl(this.repository);
+
+  @override
+  Stream<Either<Failure, GameEvent>> call(String gameId) {
+    if (gameId.isEmpty) {
+      return Stream.value(
+          const Left(ValidationFailure('Game ID cannot be empty')));
+    }
+    return repository.watchGame(gameId);
+  }
+}
+''',
+
+        # Domain Services
+        'lib/domain/services/game_rules.dart': '''import 'package:dartz/dartz.dart';
+import '../../core/error/failures.dart';
+import '../entities/game.dart';
+import '../entities/game_action.dart';
+import '../entities/game_board.dart';
+import '../value_objects/action_type.dart';
+import '../value_objects/cell_type.dart';
+import '../value_objects/direction.dart';
+import '../value_objects/game_status.dart';
+import '../value_objects/position.dart';
+
+/// Client-side mirror of the backend game rules.
+///
+/// Used to predict the outcome of an action before the server answers. The
+/// server stays authoritative: predictions are replaced by its response.
+/// Every directional action also turns the robot toward [Direction].
+class GameRules {
+  const GameRules();
+
+  /// Applies [action] to a game in progress.
+  ///
+  /// As on the backend, an invalid action leaves the board untouched, is
+  /// recorded as a failed action and ends the game. Only a game that is
+  /// already finished yields a [GameOverFailure].
+  Either<Failure, Game> apply(
+    Game game,
+    ActionType action,
+    Direction direction,
+  ) {
+    if (game.status.isFinished) {
+      return const Left(GameOverFailure('Game is already finished'));
+    }
+    final timestamp = DateTime.now();
+    return Right(applyToBoard(game.board, action, direction).fold(
+      (failure) => game.copyWith(
+        status: GameStatus.gameOver,
+        actions: [
+          ...game.actions,
+          GameAction(
+            type: action,
+            direction: direction,
+            timestamp: timestamp,
+            success: false,
+            errorMessage: failure.message,
+          ),
+        ],
+      ),
+      (board) => game.copyWith(
+        board: board,
+        status: board.isComplete ? GameStatus.won : game.status,
+        actions: [
+          ...game.actions,
+          GameAction(
+            type: action,
+            direction: direction,
+            timestamp: timestamp,
+          ),
+        ],
+      ),
+    ));
+  }
+
+  Either<Failure, GameBoard> applyToBoard(
+    GameBoard board,
+    ActionType action,
+    Direction direction,
+  ) {
+    final robot = board.robot;
+    final facing = robot.copyWith(orientation: direction);
+    final target = Position(
+      x: robot.position.x + direction.dx,
+      y: robot.position.y + direction.dy,
+    );
+
+    switch (action) {
+      case ActionType.rotate:
+        return Right(board.copyWith(robot: facing));
+
+      case ActionType.move:
+        if (!_isFree(board, target)) {
+          return _invalid('Cannot move to (${target.x}, ${target.y})');
+        }
+        var moved = board;
+        if (_typeAt(board, robot.position) == CellType.robot) {
+          moved = moved
+              .withCell(robot.position, CellType.empty)
+              .withCell(target, CellType.robot);
+        }
+        return Right(moved.copyWith(robot: facing.copyWith(position: target)));
+
+      case ActionType.pickFlower:
+        if (_typeAt(board, target) != CellType.flower) {
+          return _invalid('No flower to pick at (${target.x}, ${target.y})');
+        }
+        if (!robot.canPickMore) {
+          return _invalid('Robot cannot hold more flowers');
+        }
+        return Right(
+          board.withCell(target, CellType.empty).copyWith(
+                robot: facing.copyWith(flowersHeld: robot.flowersHeld + 1),
+              ),
+        );
+
+      case ActionType.dropFlower:
+        if (!robot.hasFlowers) {
+          return _invalid('Robot has no flower to drop');
+        }
+        if (!_isFree(board, target)) {
+          return _invalid('Cannot drop a flower at (${target.x}, ${target.y})');
+        }
+        return Right(
+          board.withCell(target, CellType.flower).copyWith(
+                robot: facing.copyWith(flowersHeld: robot.flowersHeld - 1),
+              ),
+        );
+
+      case ActionType.giveFlower:
+        if (!robot.hasFlowers) {
+          return _invalid('Robot has no flower to give');
+        }
+        if (target != board.princessPosition) {
+          return _invalid('Princess is not at (${target.x}, ${target.y})');
+        }
+        return Right(
+          board.copyWith(
+            robot: facing.copyWith(flowersHeld: 0),
+            flowersDelivered: board.flowersDelivered + robot.flowersHeld,
+          ),
+        );
+
+      case ActionType.clean:
+        if (_typeAt(board, target) != CellType.obstacle) {
+          return _invalid('No obstacle to clean at (${target.x}, ${target.y})');
+        }
+        return Right(board.withCell(target, CellType.empty).copyWith(robot: facing));
+    }
+  }
+
+  CellType? _typeAt(GameBoard board, Position position) {
+    if (!board.isValidPosition(position)) return null;
+    return board.getCellAt(position)?.type ?? CellType.empty;
+  }
+
+  bool _isFree(GameBoard board, Position position) {
+    return position != board.princessPosition &&
+        _typeAt(board, position) == CellType.empty;
+  }
+
+  Either<Failure, GameBoard> _invalid(String message) {
+    return Left(GameOverFailure(message));
   }
 }
 ''',
@@ -790,11 +1664,12 @@ def main():
 
     print(f"✅ Part 2A packaged as {zip_filename}")
     print("\n📦 Part 2A Complete!")
-    print("   ✅ Value objects (Position, Direction, CellType, GameStatus, ActionType)")
-    print("   ✅ Entities (Game, Robot, GameBoard, Cell, GameAction)")
+    print("   ✅ Value objects (Position, Direction, CellType, GameStatus, ActionType, ActionCommand)")
+    print("   ✅ Entities (Game, GameSummary, Robot, GameBoard, Cell, ChunkedCells, GameAction)")
     print("   ✅ Ports - Inbound (Use case interfaces)")
     print("   ✅ Ports - Outbound (Repository interfaces)")
-    print("   ✅ Use cases implementations (6 use cases)")
+    print("   ✅ Use cases implementations (8 use cases)")
+    print("   ✅ Services (GameRules client-side prediction)")
     print("\n📝 Next: Run Part 2B to generate domain tests")
 
 if __name__ == '__main__':
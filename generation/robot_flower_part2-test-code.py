@@ -14,6 +14,7 @@ def create_directory_structure(base_path):
         'test/unit/domain/entities',
         'test/unit/domain/value_objects',
         'test/unit/domain/use_cases',
+        'test/unit/domain/services',
     ]
 
     for directory in directories:
@@ -233,14 +234,86 @@ void main() {
       expect(board.totalFlowers, testBoard.totalFlowers);
       expect(board.robot.position, testBoard.robot.position);
     });
+
+    test('should round-trip the compact encoding', () {
+      const dense = GameBoard(
+        width: 2,
+        height: 2,
+        cells: [
+          Cell(position: Position(x: 0, y: 0), type: CellType.robot),
+          Cell(position: Position(x: 1, y: 0), type: CellType.flower),
+          Cell(position: Position(x: 0, y: 1), type: CellType.obstacle),
+          Cell(position: Position(x: 1, y: 1), type: CellType.princess),
+        ],
+        robot: Robot(
+          position: Position(x: 0, y: 0),
+          orientation: Direction.EAST,
+          flowersHeld: 1,
+        ),
+        princessPosition: Position(x: 1, y: 1),
+        totalFlowers: 2,
+        flowersDelivered: 1,
+      );
+
+      final json = dense.toCompactJson();
+
+      expect(json['g'], 'RFOP');
+      expect(json['r'], [0, 0, 'EAST', 1]);
+      expect(GameBoard.fromJson(json), dense);
+    });
+
+    test('should be equal to a copy sharing the same cells', () {
+      final copy = testBoard.copyWith();
+
+      expect(copy, testBoard);
+      expect(copy.hashCode, testBoard.hashCode);
+    });
+
+    test('should be equal to a structurally identical board', () {
+      final decoded = GameBoard.fromJson(testBoard.toJson());
+
+      expect(decoded, testBoard);
+      expect(decoded.hashCode, testBoard.hashCode);
+    });
+
+    test('should set a single cell with withCell', () {
+      final updated = testBoard.withCell(
+        const Position(x: 1, y: 1),
+        CellType.empty,
+      );
+
+      expect(updated.getCellAt(const Position(x: 1, y: 1))!.type, CellType.empty);
+      expect(testBoard.getCellAt(const Position(x: 1, y: 1))!.type, CellType.flower);
+      expect(updated.cells.length, testBoard.cells.length);
+    });
+
+    test('should add a missing cell with withCell', () {
+      final updated = testBoard.withCell(
+        const Position(x: 3, y: 3),
+        CellType.obstacle,
+      );
+
+      expect(updated.getCellAt(const Position(x: 3, y: 3))!.type, CellType.obstacle);
+      expect(updated.cells.length, testBoard.cells.length + 1);
+    });
+
+    test('should not be equal when a single cell differs', () {
+      final cells = List<Cell>.from(testBoard.cells);
+      cells[1] = cells[1].copyWith(type: CellType.empty);
+      final changed = testBoard.copyWith(cells: cells);
+
+      expect(changed == testBoard, false);
+    });
   });
 }
 ''',
 
         'test/unit/domain/entities/game_test.dart': '''import 'package:flutter_test/flutter_test.dart';
 import 'package:robot_flower_princess_front/domain/entities/game.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_action.dart';
 import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
 import 'package:robot_flower_princess_front/domain/entities/robot.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_type.dart';
 import 'package:robot_flower_princess_front/domain/value_objects/game_status.dart';
 import 'package:robot_flower_princess_front/domain/value_objects/position.dart';
 import 'package:robot_flower_princess_front/domain/value_objects/direction.dart';
@@ -309,6 +382,592 @@ void main() {
       expect(game.name, testGame.name);
       expect(game.status, testGame.status);
     });
+
+    test('should be equal to a structurally identical game', () {
+      final decoded = Game.fromJson(testGame.toJson());
+
+      expect(decoded, testGame);
+      expect(decoded.hashCode, testGame.hashCode);
+    });
+
+    test('should not be equal when an earlier action differs', () {
+      GameAction rotate(Direction direction) => GameAction(
+            type: ActionType.rotate,
+            direction: direction,
+            timestamp: DateTime(2024, 1, 1),
+          );
+      final a = testGame.copyWith(
+          actions: [rotate(Direction.EAST), rotate(Direction.SOUTH)]);
+      final b = testGame.copyWith(
+          actions: [rotate(Direction.WEST), rotate(Direction.SOUTH)]);
+
+      expect(a == b, false);
+    });
+
+    test('should not be equal when the board changes', () {
+      final moved = testGame.copyWith(
+        board: testGame.board.copyWith(flowersDelivered: 1),
+      );
+
+      expect(moved == testGame, false);
+    });
+  });
+}
+''',
+
+        'test/unit/domain/entities/game_event_test.dart': '''import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/domain/entities/game.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_action.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_event.dart';
+import 'package:robot_flower_princess_front/domain/entities/robot.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_type.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/direction.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/game_status.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/position.dart';
+
+void main() {
+  group('GameEvent', () {
+    const board = GameBoard(
+      width: 3,
+      height: 3,
+      cells: [],
+      robot: Robot(
+        position: Position(x: 0, y: 0),
+        orientation: Direction.NORTH,
+      ),
+      princessPosition: Position(x: 2, y: 2),
+      totalFlowers: 1,
+    );
+    final game = Game(
+      id: 'game-1',
+      name: 'Game 1',
+      board: board,
+      status: GameStatus.playing,
+      createdAt: DateTime.utc(2024),
+    );
+    final rotated = board.copyWith(
+      robot: const Robot(
+        position: Position(x: 0, y: 0),
+        orientation: Direction.EAST,
+      ),
+    );
+    final action = GameAction(
+      type: ActionType.rotate,
+      direction: Direction.EAST,
+      timestamp: DateTime.utc(2024, 1, 1, 0, 0, 1),
+    );
+
+    Map<String, dynamic> stepJson(int step, {bool compact = false}) => {
+          'type': 'step',
+          'step': step,
+          'action': compact ? action.toCompactJson() : action.toJson(),
+          'board': compact ? rotated.toCompactJson() : rotated.toJson(),
+          'status': 'playing',
+          'updatedAt': '2024-01-01T00:00:01.000Z',
+        };
+
+    test('should decode a snapshot', () {
+      final event = GameEvent.fromJson({'type': 'snapshot', 'game': game.toJson()});
+
+      expect(event, GameSnapshot(game));
+    });
+
+    test('should decode a step in either encoding', () {
+      final verbose = GameEvent.fromJson(stepJson(1));
+      final compact = GameEvent.fromJson(stepJson(1, compact: true));
+
+      expect(verbose, isA<GameStep>());
+      expect((verbose as GameStep).action, action);
+      expect(compact, verbose);
+    });
+
+    test('should apply the next step to a game', () {
+      final step = GameStep.fromJson(stepJson(1));
+
+      expect(step.follows(game), true);
+      final next = step.applyTo(game);
+      expect(next.actions, [action]);
+      expect(next.board.robot.orientation, Direction.EAST);
+      expect(next.updatedAt, DateTime.utc(2024, 1, 1, 0, 0, 1));
+    });
+
+    test('should not follow a game it skips ahead of', () {
+      expect(GameStep.fromJson(stepJson(2)).follows(game), false);
+    });
+
+    test('should reject unknown event types', () {
+      expect(() => GameEvent.fromJson({'type': 'chat'}), throwsFormatException);
+    });
+  });
+}
+''',
+
+        'test/unit/domain/entities/chunked_cells_test.dart': '''import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/domain/entities/cell.dart';
+import 'package:robot_flower_princess_front/domain/entities/chunked_cells.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/cell_type.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/position.dart';
+
+void main() {
+  group('ChunkedCells', () {
+    late List<Cell> grid;
+
+    setUp(() {
+      grid = [
+        for (var y = 0; y < 50; y++)
+          for (var x = 0; x < 50; x++)
+            Cell(position: Position(x: x, y: y), type: CellType.empty),
+      ];
+    });
+
+    test('should expose cells in their original order', () {
+      final cells = ChunkedCells.from(grid);
+
+      expect(cells.length, 2500);
+      expect(cells.chunkCount, (2500 / ChunkedCells.chunkSize).ceil());
+      expect(cells[0], grid[0]);
+      expect(cells[2499], grid[2499]);
+      expect(cells.toList(), grid);
+    });
+
+    test('should replace a cell without touching the original', () {
+      final cells = ChunkedCells.from(grid);
+      const flower = Cell(position: Position(x: 10, y: 3), type: CellType.flower);
+
+      final updated = cells.replace(160, flower);
+
+      expect(updated[160], flower);
+      expect(cells[160].type, CellType.empty);
+    });
+
+    test('should share every chunk except the replaced one', () {
+      final cells = ChunkedCells.from(grid);
+      const flower = Cell(position: Position(x: 10, y: 3), type: CellType.flower);
+      final replacedChunk = 160 ~/ ChunkedCells.chunkSize;
+
+      final updated = cells.replace(160, flower);
+
+      for (var c = 0; c < cells.chunkCount; c++) {
+        expect(identical(updated.chunk(c), cells.chunk(c)), c != replacedChunk);
+      }
+    });
+
+    test('should hash like an equal list built from scratch', () {
+      const flower = Cell(position: Position(x: 10, y: 3), type: CellType.flower);
+      final cells = ChunkedCells.from(grid);
+      cells.contentHash;
+
+      final updated = cells.replace(160, flower);
+      final rebuilt = ChunkedCells.from([...grid]..[160] = flower);
+
+      expect(updated.contentHash, rebuilt.contentHash);
+      expect(updated.contentHash == cells.contentHash, false);
+      expect(ChunkedCells.hashOf(grid), cells.contentHash);
+    });
+
+    test('should reject mutation', () {
+      final cells = ChunkedCells.from(grid);
+
+      expect(() => cells[0] = grid[1], throwsUnsupportedError);
+      expect(() => cells.add(grid[0]), throwsUnsupportedError);
+    });
+
+    test('should throw RangeError for out-of-range indexes', () {
+      final cells = ChunkedCells.from(grid);
+
+      expect(() => cells[2500], throwsRangeError);
+      expect(() => cells.replace(-1, grid[0]), throwsRangeError);
+    });
+  });
+}
+''',
+
+        # Benchmarks
+        'test/unit/domain/entities/game_board_benchmark_test.dart': '''import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
+
+Map<String, dynamic> _boardJson(int size) {
+  const types = ['empty', 'flower', 'obstacle', 'empty', 'empty'];
+  return {
+    'width': size,
+    'height': size,
+    'cells': [
+      for (var y = 0; y < size; y++)
+        for (var x = 0; x < size; x++)
+          {
+            'position': {'x': x, 'y': y},
+            'type': types[(x * 7 + y * 3) % types.length],
+          },
+    ],
+    'robot': {
+      'position': {'x': 0, 'y': 0},
+      'orientation': 'EAST',
+      'flowersHeld': 0,
+    },
+    'princessPosition': {'x': size - 1, 'y': size - 1},
+    'totalFlowers': 12,
+    'flowersDelivered': 0,
+  };
+}
+
+void main() {
+  group('GameBoard.fromJson benchmark', () {
+    test('should parse a 50x50 board', () {
+      final json = _boardJson(50);
+      const iterations = 200;
+
+      // Warm up so the JIT has compiled the decoders before timing.
+      for (var i = 0; i < 20; i++) {
+        GameBoard.fromJson(json);
+      }
+
+      final stopwatch = Stopwatch()..start();
+      late GameBoard board;
+      for (var i = 0; i < iterations; i++) {
+        board = GameBoard.fromJson(json);
+      }
+      stopwatch.stop();
+
+      final perParseUs = stopwatch.elapsedMicroseconds / iterations;
+      // ignore: avoid_print
+      print('GameBoard.fromJson 50x50: ${perParseUs.toStringAsFixed(1)} us/parse');
+
+      expect(board.cells.length, 2500);
+    });
+
+    test('should report unknown cell types clearly', () {
+      final json = _boardJson(3);
+      (json['cells'] as List)[0]['type'] = 'lava';
+
+      expect(() => GameBoard.fromJson(json), throwsFormatException);
+    });
+  });
+}
+''',
+
+        'test/unit/domain/entities/fixture_benchmark_test.dart': '''import 'dart:convert';
+import 'dart:io';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/domain/entities/game.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/position.dart';
+
+// Fixtures are written by generation/robot_flower_fixtures.py.
+const _fixtures = 'test/fixtures';
+final _missing = !File('$_fixtures/manifest.json').existsSync()
+    ? 'Run robot_flower_fixtures.py to generate test/fixtures'
+    : null;
+
+dynamic _load(String name) =>
+    jsonDecode(File('$_fixtures/$name.json').readAsStringSync());
+
+double _timeUs(int iterations, void Function() body) {
+  // Warm up so the JIT has compiled the code paths before timing.
+  for (var i = 0; i < iterations ~/ 10 + 1; i++) {
+    body();
+  }
+  final stopwatch = Stopwatch()..start();
+  for (var i = 0; i < iterations; i++) {
+    body();
+  }
+  stopwatch.stop();
+  return stopwatch.elapsedMicroseconds / iterations;
+}
+
+void _report(String label, double us) {
+  // ignore: avoid_print
+  print('$label: ${us.toStringAsFixed(1)} us');
+}
+
+void main() {
+  group('Fixture benchmarks', () {
+    for (final name in ['small', 'medium', 'large', 'max']) {
+      test('GameBoard.fromJson and getCellAt on boards/$name', () {
+        final json = _load('boards/$name') as Map<String, dynamic>;
+        final board = GameBoard.fromJson(json);
+
+        _report('GameBoard.fromJson $name', _timeUs(100, () => GameBoard.fromJson(json)));
+        _report(
+          'getCellAt full scan $name',
+          _timeUs(20, () {
+            for (var y = 0; y < board.height; y++) {
+              for (var x = 0; x < board.width; x++) {
+                board.getCellAt(Position(x: x, y: y));
+              }
+            }
+          }),
+        );
+
+        expect(board.cells.length, board.width * board.height);
+        expect(board.getCellAt(board.robot.position), isNotNull);
+      }, skip: _missing);
+    }
+
+    test('Game.fromJson on a 500-action game', () {
+      final json = _load('games/long_game') as Map<String, dynamic>;
+      final game = Game.fromJson(json);
+
+      _report('Game.fromJson long_game', _timeUs(20, () => Game.fromJson(json)));
+
+      expect(game.actions.length, 500);
+      expect(game.board.width, 50);
+    }, skip: _missing);
+
+    test('decoding a 500-step replay', () {
+      final text = File('$_fixtures/replays/long_replay.json').readAsStringSync();
+      late List<GameBoard> boards;
+
+      _report(
+        'replay jsonDecode + fromJson',
+        _timeUs(5, () {
+          boards = (jsonDecode(text) as List)
+              .map((b) => GameBoard.fromJson(b as Map<String, dynamic>))
+              .toList();
+        }),
+      );
+
+      expect(boards.length, 501);
+    }, skip: _missing);
+
+    test('decoding the same replay in the compact encoding', () {
+      final verbose = File('$_fixtures/replays/long_replay.json').readAsStringSync();
+      final compact =
+          File('$_fixtures/replays/long_replay.compact.json').readAsStringSync();
+      late List<GameBoard> boards;
+
+      _report(
+        'compact replay jsonDecode + fromJson',
+        _timeUs(5, () {
+          boards = (jsonDecode(compact) as List)
+              .map((b) => GameBoard.fromJson(b as Map<String, dynamic>))
+              .toList();
+        }),
+      );
+
+      final expected = (jsonDecode(verbose) as List)
+          .map((b) => GameBoard.fromJson(b as Map<String, dynamic>))
+          .toList();
+      expect(boards, expected);
+    }, skip: _missing);
+
+    test('Game.fromJson on the compact 500-action game', () {
+      final json = _load('games/long_game.compact') as Map<String, dynamic>;
+      final game = Game.fromJson(json);
+
+      expect(game, Game.fromJson(_load('games/long_game') as Map<String, dynamic>));
+    }, skip: _missing);
+  });
+}
+''',
+
+        # Service Tests
+        'test/unit/domain/services/game_rules_test.dart': '''import 'dart:convert';
+import 'dart:io';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/core/error/failures.dart';
+import 'package:robot_flower_princess_front/domain/entities/cell.dart';
+import 'package:robot_flower_princess_front/domain/entities/game.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
+import 'package:robot_flower_princess_front/domain/entities/robot.dart';
+import 'package:robot_flower_princess_front/domain/services/game_rules.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_type.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/cell_type.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/direction.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/game_status.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/position.dart';
+
+// Shared with robot_flower_engine.py through robot_flower_fixtures.py.
+const _fixtures = 'test/fixtures';
+final _missing = !File('$_fixtures/manifest.json').existsSync()
+    ? 'Run robot_flower_fixtures.py to generate test/fixtures'
+    : null;
+
+// 3x3 board, robot at (1, 1):
+//   E F E
+//   O R E
+//   E E P
+GameBoard _board({int flowersHeld = 0}) {
+  const layout = [
+    [CellType.empty, CellType.flower, CellType.empty],
+    [CellType.obstacle, CellType.robot, CellType.empty],
+    [CellType.empty, CellType.empty, CellType.princess],
+  ];
+  return GameBoard(
+    width: 3,
+    height: 3,
+    cells: [
+      for (var y = 0; y < 3; y++)
+        for (var x = 0; x < 3; x++)
+          Cell(position: Position(x: x, y: y), type: layout[y][x]),
+    ],
+    robot: Robot(
+      position: const Position(x: 1, y: 1),
+      orientation: Direction.NORTH,
+      flowersHeld: flowersHeld,
+    ),
+    princessPosition: const Position(x: 2, y: 2),
+    totalFlowers: 1,
+  );
+}
+
+void main() {
+  const rules = GameRules();
+
+  GameBoard apply(GameBoard board, ActionType action, Direction direction) {
+    return rules
+        .applyToBoard(board, action, direction)
+        .getOrElse(() => throw StateError('expected a valid action'));
+  }
+
+  group('GameRules', () {
+    test('should rotate the robot', () {
+      final board = apply(_board(), ActionType.rotate, Direction.WEST);
+
+      expect(board.robot.orientation, Direction.WEST);
+      expect(board.robot.position, const Position(x: 1, y: 1));
+    });
+
+    test('should move the robot onto an empty cell', () {
+      final board = apply(_board(), ActionType.move, Direction.EAST);
+
+      expect(board.robot.position, const Position(x: 2, y: 1));
+      expect(board.robot.orientation, Direction.EAST);
+      expect(board.getCellAt(const Position(x: 1, y: 1))!.type, CellType.empty);
+      expect(board.getCellAt(const Position(x: 2, y: 1))!.type, CellType.robot);
+    });
+
+    test('should reject moves into obstacles, flowers or off the board', () {
+      final board = _board();
+
+      for (final direction in [Direction.WEST, Direction.NORTH]) {
+        expect(
+          rules.applyToBoard(board, ActionType.move, direction).isLeft(),
+          true,
+        );
+      }
+      final corner = apply(board, ActionType.move, Direction.EAST);
+      expect(
+        rules.applyToBoard(corner, ActionType.move, Direction.EAST).isLeft(),
+        true,
+      );
+    });
+
+    test('should pick a flower', () {
+      final board = apply(_board(), ActionType.pickFlower, Direction.NORTH);
+
+      expect(board.robot.flowersHeld, 1);
+      expect(board.getCellAt(const Position(x: 1, y: 0))!.type, CellType.empty);
+    });
+
+    test('should drop a flower on an empty cell', () {
+      final board = apply(
+        _board(flowersHeld: 1),
+        ActionType.dropFlower,
+        Direction.SOUTH,
+      );
+
+      expect(board.robot.flowersHeld, 0);
+      expect(board.getCellAt(const Position(x: 1, y: 2))!.type, CellType.flower);
+    });
+
+    test('should clean an obstacle', () {
+      final board = apply(_board(), ActionType.clean, Direction.WEST);
+
+      expect(board.getCellAt(const Position(x: 0, y: 1))!.type, CellType.empty);
+    });
+
+    test('should give flowers to the adjacent princess and win', () {
+      final moved = apply(
+        _board(flowersHeld: 1),
+        ActionType.move,
+        Direction.EAST,
+      );
+      final game = Game(
+        id: '1',
+        name: 'Rules',
+        board: moved,
+        status: GameStatus.playing,
+        createdAt: DateTime(2024, 1, 1),
+      );
+
+      final result = rules.apply(game, ActionType.giveFlower, Direction.SOUTH);
+      final won = result.getOrElse(() => game);
+
+      expect(won.board.flowersDelivered, 1);
+      expect(won.board.robot.flowersHeld, 0);
+      expect(won.status, GameStatus.won);
+      expect(won.actions.length, 1);
+    });
+
+    test('should return GameOverFailure for invalid actions', () {
+      final result = rules.applyToBoard(
+        _board(),
+        ActionType.giveFlower,
+        Direction.SOUTH,
+      );
+
+      expect(result.fold((f) => f, (_) => null), isA<GameOverFailure>());
+    });
+
+    test('should end the game and record an invalid action', () {
+      final board = _board();
+      final game = Game(
+        id: '1',
+        name: 'Rules',
+        board: board,
+        status: GameStatus.playing,
+        createdAt: DateTime(2024, 1, 1),
+      );
+
+      final result = rules.apply(game, ActionType.giveFlower, Direction.SOUTH);
+      final over = result.getOrElse(() => throw StateError('expected a game'));
+
+      expect(over.status, GameStatus.gameOver);
+      expect(over.board, board);
+      expect(over.actions.single.success, false);
+      expect(over.actions.single.errorMessage, 'Robot has no flower to give');
+    });
+
+    for (final encoding in ['', '.compact']) {
+      test('should match the engine on rules/invalid_action$encoding', () {
+        final json = jsonDecode(
+          File('$_fixtures/rules/invalid_action$encoding.json').readAsStringSync(),
+        ) as Map<String, dynamic>;
+        final game = Game.fromJson(json['game'] as Map<String, dynamic>);
+        final action = json['action'] as Map<String, dynamic>;
+        final expected = Game.fromJson(json['expected'] as Map<String, dynamic>);
+
+        final result = rules.apply(
+          game,
+          ActionType.fromName(action['type'] as String),
+          Direction.fromName(action['direction'] as String),
+        );
+        final over = result.getOrElse(() => throw StateError('expected a game'));
+
+        expect(over.status, expected.status);
+        expect(over.board, expected.board);
+        expect(over.actions.length, expected.actions.length);
+        expect(over.actions.last.type, expected.actions.last.type);
+        expect(over.actions.last.direction, expected.actions.last.direction);
+        expect(over.actions.last.success, expected.actions.last.success);
+        expect(over.actions.last.errorMessage, expected.actions.last.errorMessage);
+      }, skip: _missing);
+    }
+
+    test('should refuse actions on a finished game', () {
+      final game = Game(
+        id: '1',
+        name: 'Rules',
+        board: _board(),
+        status: GameStatus.gameOver,
+        createdAt: DateTime(2024, 1, 1),
+      );
+
+      expect(rules.apply(game, ActionType.rotate, Direction.EAST).isLeft(), true);
+    });
   });
 }
 ''',
@@ -393,6 +1052,22 @@ void main() {
       expect(Direction.SOUTH.icon, '⬇️');
       expect(Direction.WEST.icon, '⬅️');
     });
+
+    test('should expose grid offsets', () {
+      expect([Direction.NORTH.dx, Direction.NORTH.dy], [0, -1]);
+      expect([Direction.EAST.dx, Direction.EAST.dy], [1, 0]);
+      expect([Direction.SOUTH.dx, Direction.SOUTH.dy], [0, 1]);
+      expect([Direction.WEST.dx, Direction.WEST.dy], [-1, 0]);
+    });
+
+    test('should resolve directions from their wire names', () {
+      expect(Direction.fromName('NORTH'), Direction.NORTH);
+      expect(Direction.fromName('WEST'), Direction.WEST);
+    });
+
+    test('should reject unknown direction names', () {
+      expect(() => Direction.fromName('UP'), throwsFormatException);
+    });
   });
 }
 ''',
@@ -420,6 +1095,15 @@ void main() {
       expect(GameStatus.won.isFinished, true);
       expect(GameStatus.gameOver.isFinished, true);
     });
+
+    test('should resolve statuses from their wire names', () {
+      expect(GameStatus.fromName('playing'), GameStatus.playing);
+      expect(GameStatus.fromName('gameOver'), GameStatus.gameOver);
+    });
+
+    test('should reject unknown status names', () {
+      expect(() => GameStatus.fromName('paused'), throwsFormatException);
+    });
   });
 }
 ''',
@@ -628,6 +1312,191 @@ void main() {
     });
   });
 }
+''',
+
+        'test/unit/domain/use_cases/get_game_summaries_impl_test.dart': '''import 'package:dartz/dartz.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:mockito/annotations.dart';
+import 'package:mockito/mockito.dart';
+import 'package:robot_flower_princess_front/core/constants/app_constants.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_summary.dart';
+import 'package:robot_flower_princess_front/domain/ports/outbound/game_repository.dart';
+import 'package:robot_flower_princess_front/domain/use_cases/get_game_summaries_impl.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/game_status.dart';
+
+@GenerateMocks([GameRepository])
+import 'get_game_summaries_impl_test.mocks.dart';
+
+void main() {
+  late GetGameSummariesImpl useCase;
+  late MockGameRepository mockRepository;
+
+  setUp(() {
+    mockRepository = MockGameRepository();
+    useCase = GetGameSummariesImpl(mockRepository);
+  });
+
+  final testPage = GameSummaryPage(
+    items: [
+      GameSummary(
+        id: '2',
+        name: 'Game 2',
+        status: GameStatus.won,
+        boardWidth: 10,
+        boardHeight: 10,
+        totalFlowers: 5,
+        flowersDelivered: 5,
+        actionCount: 42,
+        createdAt: DateTime(2024, 1, 2),
+      ),
+    ],
+    nextCursor: 'abc',
+  );
+
+  group('GetGameSummariesImpl', () {
+    test('should request the first page with the default page size', () async {
+      when(mockRepository.getGameSummaries(
+              cursor: anyNamed('cursor'), limit: anyNamed('limit')))
+          .thenAnswer((_) async => Right(testPage));
+
+      final result = await useCase();
+
+      expect(result, Right(testPage));
+      verify(mockRepository.getGameSummaries(
+          cursor: null, limit: AppConstants.gamesPageSize));
+    });
+
+    test('should pass the cursor of the next page', () async {
+      when(mockRepository.getGameSummaries(
+              cursor: anyNamed('cursor'), limit: anyNamed('limit')))
+          .thenAnswer((_) async => const Right(GameSummaryPage(items: [])));
+
+      final result = await useCase(cursor: 'abc', limit: 5);
+
+      expect((result as Right).value.hasMore, false);
+      verify(mockRepository.getGameSummaries(cursor: 'abc', limit: 5));
+    });
+
+    test('should reject page sizes out of range', () async {
+      final tooSmall = await useCase(limit: 0);
+      final tooLarge = await useCase(limit: AppConstants.maxGamesPageSize + 1);
+
+      expect(tooSmall.isLeft(), true);
+      expect(tooLarge.isLeft(), true);
+      verifyZeroInteractions(mockRepository);
+    });
+  });
+
+  group('GameSummary', () {
+    test('should round-trip through JSON', () {
+      final summary = testPage.items.first;
+
+      expect(GameSummary.fromJson(summary.toJson()), summary);
+    });
+
+    test('should parse a page without a next cursor', () {
+      final page = GameSummaryPage.fromJson({
+        'items': [testPage.items.first.toJson()],
+        'nextCursor': null,
+      });
+
+      expect(page.items.length, 1);
+      expect(page.hasMore, false);
+    });
+  });
+}
+''',
+
+        'test/unit/domain/use_cases/execute_actions_impl_test.dart': '''import 'package:dartz/dartz.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:mockito/annotations.dart';
+import 'package:mockito/mockito.dart';
+import 'package:robot_flower_princess_front/core/constants/app_constants.dart';
+import 'package:robot_flower_princess_front/core/error/failures.dart';
+import 'package:robot_flower_princess_front/domain/entities/game.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
+import 'package:robot_flower_princess_front/domain/entities/robot.dart';
+import 'package:robot_flower_princess_front/domain/ports/outbound/game_repository.dart';
+import 'package:robot_flower_princess_front/domain/use_cases/execute_actions_impl.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_command.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_type.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/direction.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/game_status.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/position.dart';
+
+@GenerateMocks([GameRepository])
+import 'execute_actions_impl_test.mocks.dart';
+
+void main() {
+  late ExecuteActionsImpl useCase;
+  late MockGameRepository mockRepository;
+
+  setUp(() {
+    mockRepository = MockGameRepository();
+    useCase = ExecuteActionsImpl(mockRepository);
+  });
+
+  final testGame = Game(
+    id: 'game-123',
+    name: 'Test Game',
+    board: const GameBoard(
+      width: 5,
+      height: 5,
+      cells: [],
+      robot: Robot(
+        position: Position(x: 1, y: 1),
+        orientation: Direction.NORTH,
+      ),
+      princessPosition: Position(x: 4, y: 4),
+      totalFlowers: 3,
+    ),
+    status: GameStatus.playing,
+    createdAt: DateTime.now(),
+  );
+
+  const actions = [
+    ActionCommand(ActionType.rotate, Direction.EAST),
+    ActionCommand(ActionType.move, Direction.EAST),
+  ];
+
+  group('ExecuteActionsImpl', () {
+    test('should send the batch to the repository', () async {
+      when(mockRepository.executeActions(any, any))
+          .thenAnswer((_) async => Right(testGame));
+
+      final result = await useCase('game-123', actions);
+
+      expect(result, Right(testGame));
+      verify(mockRepository.executeActions('game-123', actions));
+    });
+
+    test('should return ValidationFailure for an empty batch', () async {
+      final result = await useCase('game-123', const []);
+
+      expect(result, const Left(ValidationFailure('A batch holds 1 to 50 actions')));
+      verifyNever(mockRepository.executeActions(any, any));
+    });
+
+    test('should return ValidationFailure above maxActionBatch', () async {
+      final tooMany = List.filled(
+        AppConstants.maxActionBatch + 1,
+        const ActionCommand(ActionType.rotate, Direction.EAST),
+      );
+
+      final result = await useCase('game-123', tooMany);
+
+      expect(result, const Left(ValidationFailure('A batch holds 1 to 50 actions')));
+      verifyNever(mockRepository.executeActions(any, any));
+    });
+
+    test('should return ValidationFailure when gameId is empty', () async {
+      final result = await useCase('', actions);
+
+      expect(result, const Left(ValidationFailure('Game ID cannot be empty')));
+      verifyNever(mockRepository.executeActions(any, any));
+    });
+  });
+}
 ''',
 
         'test/unit/domain/use_cases/execute_action_impl_test.dart': '''import 'package:dartz/dartz.dart';
@@ -774,9 +1643,12 @@ def main():
 
     print(f"✅ Part 2B packaged as {zip_filename}")
     print("\n📦 Part 2B Complete!")
-    print("   ✅ Entity tests (Robot, GameBoard, Game)")
+    print("   ✅ Entity tests (Robot, GameBoard, ChunkedCells, Game)")
+    print("   ✅ GameBoard.fromJson benchmark (50x50 board)")
+    print("   ✅ Fixture benchmarks (run robot_flower_fixtures.py for test/fixtures)")
     print("   ✅ Value object tests (Position, Direction, GameStatus)")
-    print("   ✅ Use case tests (CreateGame, GetGames, ExecuteAction)")
+    print("   ✅ Use case tests (CreateGame, GetGames, GetGameSummaries, ExecuteAction, ExecuteActions)")
+    print("   ✅ Service tests (GameRules)")
     print("   ✅ Mock files for testing")
     print("\n📝 Note: Run 'flutter pub run build_runner build' to generate mock files")
 
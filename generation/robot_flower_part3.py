@@ -29,14 +29,18 @@ class GameModel extends Game {
     super.updatedAt,
   });
 
+  /// Decodes the plain and the compact wire encoding (see WireFormat):
+  /// compact games have a compact board and actions as arrays.
   factory GameModel.fromJson(Map<String, dynamic> json) {
     return GameModel(
       id: json['id'] as String,
       name: json['name'] as String,
       board: GameBoard.fromJson(json['board'] as Map<String, dynamic>),
-      status: GameStatus.values.firstWhere((e) => e.name == json['status']),
+      status: GameStatus.fromName(json['status'] as String),
       actions: (json['actions'] as List?)
-              ?.map((a) => GameAction.fromJson(a as Map<String, dynamic>))
+              ?.map((a) => a is List
+                  ? GameAction.fromCompactJson(a)
+                  : GameAction.fromJson(a as Map<String, dynamic>))
               .toList() ??
           [],
       createdAt: DateTime.parse(json['createdAt'] as String),
@@ -74,31 +78,66 @@ class GameModel extends Game {
 ''',
 
         # Data Sources
-        'lib/data/datasources/game_remote_datasource.dart': '''import 'package:dio/dio.dart';
+        'lib/data/datasources/game_remote_datasource.dart': '''import 'dart:async';
+import 'dart:convert';
+
+import 'package:dio/dio.dart';
+import 'package:web_socket_channel/web_socket_channel.dart';
 import '../../core/constants/api_endpoints.dart';
+import '../../core/constants/app_constants.dart';
 import '../../core/error/exceptions.dart';
 import '../../core/network/api_client.dart';
+import '../../core/network/network_metrics.dart';
+import '../../core/network/single_flight.dart';
+import '../../domain/entities/game_event.dart';
+import '../../domain/entities/game_summary.dart';
+import '../../domain/value_objects/action_command.dart';
 import '../../domain/value_objects/action_type.dart';
 import '../../domain/value_objects/direction.dart';
 import '../models/game_model.dart';
 
 abstract class GameRemoteDataSource {
   Future<GameModel> createGame(String name, int boardSize);
-  Future<List<GameModel>> getGames();
+  Future<List<GameModel>> getGames({int limit = AppConstants.gamesListLimit});
+  Future<GameSummaryPage> getGameSummaries({String? cursor, required int limit});
   Future<GameModel> getGame(String gameId);
   Future<GameModel> executeAction(
     String gameId,
     ActionType action,
     Direction direction,
   );
-  Future<GameModel> autoPlay(String gameId);
+  Future<GameModel> executeActions(String gameId, List<ActionCommand> actions);
+  Future<GameModel> autoPlay(String gameId, {bool stream = false});
   Future<List<Map<String, dynamic>>> replayGame(String gameId);
+  Stream<GameEvent> watchGame(String gameId);
 }
 
+/// Identical concurrent GETs share one request (refresh, retry and
+/// initState firing together), and actions and autoplay run one at a time
+/// per game, so the server sees them in the order the user made them.
+/// Opening a game is a hedged GET (see ApiClient.getHedged).
+///
+/// [watchGame] decodes the game's WebSocket stream; the socket is closed
+/// when the subscription is cancelled.
+///
+/// With [metrics], the time spent building models from each response body
+/// is recorded next to the client's network and parse times.
 class GameRemoteDataSourceImpl implements GameRemoteDataSource {
   final ApiClient client;
-
-  GameRemoteDataSourceImpl(this.client);
+  final NetworkMetrics? metrics;
+  final SingleFlight _reads = SingleFlight();
+  final KeyedSerialQueue _writes = KeyedSerialQueue();
+
+  GameRemoteDataSourceImpl(this.client, {this.metrics});
+
+  T _decode<T>(Response response, T Function(dynamic data) build) {
+    final metrics = this.metrics;
+    if (metrics == null) return build(response.data);
+    final stopwatch = Stopwatch()..start();
+    final value = build(response.data);
+    metrics.recordBuild(response.requestOptions, stopwatch.elapsed);
+    return value;
+  }
 
   @override
   Future<GameModel> createGame(String name, int boardSize) async {
@@ -110,33 +149,74 @@ class GameRemoteDataSourceImpl implements GameRemoteDataSource {
           'boardSize': boardSize,
         },
       );
-      return GameModel.fromJson(response.data as Map<String, dynamic>);
+      return _decode(
+        response,
+        (data) => GameModel.fromJson(data as Map<String, dynamic>),
+      );
     } on DioException catch (e) {
       throw _handleDioError(e);
     }
   }
 
   @override
-  Future<List<GameModel>> getGames() async {
-    try {
-      final response = await client.get(ApiEndpoints.games);
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
-          .map((json) => GameModel.fromJson(json as Map<String, dynamic>))
-          .toList();
-    } on DioException catch (e) {
-      throw _handleDioError(e);
-    }
+  Future<List<GameModel>> getGames({int limit = AppConstants.gamesListLimit}) {
+    return _reads.run('GET ${ApiEndpoints.games}?limit=$limit', () async {
+      try {
+        final response = await client.get(
+          ApiEndpoints.games,
+          queryParameters: {'limit': limit},
+        );
+        return _decode(
+          response,
+          (data) => (data as List<dynamic>)
+              .map((json) => GameModel.fromJson(json as Map<String, dynamic>))
+              .toList(),
+        );
+      } on DioException catch (e) {
+        throw _handleDioError(e);
+      }
+    });
   }
 
   @override
-  Future<GameModel> getGame(String gameId) async {
-    try {
-      final response = await client.get(ApiEndpoints.game(gameId));
-      return GameModel.fromJson(response.data as Map<String, dynamic>);
-    } on DioException catch (e) {
-      throw _handleDioError(e);
-    }
+  Future<GameSummaryPage> getGameSummaries({
+    String? cursor,
+    required int limit,
+  }) {
+    final key = 'GET ${ApiEndpoints.games}?view=summary&limit=$limit&cursor=$cursor';
+    return _reads.run(key, () async {
+      try {
+        final response = await client.get(
+          ApiEndpoints.games,
+          queryParameters: {
+            'view': 'summary',
+            'limit': limit,
+            if (cursor != null) 'cursor': cursor,
+          },
+        );
+        return _decode(
+          response,
+          (data) => GameSummaryPage.fromJson(data as Map<String, dynamic>),
+        );
+      } on DioException catch (e) {
+        throw _handleDioError(e);
+      }
+    });
+  }
+
+  @override
+  Future<GameModel> getGame(String gameId) {
+    return _reads.run('GET ${ApiEndpoints.game(gameId)}', () async {
+      try {
+        final response = await client.getHedged(ApiEndpoints.game(gameId));
+        return _decode(
+          response,
+          (data) => GameModel.fromJson(data as Map<String, dynamic>),
+        );
+      } on DioException catch (e) {
+        throw _handleDioError(e);
+      }
+    });
   }
 
   @override
@@ -144,40 +224,111 @@ class GameRemoteDataSourceImpl implements GameRemoteDataSource {
     String gameId,
     ActionType action,
     Direction direction,
-  ) async {
-    try {
-      final response = await client.post(
-        ApiEndpoints.gameAction(gameId),
-        data: {
-          'action': action.name,
-          'direction': direction.name,
-        },
-      );
-      return GameModel.fromJson(response.data as Map<String, dynamic>);
-    } on DioException catch (e) {
-      throw _handleDioError(e);
-    }
+  ) {
+    return _writes.run(gameId, () async {
+      try {
+        final response = await client.post(
+          ApiEndpoints.gameAction(gameId),
+          data: {
+            'action': action.name,
+            'direction': direction.name,
+          },
+        );
+        return _decode(
+          response,
+          (data) => GameModel.fromJson(data as Map<String, dynamic>),
+        );
+      } on DioException catch (e) {
+        throw _handleDioError(e);
+      }
+    });
   }
 
   @override
-  Future<GameModel> autoPlay(String gameId) async {
-    try {
-      final response = await client.post(ApiEndpoints.autoPlay(gameId));
-      return GameModel.fromJson(response.data as Map<String, dynamic>);
-    } on DioException catch (e) {
-      throw _handleDioError(e);
-    }
+  Future<GameModel> executeActions(String gameId, List<ActionCommand> actions) {
+    return _writes.run(gameId, () async {
+      try {
+        final response = await client.post(
+          ApiEndpoints.gameActions(gameId),
+          data: {
+            'actions': actions.map((a) => a.toJson()).toList(),
+          },
+        );
+        return _decode(
+          response,
+          (data) => GameModel.fromJson(
+              (data as Map<String, dynamic>)['game'] as Map<String, dynamic>),
+        );
+      } on DioException catch (e) {
+        throw _handleDioError(e);
+      }
+    });
   }
 
   @override
-  Future<List<Map<String, dynamic>>> replayGame(String gameId) async {
-    try {
-      final response = await client.get(ApiEndpoints.replay(gameId));
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data.map((json) => json as Map<String, dynamic>).toList();
-    } on DioException catch (e) {
-      throw _handleDioError(e);
-    }
+  Future<GameModel> autoPlay(String gameId, {bool stream = false}) {
+    return _writes.run(gameId, () async {
+      try {
+        final response = await client.post(
+          ApiEndpoints.autoPlay(gameId, stream: stream),
+          receiveTimeout: stream ? AppConstants.streamedAutoPlayTimeout : null,
+        );
+        return _decode(
+          response,
+          (data) => GameModel.fromJson(data as Map<String, dynamic>),
+        );
+      } on DioException catch (e) {
+        throw _handleDioError(e);
+      }
+    });
+  }
+
+  @override
+  Future<List<Map<String, dynamic>>> replayGame(String gameId) {
+    return _reads.run('GET ${ApiEndpoints.replay(gameId)}', () async {
+      try {
+        final response = await client.get(ApiEndpoints.replay(gameId));
+        return _decode(
+          response,
+          (data) => (data as List<dynamic>)
+              .map((json) => json as Map<String, dynamic>)
+              .toList(),
+        );
+      } on DioException catch (e) {
+        throw _handleDioError(e);
+      }
+    });
+  }
+
+  @override
+  Stream<GameEvent> watchGame(String gameId) {
+    WebSocketChannel? channel;
+    StreamSubscription<dynamic>? subscription;
+    late final StreamController<GameEvent> controller;
+    controller = StreamController<GameEvent>(
+      onListen: () {
+        channel = client.openStream(ApiEndpoints.gameStream(gameId));
+        subscription = channel!.stream.listen(
+          (message) {
+            try {
+              controller.add(GameEvent.fromJson(
+                  jsonDecode(message as String) as Map<String, dynamic>));
+            } on Object {
+              // Bad JSON, a non-object payload or unknown fields alike
+              controller.addError(ServerException('Malformed game event'));
+            }
+          },
+          onError: (Object error) =>
+              controller.addError(NetworkException('Game stream failed: $error')),
+          onDone: controller.close,
+        );
+      },
+      onCancel: () async {
+        await subscription?.cancel();
+        await channel?.sink.close();
+      },
+    );
+    return controller.stream;
   }
 
   Exception _handleDioError(DioException e) {
@@ -187,7 +338,7 @@ class GameRemoteDataSourceImpl implements GameRemoteDataSource {
 
       if (statusCode == 404) {
         return NotFoundException(message);
-      } else if (statusCode == 400) {
+      } else if (statusCode == 400 || statusCode == 409) {
         return ValidationException(message);
       } else if (statusCode == 500) {
         return ServerException(message);
@@ -199,12 +350,17 @@ class GameRemoteDataSourceImpl implements GameRemoteDataSource {
 ''',
 
         # Repository Implementation
-        'lib/data/repositories/game_repository_impl.dart': '''import 'package:dartz/dartz.dart';
+        'lib/data/repositories/game_repository_impl.dart': '''import 'dart:async';
+
+import 'package:dartz/dartz.dart';
 import '../../core/error/exceptions.dart';
 import '../../core/error/failures.dart';
 import '../../domain/entities/game.dart';
 import '../../domain/entities/game_board.dart';
+import '../../domain/entities/game_event.dart';
+import '../../domain/entities/game_summary.dart';
 import '../../domain/ports/outbound/game_repository.dart';
+import '../../domain/value_objects/action_command.dart';
 import '../../domain/value_objects/action_type.dart';
 import '../../domain/value_objects/direction.dart';
 import '../datasources/game_remote_datasource.dart';
@@ -244,6 +400,26 @@ class GameRepositoryImpl implements GameRepository {
     }
   }
 
+  @override
+  Future<Either<Failure, GameSummaryPage>> getGameSummaries({
+    String? cursor,
+    required int limit,
+  }) async {
+    try {
+      return Right(
+        await remoteDataSource.getGameSummaries(cursor: cursor, limit: limit),
+      );
+    } on ValidationException catch (e) {
+      return Left(ValidationFailure(e.message));
+    } on ServerException catch (e) {
+      return Left(ServerFailure(e.message));
+    } on NetworkException catch (e) {
+      return Left(NetworkFailure(e.message));
+    } catch (e) {
+      return Left(ServerFailure(e.toString()));
+    }
+  }
+
   @override
   Future<Either<Failure, Game>> getGame(String gameId) async {
     try {
@@ -287,9 +463,30 @@ class GameRepositoryImpl implements GameRepository {
   }
 
   @override
-  Future<Either<Failure, Game>> autoPlay(String gameId) async {
+  Future<Either<Failure, Game>> executeActions(
+    String gameId,
+    List<ActionCommand> actions,
+  ) async {
     try {
-      final gameModel = await remoteDataSource.autoPlay(gameId);
+      final gameModel = await remoteDataSource.executeActions(gameId, actions);
+      return Right(gameModel.toEntity());
+    } on GameOverException catch (e) {
+      return Left(GameOverFailure(e.message));
+    } on ValidationException catch (e) {
+      return Left(ValidationFailure(e.message));
+    } on ServerException catch (e) {
+      return Left(ServerFailure(e.message));
+    } on NetworkException catch (e) {
+      return Left(NetworkFailure(e.message));
+    } catch (e) {
+      return Left(ServerFailure(e.toString()));
+    }
+  }
+
+  @override
+  Future<Either<Failure, Game>> autoPlay(String gameId, {bool stream = false}) async {
+    try {
+      final gameModel = await remoteDataSource.autoPlay(gameId, stream: stream);
       return Right(gameModel.toEntity());
     } on ServerException catch (e) {
       return Left(ServerFailure(e.message));
@@ -318,31 +515,329 @@ class GameRepositoryImpl implements GameRepository {
       return Left(ServerFailure(e.toString()));
     }
   }
+
+  @override
+  Stream<Either<Failure, GameEvent>> watchGame(String gameId) {
+    return remoteDataSource.watchGame(gameId).transform(
+      StreamTransformer<GameEvent, Either<Failure, GameEvent>>.fromHandlers(
+        handleData: (event, sink) => sink.add(Right(event)),
+        handleError: (error, stackTrace, sink) {
+          if (error is NetworkException) {
+            sink.add(Left(NetworkFailure(error.message)));
+          } else if (error is ServerException) {
+            sink.add(Left(ServerFailure(error.message)));
+          } else {
+            sink.add(Left(ServerFailure(error.toString())));
+          }
+        },
+      ),
+    );
+  }
+}
+''',
+
+        'lib/data/repositories/cached_game_repository.dart': '''import 'dart:collection';
+
+import 'package:dartz/dartz.dart';
+import '../../core/error/failures.dart';
+import '../../domain/entities/game.dart';
+import '../../domain/entities/game_board.dart';
+import '../../domain/entities/game_event.dart';
+import '../../domain/entities/game_summary.dart';
+import '../../domain/ports/outbound/game_repository.dart';
+import '../../domain/value_objects/action_command.dart';
+import '../../domain/value_objects/action_type.dart';
+import '../../domain/value_objects/direction.dart';
+
+/// Hit/miss counters of a [CachedGameRepository].
+class CacheStats {
+  int hits = 0;
+  int misses = 0;
+  int evictions = 0;
+
+  double get hitRate => hits + misses == 0 ? 0 : hits / (hits + misses);
+
+  Map<String, num> toJson() => {
+        'hits': hits,
+        'misses': misses,
+        'evictions': evictions,
+        'hitRate': hitRate,
+      };
+}
+
+class _CacheEntry {
+  _CacheEntry(this.value, this.expiresAt);
+
+  final Object value;
+
+  /// Null for entries that never expire (finished games, their replays).
+  final DateTime? expiresAt;
+}
+
+/// Caching decorator around a [GameRepository].
+///
+/// Successful reads are kept in a bounded LRU with a TTL per method. A
+/// finished game cannot change anymore, so it and its replay are kept until
+/// evicted. executeAction(s) and autoPlay drop the game's entries and store
+/// the game they return; any change drops the cached list and summary pages.
+/// Events of a watched game keep its entry current the same way. Failures
+/// are never cached. User-initiated reloads call [invalidate] or
+/// [invalidateLists] first so they reach the server.
+class CachedGameRepository implements GameRepository {
+  CachedGameRepository(
+    this._inner, {
+    this.maxEntries = 100,
+    this.gameTtl = const Duration(seconds: 30),
+    this.gamesTtl = const Duration(seconds: 10),
+    this.replayTtl = const Duration(seconds: 30),
+    DateTime Function()? clock,
+  }) : _clock = clock ?? DateTime.now;
+
+  final GameRepository _inner;
+  final int maxEntries;
+  final Duration gameTtl;
+  final Duration gamesTtl;
+  final Duration replayTtl;
+  final DateTime Function() _clock;
+
+  final CacheStats stats = CacheStats();
+
+  // LinkedHashMap keeps insertion order: re-inserting on a hit makes the
+  // first key the least recently used.
+  final LinkedHashMap<String, _CacheEntry> _entries = LinkedHashMap();
+
+  /// Ids of finished games, dropped once no entry of the game is left.
+  final Set<String> _finished = {};
+
+  static const _gamesKey = 'games';
+  static const _summariesPrefix = 'summaries:';
+  static String _gameKey(String gameId) => 'game:$gameId';
+  static String _summariesKey(String? cursor, int limit) =>
+      '$_summariesPrefix$limit:${cursor ?? ''}';
+  static String _replayKey(String gameId) => 'replay:$gameId';
+
+  int get length => _entries.length;
+
+  Object? _read(String key) {
+    final entry = _entries.remove(key);
+    final expiresAt = entry?.expiresAt;
+    if (entry == null || (expiresAt != null && !_clock().isBefore(expiresAt))) {
+      if (entry != null) _forget(key, entry.value);
+      stats.misses++;
+      return null;
+    }
+    _entries[key] = entry;
+    stats.hits++;
+    return entry.value;
+  }
+
+  void _write(String key, Object value, Duration? ttl) {
+    _entries.remove(key);
+    _entries[key] = _CacheEntry(value, ttl == null ? null : _clock().add(ttl));
+    while (_entries.length > maxEntries) {
+      _remove(_entries.keys.first);
+      stats.evictions++;
+    }
+  }
+
+  void _remove(String key) {
+    final entry = _entries.remove(key);
+    if (entry != null) _forget(key, entry.value);
+  }
+
+  /// Forgets the finished games a removed entry was about, unless their
+  /// game or replay entry is still cached.
+  void _forget(String key, Object value) {
+    final ids = switch (value) {
+      List<Game> games => games.map((game) => game.id),
+      GameSummaryPage(:final items) => items.map((summary) => summary.id),
+      _ => [key.substring(key.indexOf(':') + 1)],
+    };
+    _finished.removeAll(ids.where((id) =>
+        !_entries.containsKey(_gameKey(id)) &&
+        !_entries.containsKey(_replayKey(id))));
+  }
+
+  void _storeGame(Game game) {
+    if (game.status.isFinished) _finished.add(game.id);
+    _write(_gameKey(game.id), game, game.status.isFinished ? null : gameTtl);
+  }
+
+  /// Drops everything cached about a game and the lists it appears in.
+  void invalidate(String gameId) {
+    _remove(_gameKey(gameId));
+    _remove(_replayKey(gameId));
+    invalidateLists();
+  }
+
+  /// Drops the cached list and summary pages.
+  void invalidateLists() {
+    _remove(_gamesKey);
+    _entries.keys
+        .where((key) => key.startsWith(_summariesPrefix))
+        .toList()
+        .forEach(_remove);
+  }
+
+  void clear() {
+    _entries.clear();
+    _finished.clear();
+  }
+
+  @override
+  Future<Either<Failure, Game>> createGame(String name, int boardSize) async {
+    final result = await _inner.createGame(name, boardSize);
+    invalidateLists();
+    result.fold((_) {}, _storeGame);
+    return result;
+  }
+
+  @override
+  Future<Either<Failure, List<Game>>> getGames() async {
+    final cached = _read(_gamesKey);
+    if (cached != null) return Right(cached as List<Game>);
+    final result = await _inner.getGames();
+    result.fold((_) {}, (games) {
+      _write(_gamesKey, games, gamesTtl);
+      for (final game in games) {
+        if (game.status.isFinished) _finished.add(game.id);
+      }
+    });
+    return result;
+  }
+
+  @override
+  Future<Either<Failure, GameSummaryPage>> getGameSummaries({
+    String? cursor,
+    required int limit,
+  }) async {
+    final key = _summariesKey(cursor, limit);
+    final cached = _read(key);
+    if (cached != null) return Right(cached as GameSummaryPage);
+    final result = await _inner.getGameSummaries(cursor: cursor, limit: limit);
+    result.fold((_) {}, (page) {
+      _write(key, page, gamesTtl);
+      for (final summary in page.items) {
+        if (summary.status.isFinished) _finished.add(summary.id);
+      }
+    });
+    return result;
+  }
+
+  @override
+  Future<Either<Failure, Game>> getGame(String gameId) async {
+    final cached = _read(_gameKey(gameId));
+    if (cached != null) return Right(cached as Game);
+    final result = await _inner.getGame(gameId);
+    result.fold((_) {}, _storeGame);
+    return result;
+  }
+
+  @override
+  Future<Either<Failure, Game>> executeAction(
+    String gameId,
+    ActionType action,
+    Direction direction,
+  ) async {
+    invalidate(gameId);
+    final result = await _inner.executeAction(gameId, action, direction);
+    result.fold((_) {}, _storeGame);
+    return result;
+  }
+
+  @override
+  Future<Either<Failure, Game>> executeActions(
+    String gameId,
+    List<ActionCommand> actions,
+  ) async {
+    invalidate(gameId);
+    final result = await _inner.executeActions(gameId, actions);
+    result.fold((_) {}, _storeGame);
+    return result;
+  }
+
+  @override
+  Future<Either<Failure, Game>> autoPlay(String gameId, {bool stream = false}) async {
+    invalidate(gameId);
+    final result = await _inner.autoPlay(gameId, stream: stream);
+    result.fold((_) {}, _storeGame);
+    return result;
+  }
+
+  @override
+  Future<Either<Failure, List<GameBoard>>> replayGame(String gameId) async {
+    final cached = _read(_replayKey(gameId));
+    if (cached != null) return Right(cached as List<GameBoard>);
+    final result = await _inner.replayGame(gameId);
+    result.fold((_) {}, (boards) {
+      _write(_replayKey(gameId), boards,
+          _finished.contains(gameId) ? null : replayTtl);
+    });
+    return result;
+  }
+
+  @override
+  Stream<Either<Failure, GameEvent>> watchGame(String gameId) {
+    return _inner.watchGame(gameId).map((result) {
+      result.fold((_) {}, (event) {
+        switch (event) {
+          case GameSnapshot(:final game):
+            invalidate(gameId);
+            _storeGame(game);
+          case final GameStep step:
+            final cached = _entries[_gameKey(gameId)]?.value as Game?;
+            invalidate(gameId);
+            if (cached != null && step.follows(cached)) {
+              _storeGame(step.applyTo(cached));
+            }
+        }
+      });
+      return result;
+    });
+  }
 }
 ''',
 
         # Providers
         'lib/presentation/providers/game_provider.dart': '''import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../../core/network/api_client.dart';
+import '../../core/network/network_metrics.dart';
 import '../../data/datasources/game_remote_datasource.dart';
+import '../../data/repositories/cached_game_repository.dart';
 import '../../data/repositories/game_repository_impl.dart';
 import '../../domain/ports/outbound/game_repository.dart';
 import '../../domain/use_cases/create_game_impl.dart';
 import '../../domain/use_cases/get_games_impl.dart';
+import '../../domain/use_cases/get_game_summaries_impl.dart';
 import '../../domain/use_cases/get_game_impl.dart';
 import '../../domain/use_cases/execute_action_impl.dart';
+import '../../domain/use_cases/execute_actions_impl.dart';
 import '../../domain/use_cases/auto_play_impl.dart';
 import '../../domain/use_cases/replay_game_impl.dart';
+import '../../domain/use_cases/watch_game_impl.dart';
 
 // Infrastructure
-final apiClientProvider = Provider<ApiClient>((ref) => ApiClient());
+final networkMetricsProvider = Provider<NetworkMetrics>((ref) => NetworkMetrics());
+
+final apiClientProvider = Provider<ApiClient>(
+  (ref) => ApiClient(metrics: ref.watch(networkMetricsProvider)),
+);
 
 final gameRemoteDataSourceProvider = Provider<GameRemoteDataSource>(
-  (ref) => GameRemoteDataSourceImpl(ref.watch(apiClientProvider)),
+  (ref) => GameRemoteDataSourceImpl(
+    ref.watch(apiClientProvider),
+    metrics: ref.watch(networkMetricsProvider),
+  ),
+);
+
+final cachedGameRepositoryProvider = Provider<CachedGameRepository>(
+  (ref) => CachedGameRepository(
+    GameRepositoryImpl(ref.watch(gameRemoteDataSourceProvider)),
+  ),
 );
 
 final gameRepositoryProvider = Provider<GameRepository>(
-  (ref) => GameRepositoryImpl(ref.watch(gameRemoteDataSourceProvider)),
+  (ref) => ref.watch(cachedGameRepositoryProvider),
 );
 
 // Use Cases
@@ -354,6 +849,10 @@ final getGamesUseCaseProvider = Provider(
   (ref) => GetGamesImpl(ref.watch(gameRepositoryProvider)),
 );
 
+final getGameSummariesUseCaseProvider = Provider(
+  (ref) => GetGameSummariesImpl(ref.watch(gameRepositoryProvider)),
+);
+
 final getGameUseCaseProvider = Provider(
   (ref) => GetGameImpl(ref.watch(gameRepositoryProvider)),
 );
@@ -362,6 +861,10 @@ final executeActionUseCaseProvider = Provider(
   (ref) => ExecuteActionImpl(ref.watch(gameRepositoryProvider)),
 );
 
+final executeActionsUseCaseProvider = Provider(
+  (ref) => ExecuteActionsImpl(ref.watch(gameRepositoryProvider)),
+);
+
 final autoPlayUseCaseProvider = Provider(
   (ref) => AutoPlayImpl(ref.watch(gameRepositoryProvider)),
 );
@@ -369,92 +872,390 @@ final autoPlayUseCaseProvider = Provider(
 final replayGameUseCaseProvider = Provider(
   (ref) => ReplayGameImpl(ref.watch(gameRepositoryProvider)),
 );
+
+final watchGameUseCaseProvider = Provider(
+  (ref) => WatchGameImpl(ref.watch(gameRepositoryProvider)),
+);
 ''',
 
         'lib/presentation/providers/games_list_provider.dart': '''import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../../domain/entities/game.dart';
+import '../../domain/entities/game_summary.dart';
 import 'game_provider.dart';
 
-class GamesListNotifier extends StateNotifier<AsyncValue<List<Game>>> {
-  GamesListNotifier(this._getGamesUseCase) : super(const AsyncValue.loading());
+/// Loaded pages of the games list.
+class GamesListState {
+  const GamesListState({
+    this.games = const [],
+    this.nextCursor,
+    this.isLoadingMore = false,
+    this.loadMoreError,
+  });
+
+  final List<GameSummary> games;
+  final String? nextCursor;
+  final bool isLoadingMore;
 
-  final dynamic _getGamesUseCase;
+  /// Failure of the last [GamesListNotifier.loadMore]; the loaded pages stay.
+  final String? loadMoreError;
+
+  bool get hasMore => nextCursor != null;
+}
 
-  Future<void> loadGames() async {
+/// Games list with cursor pagination: [loadGames] fetches the first page,
+/// [loadMore] appends the next one as the list scrolls.
+class GamesListNotifier extends StateNotifier<AsyncValue<GamesListState>> {
+  GamesListNotifier(
+    this._getGameSummariesUseCase, {
+    void Function()? invalidateCache,
+  })  : _invalidateCache = invalidateCache,
+        super(const AsyncValue.loading());
+
+  final dynamic _getGameSummariesUseCase;
+  final void Function()? _invalidateCache;
+
+  /// Bumped by [loadGames] so pages of a previous listing are dropped.
+  int _generation = 0;
+
+  /// A [refresh] (pull to refresh, the refresh button) skips cached pages.
+  Future<void> loadGames({bool refresh = false}) async {
+    if (refresh) _invalidateCache?.call();
+    final generation = ++_generation;
     state = const AsyncValue.loading();
-    final result = await _getGamesUseCase();
+    final result = await _getGameSummariesUseCase();
+    if (generation != _generation) return;
     result.fold(
       (failure) => state = AsyncValue.error(failure.message, StackTrace.current),
-      (games) => state = AsyncValue.data(games),
+      (page) => state = AsyncValue.data(
+        GamesListState(games: page.items, nextCursor: page.nextCursor),
+      ),
+    );
+  }
+
+  Future<void> loadMore() async {
+    final current = state.value;
+    if (current == null || !current.hasMore || current.isLoadingMore) return;
+
+    final generation = _generation;
+    state = AsyncValue.data(GamesListState(
+      games: current.games,
+      nextCursor: current.nextCursor,
+      isLoadingMore: true,
+    ));
+    final result = await _getGameSummariesUseCase(cursor: current.nextCursor);
+    if (generation != _generation) return;
+    final latest = state.value ?? current;
+    result.fold(
+      (failure) => state = AsyncValue.data(GamesListState(
+        games: latest.games,
+        nextCursor: current.nextCursor,
+        loadMoreError: failure.message,
+      )),
+      (page) {
+        // A game created meanwhile may already be listed
+        final known = latest.games.map((game) => game.id).toSet();
+        state = AsyncValue.data(GamesListState(
+          games: [
+            ...latest.games,
+            ...page.items.where((game) => !known.contains(game.id)),
+          ],
+          nextCursor: page.nextCursor,
+        ));
+      },
     );
   }
 
   void addGame(Game game) {
-    state.whenData((games) {
-      state = AsyncValue.data([game, ...games]);
+    state.whenData((current) {
+      state = AsyncValue.data(GamesListState(
+        games: [GameSummary.fromGame(game), ...current.games],
+        nextCursor: current.nextCursor,
+        isLoadingMore: current.isLoadingMore,
+        loadMoreError: current.loadMoreError,
+      ));
     });
   }
 }
 
 final gamesListProvider =
-    StateNotifierProvider<GamesListNotifier, AsyncValue<List<Game>>>((ref) {
-  return GamesListNotifier(ref.watch(getGamesUseCaseProvider));
+    StateNotifierProvider<GamesListNotifier, AsyncValue<GamesListState>>((ref) {
+  return GamesListNotifier(
+    ref.watch(getGameSummariesUseCaseProvider),
+    invalidateCache: ref.watch(cachedGameRepositoryProvider).invalidateLists,
+  );
 });
 ''',
 
-        'lib/presentation/providers/current_game_provider.dart': '''import 'package:flutter_riverpod/flutter_riverpod.dart';
+        'lib/presentation/providers/current_game_provider.dart': '''import 'dart:async';
+
+import 'dart:math';
+
+import 'package:flutter_riverpod/flutter_riverpod.dart';
+import '../../core/constants/app_constants.dart';
 import '../../domain/entities/game.dart';
+import '../../domain/entities/game_event.dart';
+import '../../domain/services/game_rules.dart';
+import '../../domain/value_objects/action_command.dart';
 import '../../domain/value_objects/action_type.dart';
 import '../../domain/value_objects/direction.dart';
 import 'game_provider.dart';
 
+class _PendingAction {
+  _PendingAction(this.command);
+
+  final ActionCommand command;
+
+  /// Completes once the server has answered for this action.
+  final Completer<void> done = Completer<void>();
+}
+
+/// The open game.
+///
+/// Given a watch use case, the loaded game follows its stream: moves
+/// made by other viewers show up as they happen, and autoplay runs on the
+/// server step by step instead of swapping in the final state at the end.
 class CurrentGameNotifier extends StateNotifier<AsyncValue<Game?>> {
   CurrentGameNotifier(
     this._getGameUseCase,
     this._executeActionUseCase,
-    this._autoPlayUseCase,
-  ) : super(const AsyncValue.data(null));
+    this._executeActionsUseCase,
+    this._autoPlayUseCase, {
+    GameRules rules = const GameRules(),
+    dynamic watchGameUseCase,
+    void Function(String gameId)? invalidateCache,
+  })  : _rules = rules,
+        _watchGameUseCase = watchGameUseCase,
+        _invalidateCache = invalidateCache,
+        super(const AsyncValue.data(null));
 
   final dynamic _getGameUseCase;
   final dynamic _executeActionUseCase;
+  final dynamic _executeActionsUseCase;
   final dynamic _autoPlayUseCase;
+  final dynamic _watchGameUseCase;
+  final void Function(String gameId)? _invalidateCache;
+  final GameRules _rules;
+
+  StreamSubscription<dynamic>? _events;
+  Timer? _reconnect;
+  String? _watchedId;
+
+  /// Reconnects since the last snapshot; each one doubles the delay.
+  int _reconnects = 0;
+
+  /// Last game state confirmed by the server while actions are pending.
+  Game? _confirmed;
+
+  /// Actions of the request in flight, then the ones queued behind it.
+  List<_PendingAction> _inFlight = const [];
+  final List<_PendingAction> _queued = [];
 
-  Future<void> loadGame(String gameId) async {
+  /// Bumped when the game is cleared or reloaded, so late answers are dropped.
+  int _session = 0;
+
+  /// A [refresh] (the refresh button) skips the cached game.
+  Future<void> loadGame(String gameId, {bool refresh = false}) async {
+    if (refresh) _invalidateCache?.call(gameId);
+    _reset();
+    _unwatch();
+    final session = _session;
     state = const AsyncValue.loading();
     final result = await _getGameUseCase(gameId);
+    if (session != _session) return;
     result.fold(
       (failure) => state = AsyncValue.error(failure.message, StackTrace.current),
-      (game) => state = AsyncValue.data(game),
+      (game) {
+        state = AsyncValue.data(game);
+        _watch(game.id);
+      },
+    );
+  }
+
+  void _watch(String gameId) {
+    final watchGame = _watchGameUseCase;
+    if (watchGame == null) return;
+    _watchedId = gameId;
+    _events = (watchGame(gameId) as Stream<dynamic>).listen(
+      (result) => result.fold((_) {}, _onEvent),
+      onDone: () {
+        if (_watchedId != gameId || !mounted) return;
+        _events = null;
+        final delay = AppConstants.streamReconnectDelay * (1 << min(_reconnects++, 4));
+        _reconnect = Timer(delay, () => _watch(gameId));
+      },
     );
   }
 
-  Future<void> executeAction(ActionType action, Direction direction) async {
+  void _unwatch() {
+    _watchedId = null;
+    _reconnect?.cancel();
+    _reconnect = null;
+    _events?.cancel();
+    _events = null;
+    _reconnects = 0;
+  }
+
+  /// Applies a stream event while no action of ours is in flight; the
+  /// answer to our own request reconciles the game otherwise. A step that
+  /// skips ahead of the shown game means events were missed, so the stream
+  /// is reopened for a fresh snapshot.
+  void _onEvent(GameEvent event) {
+    final current = state.value;
+    if (!mounted || current == null || _inFlight.isNotEmpty || _queued.isNotEmpty) {
+      return;
+    }
+    switch (event) {
+      case GameSnapshot(:final game):
+        _reconnects = 0;
+        if (game != current) state = AsyncValue.data(game);
+      case final GameStep step:
+        if (step.follows(current)) {
+          state = AsyncValue.data(step.applyTo(current));
+        } else if (step.step > current.actions.length) {
+          final gameId = current.id;
+          _unwatch();
+          _watch(gameId);
+        }
+    }
+  }
+
+  /// Applies the action locally right away, then reconciles with the server.
+  ///
+  /// Only one request per game is in flight: actions made meanwhile are
+  /// queued and sent together in one batch when it returns. The server
+  /// response replaces the prediction; on failure the board rolls back to
+  /// the last confirmed state, the queue is dropped and the error is exposed
+  /// alongside it.
+  Future<void> executeAction(ActionType action, Direction direction) {
+    return executeActions([ActionCommand(action, direction)]);
+  }
+
+  /// Queues several actions at once, e.g. a scripted sequence of moves.
+  Future<void> executeActions(List<ActionCommand> actions) {
     final currentGame = state.value;
-    if (currentGame == null) return;
+    if (currentGame == null || actions.isEmpty) return Future.value();
+
+    final pending = actions.map(_PendingAction.new).toList();
+    _confirmed ??= currentGame;
+    _queued.addAll(pending);
+    _showPrediction();
+    _flush(currentGame.id);
+    return pending.last.done.future;
+  }
+
+  Future<void> _flush(String gameId) async {
+    if (_inFlight.isNotEmpty || _queued.isEmpty) return;
+
+    final session = _session;
+    final batch = _queued.take(AppConstants.maxActionBatch).toList();
+    _queued.removeRange(0, batch.length);
+    _inFlight = batch;
+
+    final result = batch.length == 1
+        ? await _executeActionUseCase(
+            gameId,
+            batch.single.command.action,
+            batch.single.command.direction,
+          )
+        : await _executeActionsUseCase(
+            gameId,
+            batch.map((pending) => pending.command).toList(),
+          );
+    _complete(batch);
+    if (session != _session) return;
+    _inFlight = const [];
 
-    state = const AsyncValue.loading();
-    final result = await _executeActionUseCase(currentGame.id, action, direction);
     result.fold(
-      (failure) => state = AsyncValue.error(failure.message, StackTrace.current),
-      (game) => state = AsyncValue.data(game),
+      (failure) {
+        final confirmed = _confirmed;
+        _confirmed = null;
+        _complete(_queued);
+        _queued.clear();
+        state = AsyncValue<Game?>.error(failure.message, StackTrace.current)
+            .copyWithPrevious(AsyncValue.data(confirmed));
+      },
+      (game) {
+        _confirmed = game;
+        if (game.status.isFinished) {
+          // Nothing can follow the end of the game
+          _complete(_queued);
+          _queued.clear();
+        }
+        _showPrediction();
+        if (_queued.isEmpty) {
+          _confirmed = null;
+        } else {
+          _flush(game.id);
+        }
+      },
     );
   }
 
+  /// Shows the confirmed state with every still-pending action applied.
+  void _showPrediction() {
+    final confirmed = _confirmed;
+    if (confirmed == null) return;
+    var predicted = confirmed;
+    for (final pending in [..._inFlight, ..._queued]) {
+      final next = _rules.apply(
+        predicted,
+        pending.command.action,
+        pending.command.direction,
+      );
+      if (next.isLeft()) break;
+      predicted = next.getOrElse(() => predicted);
+    }
+    state = AsyncValue.data(predicted);
+  }
+
+  void _complete(List<_PendingAction> actions) {
+    for (final pending in actions) {
+      if (!pending.done.isCompleted) pending.done.complete();
+    }
+  }
+
+  void _reset() {
+    _session++;
+    _confirmed = null;
+    _complete(_queued);
+    _queued.clear();
+    _inFlight = const [];
+  }
+
+  /// While the game is watched the server streams the steps, which play
+  /// out on the board; otherwise the game loads until the final state.
   Future<void> autoPlay() async {
     final currentGame = state.value;
     if (currentGame == null) return;
 
-    state = const AsyncValue.loading();
-    final result = await _autoPlayUseCase(currentGame.id);
+    final streamed = _events != null;
+    _reset();
+    final session = _session;
+    if (!streamed) state = const AsyncValue.loading();
+    final result = streamed
+        ? await _autoPlayUseCase(currentGame.id, stream: true)
+        : await _autoPlayUseCase(currentGame.id);
+    if (session != _session) return;
     result.fold(
-      (failure) => state = AsyncValue.error(failure.message, StackTrace.current),
+      (failure) => state = streamed
+          ? AsyncValue<Game?>.error(failure.message, StackTrace.current)
+              .copyWithPrevious(AsyncValue.data(state.value))
+          : AsyncValue.error(failure.message, StackTrace.current),
       (game) => state = AsyncValue.data(game),
     );
   }
 
   void clearGame() {
+    _reset();
+    _unwatch();
     state = const AsyncValue.data(null);
   }
+
+  @override
+  void dispose() {
+    _unwatch();
+    super.dispose();
+  }
 }
 
 final currentGameProvider =
@@ -462,7 +1263,11 @@ final currentGameProvider =
   return CurrentGameNotifier(
     ref.watch(getGameUseCaseProvider),
     ref.watch(executeActionUseCaseProvider),
+    ref.watch(executeActionsUseCaseProvider),
     ref.watch(autoPlayUseCaseProvider),
+    watchGameUseCase:
+        AppConstants.gameStreaming ? ref.watch(watchGameUseCaseProvider) : null,
+    invalidateCache: ref.watch(cachedGameRepositoryProvider).invalidate,
   );
 });
 ''',
@@ -812,6 +1617,162 @@ class GameInfoPanel extends StatelessWidget {
 ''',
 
         # Tests
+        'test/unit/data/datasources/game_remote_datasource_test.dart': '''import 'dart:async';
+import 'dart:convert';
+
+import 'package:dio/dio.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:mockito/annotations.dart';
+import 'package:mockito/mockito.dart';
+import 'package:robot_flower_princess_front/core/error/exceptions.dart';
+import 'package:robot_flower_princess_front/core/network/api_client.dart';
+import 'package:robot_flower_princess_front/core/network/network_metrics.dart';
+import 'package:robot_flower_princess_front/data/datasources/game_remote_datasource.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_event.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_type.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/direction.dart';
+import 'package:web_socket_channel/web_socket_channel.dart';
+
+@GenerateMocks([ApiClient, WebSocketChannel, WebSocketSink])
+import 'game_remote_datasource_test.mocks.dart';
+
+Map<String, dynamic> _gameJson(String id) => {
+      'id': id,
+      'name': 'Game $id',
+      'board': {
+        'width': 3,
+        'height': 3,
+        'cells': [],
+        'robot': {
+          'position': {'x': 0, 'y': 0},
+          'orientation': 'NORTH',
+          'flowersHeld': 0,
+        },
+        'princessPosition': {'x': 2, 'y': 2},
+        'totalFlowers': 1,
+        'flowersDelivered': 0,
+      },
+      'status': 'playing',
+      'actions': [],
+      'createdAt': '2024-01-01T00:00:00.000Z',
+      'updatedAt': null,
+    };
+
+Response _response(Object data) =>
+    Response(requestOptions: RequestOptions(path: ''), data: data, statusCode: 200);
+
+void main() {
+  late MockApiClient mockClient;
+  late GameRemoteDataSourceImpl dataSource;
+
+  setUp(() {
+    mockClient = MockApiClient();
+    dataSource = GameRemoteDataSourceImpl(mockClient);
+  });
+
+  group('single-flight reads', () {
+    test('should send one request for concurrent getGame calls', () async {
+      final pending = Completer<Response>();
+      when(mockClient.getHedged(any)).thenAnswer((_) => pending.future);
+
+      final first = dataSource.getGame('1');
+      final second = dataSource.getGame('1');
+      pending.complete(_response(_gameJson('1')));
+
+      expect(identical(await first, await second), true);
+      verify(mockClient.getHedged(any)).called(1);
+    });
+
+    test('should not coalesce different games', () async {
+      when(mockClient.getHedged(any))
+          .thenAnswer((invocation) async => _response(
+              _gameJson((invocation.positionalArguments.first as String).split('/').last)));
+
+      final games = await Future.wait([dataSource.getGame('1'), dataSource.getGame('2')]);
+
+      expect(games.map((g) => g.id), ['1', '2']);
+    });
+  });
+
+  group('serialized actions', () {
+    test('should send the next action of a game after the previous answer', () async {
+      final firstAnswer = Completer<Response>();
+      var posts = 0;
+      when(mockClient.post(any, data: anyNamed('data'))).thenAnswer((_) {
+        posts++;
+        return posts == 1
+            ? firstAnswer.future
+            : Future.value(_response(_gameJson('1')));
+      });
+
+      final first = dataSource.executeAction('1', ActionType.rotate, Direction.EAST);
+      final second = dataSource.executeAction('1', ActionType.move, Direction.EAST);
+      await Future<void>.delayed(Duration.zero);
+      expect(posts, 1);
+
+      firstAnswer.complete(_response(_gameJson('1')));
+      await Future.wait([first, second]);
+      expect(posts, 2);
+    });
+  });
+
+  group('metrics', () {
+    test('should record the time spent building models', () async {
+      final metrics = NetworkMetrics();
+      dataSource = GameRemoteDataSourceImpl(mockClient, metrics: metrics);
+      when(mockClient.getHedged(any)).thenAnswer((_) async => Response(
+            requestOptions: RequestOptions(path: '/api/games/1'),
+            data: _gameJson('1'),
+            statusCode: 200,
+          ));
+
+      await dataSource.getGame('1');
+
+      expect(metrics.endpoints['GET /api/games/{id}']!.build.count, 1);
+    });
+  });
+
+  group('watchGame', () {
+    late StreamController<dynamic> socket;
+    late MockWebSocketSink sink;
+
+    setUp(() {
+      socket = StreamController<dynamic>();
+      sink = MockWebSocketSink();
+      final channel = MockWebSocketChannel();
+      when(channel.stream).thenAnswer((_) => socket.stream);
+      when(channel.sink).thenReturn(sink);
+      when(sink.close()).thenAnswer((_) async {});
+      when(mockClient.openStream(any)).thenReturn(channel);
+    });
+
+    test('should decode events and close the socket on cancel', () async {
+      final events = <GameEvent>[];
+      final subscription = dataSource.watchGame('1').listen(events.add);
+      socket.add(jsonEncode({'type': 'snapshot', 'game': _gameJson('1')}));
+      await Future<void>.delayed(Duration.zero);
+
+      expect(events.single, isA<GameSnapshot>());
+      verify(mockClient.openStream('/api/games/1/stream')).called(1);
+
+      await subscription.cancel();
+      verify(sink.close()).called(1);
+    });
+
+    test('should report a lost connection as a NetworkException', () async {
+      final errors = [];
+      final done = Completer<void>();
+      dataSource.watchGame('1').listen(null, onError: errors.add, onDone: done.complete);
+      socket.addError(Exception('reset'));
+      await socket.close();
+      await done.future;
+
+      expect(errors.single, isA<NetworkException>());
+    });
+  });
+}
+''',
+
         'test/unit/data/repositories/game_repository_impl_test.dart': '''import 'package:dartz/dartz.dart';
 import 'package:flutter_test/flutter_test.dart';
 import 'package:mockito/annotations.dart';
@@ -902,6 +1863,503 @@ void main() {
     });
   });
 }
+''',
+
+        'test/unit/data/repositories/cached_game_repository_test.dart': '''import 'package:dartz/dartz.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:mockito/annotations.dart';
+import 'package:mockito/mockito.dart';
+import 'package:robot_flower_princess_front/core/error/failures.dart';
+import 'package:robot_flower_princess_front/data/repositories/cached_game_repository.dart';
+import 'package:robot_flower_princess_front/domain/entities/game.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_summary.dart';
+import 'package:robot_flower_princess_front/domain/entities/robot.dart';
+import 'package:robot_flower_princess_front/domain/ports/outbound/game_repository.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_type.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/direction.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/game_status.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/position.dart';
+
+@GenerateMocks([GameRepository])
+import 'cached_game_repository_test.mocks.dart';
+
+void main() {
+  late MockGameRepository mockRepository;
+  late CachedGameRepository repository;
+  late DateTime now;
+
+  const board = GameBoard(
+    width: 3,
+    height: 3,
+    cells: [],
+    robot: Robot(
+      position: Position(x: 0, y: 0),
+      orientation: Direction.NORTH,
+    ),
+    princessPosition: Position(x: 2, y: 2),
+    totalFlowers: 1,
+  );
+
+  Game game(String id, GameStatus status) => Game(
+        id: id,
+        name: 'Game $id',
+        board: board,
+        status: status,
+        createdAt: DateTime(2024),
+      );
+
+  setUp(() {
+    mockRepository = MockGameRepository();
+    now = DateTime(2024);
+    repository = CachedGameRepository(
+      mockRepository,
+      maxEntries: 2,
+      gameTtl: const Duration(seconds: 30),
+      clock: () => now,
+    );
+  });
+
+  group('getGame', () {
+    test('should serve repeated reads from the cache', () async {
+      when(mockRepository.getGame('1'))
+          .thenAnswer((_) async => Right(game('1', GameStatus.playing)));
+
+      await repository.getGame('1');
+      final result = await repository.getGame('1');
+
+      expect(result.isRight(), true);
+      verify(mockRepository.getGame('1')).called(1);
+      expect(repository.stats.hits, 1);
+      expect(repository.stats.misses, 1);
+    });
+
+    test('should refetch a playing game once its TTL expired', () async {
+      when(mockRepository.getGame('1'))
+          .thenAnswer((_) async => Right(game('1', GameStatus.playing)));
+
+      await repository.getGame('1');
+      now = now.add(const Duration(seconds: 31));
+      await repository.getGame('1');
+
+      verify(mockRepository.getGame('1')).called(2);
+    });
+
+    test('should keep a finished game past the TTL', () async {
+      when(mockRepository.getGame('1'))
+          .thenAnswer((_) async => Right(game('1', GameStatus.won)));
+
+      await repository.getGame('1');
+      now = now.add(const Duration(days: 1));
+      await repository.getGame('1');
+
+      verify(mockRepository.getGame('1')).called(1);
+    });
+
+    test('should not cache failures', () async {
+      when(mockRepository.getGame('1'))
+          .thenAnswer((_) async => const Left(NetworkFailure('offline')));
+
+      await repository.getGame('1');
+      await repository.getGame('1');
+
+      verify(mockRepository.getGame('1')).called(2);
+    });
+
+    test('should evict the least recently used entry', () async {
+      for (final id in ['1', '2', '3']) {
+        when(mockRepository.getGame(id))
+            .thenAnswer((_) async => Right(game(id, GameStatus.playing)));
+      }
+
+      await repository.getGame('1');
+      await repository.getGame('2');
+      await repository.getGame('1');
+      await repository.getGame('3');
+      await repository.getGame('1');
+      await repository.getGame('2');
+
+      verify(mockRepository.getGame('1')).called(1);
+      verify(mockRepository.getGame('2')).called(2);
+      expect(repository.stats.evictions, 2);
+    });
+  });
+
+  group('invalidation', () {
+    test('executeAction should replace the cached game', () async {
+      when(mockRepository.getGame('1'))
+          .thenAnswer((_) async => Right(game('1', GameStatus.playing)));
+      when(mockRepository.executeAction('1', ActionType.rotate, Direction.EAST))
+          .thenAnswer((_) async => Right(game('1', GameStatus.gameOver)));
+
+      await repository.getGame('1');
+      await repository.executeAction('1', ActionType.rotate, Direction.EAST);
+      final result = await repository.getGame('1');
+
+      verify(mockRepository.getGame('1')).called(1);
+      expect(result.getOrElse(() => throw StateError('missing')).status,
+          GameStatus.gameOver);
+    });
+
+    test('autoPlay should drop the cached replay of a playing game', () async {
+      when(mockRepository.replayGame('1'))
+          .thenAnswer((_) async => const Right([board]));
+      when(mockRepository.autoPlay('1'))
+          .thenAnswer((_) async => const Left(ServerFailure('boom')));
+
+      await repository.replayGame('1');
+      await repository.autoPlay('1');
+      await repository.replayGame('1');
+
+      verify(mockRepository.replayGame('1')).called(2);
+    });
+
+    test('should keep the replay of a finished game permanently', () async {
+      when(mockRepository.getGame('1'))
+          .thenAnswer((_) async => Right(game('1', GameStatus.won)));
+      when(mockRepository.replayGame('1'))
+          .thenAnswer((_) async => const Right([board]));
+
+      await repository.getGame('1');
+      await repository.replayGame('1');
+      now = now.add(const Duration(days: 1));
+      await repository.replayGame('1');
+
+      verify(mockRepository.replayGame('1')).called(1);
+    });
+
+    test('createGame should drop the cached list', () async {
+      when(mockRepository.getGames()).thenAnswer((_) async => const Right([]));
+      when(mockRepository.createGame('New', 5))
+          .thenAnswer((_) async => Right(game('2', GameStatus.playing)));
+
+      await repository.getGames();
+      await repository.createGame('New', 5);
+      await repository.getGames();
+
+      verify(mockRepository.getGames()).called(2);
+    });
+
+    test('invalidateLists should make the next summaries read refetch', () async {
+      when(mockRepository.getGameSummaries(cursor: null, limit: 20))
+          .thenAnswer((_) async => const Right(GameSummaryPage(items: [])));
+
+      await repository.getGameSummaries(limit: 20);
+      repository.invalidateLists();
+      await repository.getGameSummaries(limit: 20);
+
+      verify(mockRepository.getGameSummaries(cursor: null, limit: 20)).called(2);
+    });
+
+    test('should forget a finished game once its entries are evicted', () async {
+      for (final id in ['2', '3']) {
+        when(mockRepository.getGame(id))
+            .thenAnswer((_) async => Right(game(id, GameStatus.playing)));
+      }
+      when(mockRepository.getGame('1'))
+          .thenAnswer((_) async => Right(game('1', GameStatus.won)));
+      when(mockRepository.replayGame('1'))
+          .thenAnswer((_) async => const Right([board]));
+
+      await repository.getGame('1');
+      await repository.getGame('2');
+      await repository.getGame('3');
+      // game:1 is gone, so the replay is cached with a TTL again
+      await repository.replayGame('1');
+      now = now.add(const Duration(days: 1));
+      await repository.replayGame('1');
+
+      verify(mockRepository.replayGame('1')).called(2);
+    });
+  });
+}
+''',
+
+        'test/unit/presentation/providers/current_game_provider_test.dart': '''import 'dart:async';
+
+import 'package:dartz/dartz.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/core/error/failures.dart';
+import 'package:robot_flower_princess_front/domain/entities/game.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_action.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_event.dart';
+import 'package:robot_flower_princess_front/domain/entities/robot.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_command.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/action_type.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/direction.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/game_status.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/position.dart';
+import 'package:robot_flower_princess_front/presentation/providers/current_game_provider.dart';
+
+Game _game(GameStatus status) => Game(
+      id: 'game-1',
+      name: 'Game 1',
+      board: const GameBoard(
+        width: 3,
+        height: 3,
+        cells: [],
+        robot: Robot(
+          position: Position(x: 0, y: 0),
+          orientation: Direction.EAST,
+        ),
+        princessPosition: Position(x: 2, y: 2),
+        totalFlowers: 1,
+      ),
+      status: status,
+      createdAt: DateTime(2024),
+    );
+
+void main() {
+  late List<List<ActionCommand>> requests;
+  late List<Completer<Either<Failure, Game>>> responses;
+  late CurrentGameNotifier notifier;
+
+  Future<Either<Failure, Game>> respond(List<ActionCommand> actions) {
+    requests.add(actions);
+    final response = Completer<Either<Failure, Game>>();
+    responses.add(response);
+    return response.future;
+  }
+
+  setUp(() async {
+    requests = [];
+    responses = [];
+    notifier = CurrentGameNotifier(
+      (String gameId) async => Right(_game(GameStatus.playing)),
+      (String gameId, ActionType action, Direction direction) =>
+          respond([ActionCommand(action, direction)]),
+      (String gameId, List<ActionCommand> actions) => respond(actions),
+      (String gameId) async => Right(_game(GameStatus.won)),
+    );
+    await notifier.loadGame('game-1');
+  });
+
+  group('CurrentGameNotifier action queue', () {
+    test('should batch actions made while a request is in flight', () async {
+      final first = notifier.executeAction(ActionType.rotate, Direction.SOUTH);
+      notifier.executeAction(ActionType.move, Direction.SOUTH);
+      final last = notifier.executeAction(ActionType.move, Direction.SOUTH);
+      expect(requests.length, 1);
+
+      responses[0].complete(Right(_game(GameStatus.playing)));
+      await first;
+      expect(requests.length, 2);
+      expect(requests[1], const [
+        ActionCommand(ActionType.move, Direction.SOUTH),
+        ActionCommand(ActionType.move, Direction.SOUTH),
+      ]);
+
+      responses[1].complete(Right(_game(GameStatus.playing)));
+      await last;
+      expect(requests.length, 2);
+    });
+
+    test('should drop the queue and roll back when a request fails', () async {
+      notifier.executeAction(ActionType.rotate, Direction.SOUTH);
+      final queued = notifier.executeAction(ActionType.move, Direction.SOUTH);
+
+      responses[0].complete(const Left(NetworkFailure('offline')));
+      await queued;
+
+      expect(requests.length, 1);
+      expect(notifier.state.hasError, true);
+      expect(notifier.state.value, _game(GameStatus.playing));
+    });
+
+    test('should drop queued actions once the game is finished', () async {
+      notifier.executeAction(ActionType.rotate, Direction.SOUTH);
+      final queued = notifier.executeAction(ActionType.move, Direction.SOUTH);
+
+      responses[0].complete(Right(_game(GameStatus.gameOver)));
+      await queued;
+
+      expect(requests.length, 1);
+      expect(notifier.state.value!.status, GameStatus.gameOver);
+    });
+  });
+
+  group('CurrentGameNotifier game stream', () {
+    late List<StreamController<Either<Failure, GameEvent>>> streams;
+    late Completer<Either<Failure, Game>> autoPlayed;
+    late List<bool> autoPlayStreamed;
+
+    GameStep step(int number, GameStatus status) => GameStep(
+          step: number,
+          action: GameAction(
+            type: ActionType.rotate,
+            direction: Direction.SOUTH,
+            timestamp: DateTime(2024),
+          ),
+          board: _game(status).board,
+          status: status,
+          updatedAt: DateTime(2024),
+        );
+
+    Future<void> emit(GameEvent event) async {
+      streams.last.add(Right(event));
+      await Future<void>.delayed(Duration.zero);
+    }
+
+    setUp(() async {
+      streams = [];
+      autoPlayStreamed = [];
+      autoPlayed = Completer();
+      notifier = CurrentGameNotifier(
+        (String gameId) async => Right(_game(GameStatus.playing)),
+        (String gameId, ActionType action, Direction direction) =>
+            respond([ActionCommand(action, direction)]),
+        (String gameId, List<ActionCommand> actions) => respond(actions),
+        (String gameId, {bool stream = false}) {
+          autoPlayStreamed.add(stream);
+          return autoPlayed.future;
+        },
+        watchGameUseCase: (String gameId) {
+          streams.add(StreamController<Either<Failure, GameEvent>>());
+          return streams.last.stream;
+        },
+      );
+      await notifier.loadGame('game-1');
+    });
+
+    tearDown(() => notifier.dispose());
+
+    test('should apply steps pushed by the server', () async {
+      expect(streams.length, 1);
+
+      await emit(step(1, GameStatus.playing));
+      await emit(step(2, GameStatus.won));
+
+      expect(notifier.state.value!.actions.length, 2);
+      expect(notifier.state.value!.status, GameStatus.won);
+    });
+
+    test('should reopen the stream when steps were missed', () async {
+      await emit(step(3, GameStatus.playing));
+
+      expect(notifier.state.value!.actions, isEmpty);
+      expect(streams.length, 2);
+    });
+
+    test('should leave the game to the answer while an action is in flight', () async {
+      final done = notifier.executeAction(ActionType.rotate, Direction.SOUTH);
+      await emit(step(1, GameStatus.playing));
+
+      final confirmed = step(1, GameStatus.playing).applyTo(_game(GameStatus.playing));
+      responses[0].complete(Right(confirmed));
+      await done;
+
+      expect(notifier.state.value, confirmed);
+    });
+
+    test('should play a streamed autoplay out on the board', () async {
+      final finished = notifier.autoPlay();
+      expect(autoPlayStreamed, [true]);
+      expect(notifier.state.isLoading, false);
+
+      await emit(step(1, GameStatus.playing));
+      expect(notifier.state.value!.actions.length, 1);
+
+      final last = step(2, GameStatus.won)
+          .applyTo(notifier.state.value!);
+      autoPlayed.complete(Right(last));
+      await finished;
+
+      expect(notifier.state.value, last);
+    });
+  });
+}
+''',
+
+        'test/unit/presentation/providers/games_list_provider_test.dart': '''import 'package:dartz/dartz.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/core/error/failures.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_summary.dart';
+import 'package:robot_flower_princess_front/domain/value_objects/game_status.dart';
+import 'package:robot_flower_princess_front/presentation/providers/games_list_provider.dart';
+
+GameSummary _summary(int i) => GameSummary(
+      id: '$i',
+      name: 'Game $i',
+      status: GameStatus.playing,
+      boardWidth: 10,
+      boardHeight: 10,
+      totalFlowers: 3,
+      createdAt: DateTime(2024),
+    );
+
+void main() {
+  late List<String?> requestedCursors;
+  late Map<String?, Either<Failure, GameSummaryPage>> pages;
+  late GamesListNotifier notifier;
+
+  setUp(() {
+    requestedCursors = [];
+    pages = {
+      null: Right(GameSummaryPage(
+        items: [_summary(1), _summary(2)],
+        nextCursor: 'page2',
+      )),
+      'page2': Right(GameSummaryPage(items: [_summary(3)])),
+    };
+    notifier = GamesListNotifier(({String? cursor, int? limit}) async {
+      requestedCursors.add(cursor);
+      return pages[cursor]!;
+    });
+  });
+
+  group('GamesListNotifier', () {
+    test('should load the first page', () async {
+      await notifier.loadGames();
+
+      final list = notifier.state.value!;
+      expect(list.games.map((g) => g.id), ['1', '2']);
+      expect(list.hasMore, true);
+    });
+
+    test('should append pages until the last one', () async {
+      await notifier.loadGames();
+      await notifier.loadMore();
+      await notifier.loadMore();
+
+      final list = notifier.state.value!;
+      expect(list.games.map((g) => g.id), ['1', '2', '3']);
+      expect(list.hasMore, false);
+      expect(requestedCursors, [null, 'page2']);
+    });
+
+    test('should fetch a page once when loadMore is called repeatedly', () async {
+      await notifier.loadGames();
+      await Future.wait([notifier.loadMore(), notifier.loadMore()]);
+
+      expect(requestedCursors, [null, 'page2']);
+    });
+
+    test('should keep loaded games when a page fails', () async {
+      pages['page2'] = const Left(NetworkFailure('offline'));
+      await notifier.loadGames();
+      await notifier.loadMore();
+
+      final list = notifier.state.value!;
+      expect(list.games.length, 2);
+      expect(list.loadMoreError, 'offline');
+      expect(list.hasMore, true);
+    });
+
+    test('should drop cached pages before a refresh only', () async {
+      var invalidations = 0;
+      notifier = GamesListNotifier(
+        ({String? cursor, int? limit}) async => pages[cursor]!,
+        invalidateCache: () => invalidations++,
+      );
+
+      await notifier.loadGames();
+      await notifier.loadGames(refresh: true);
+
+      expect(invalidations, 1);
+    });
+  });
+}
 ''',
     }
 
@@ -938,7 +2396,9 @@ def main():
     print("   - Repository implementation added")
     print("   - Riverpod providers configured")
     print("   - Reusable widgets created")
-    print("   - Repository tests added")
+    print("   - Caching repository decorator added")
+    print("   - Game stream subscription (WebSocket) added")
+    print("   - Repository and games list tests added")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -73,16 +73,17 @@ class _HomePageState extends ConsumerState<HomePage> {
         actions: [
           IconButton(
             icon: const Icon(Icons.refresh),
-            onPressed: () => ref.read(gamesListProvider.notifier).loadGames(),
+            onPressed: () =>
+                ref.read(gamesListProvider.notifier).loadGames(refresh: true),
           ),
         ],
       ),
       body: gamesAsync.when(
-        data: (games) {
-          if (games.isEmpty) {
+        data: (list) {
+          if (list.games.isEmpty && !list.hasMore) {
             return _buildEmptyState();
           }
-          return _buildGamesList(games);
+          return _buildGamesList(list);
         },
         loading: () => const Center(child: CircularProgressIndicator()),
         error: (error, stack) => _buildErrorState(error.toString()),
@@ -96,15 +97,22 @@ class _HomePageState extends ConsumerState<HomePage> {
     );
   }
 
-  Widget _buildGamesList(List games) {
+  /// Rows plus a footer while more pages exist; building the footer (it
+  /// scrolled into view, or the first page did not fill the screen) fetches
+  /// the next page.
+  Widget _buildGamesList(GamesListState list) {
+    final games = list.games;
     return RefreshIndicator(
       onRefresh: () async {
-        await ref.read(gamesListProvider.notifier).loadGames();
+        await ref.read(gamesListProvider.notifier).loadGames(refresh: true);
       },
       child: ListView.builder(
         padding: const EdgeInsets.all(16),
-        itemCount: games.length,
+        itemCount: games.length + (list.hasMore ? 1 : 0),
         itemBuilder: (context, index) {
+          if (index == games.length) {
+            return _buildListFooter(list);
+          }
           final game = games[index];
           return GameListItem(
             game: game,
@@ -115,6 +123,26 @@ class _HomePageState extends ConsumerState<HomePage> {
     );
   }
 
+  Widget _buildListFooter(GamesListState list) {
+    final notifier = ref.read(gamesListProvider.notifier);
+    if (list.loadMoreError != null) {
+      return Center(
+        child: TextButton.icon(
+          onPressed: notifier.loadMore,
+          icon: const Icon(Icons.refresh),
+          label: const Text('Load more games'),
+        ),
+      );
+    }
+    if (!list.isLoadingMore) {
+      Future.microtask(notifier.loadMore);
+    }
+    return const Padding(
+      padding: EdgeInsets.all(16),
+      child: Center(child: CircularProgressIndicator()),
+    );
+  }
+
   Widget _buildEmptyState() {
     return Center(
       child: Column(
@@ -169,7 +197,8 @@ class _HomePageState extends ConsumerState<HomePage> {
           ),
           const SizedBox(height: 24),
           ElevatedButton(
-            onPressed: () => ref.read(gamesListProvider.notifier).loadGames(),
+            onPressed: () =>
+                ref.read(gamesListProvider.notifier).loadGames(refresh: true),
             child: const Text('Retry'),
           ),
         ],
@@ -326,11 +355,11 @@ class _CreateGameDialogState extends ConsumerState<CreateGameDialog> {
 
         'lib/presentation/pages/home/widgets/game_list_item.dart': '''import 'package:flutter/material.dart';
 import '../../../../core/theme/app_colors.dart';
-import '../../../../domain/entities/game.dart';
+import '../../../../domain/entities/game_summary.dart';
 import '../../../widgets/game_status_badge.dart';
 
 class GameListItem extends StatelessWidget {
-  final Game game;
+  final GameSummary game;
   final VoidCallback onTap;
 
   const GameListItem({
@@ -348,7 +377,7 @@ class GameListItem extends StatelessWidget {
         leading: CircleAvatar(
           backgroundColor: AppColors.forestGreen,
           child: Text(
-            '${game.board.width}x${game.board.height}',
+            '${game.boardWidth}x${game.boardHeight}',
             style: const TextStyle(
               color: Colors.white,
               fontSize: 12,
@@ -364,8 +393,8 @@ class GameListItem extends StatelessWidget {
           ),
         ),
         subtitle: Text(
-          'Flowers: ${game.board.flowersDelivered}/${game.board.totalFlowers} • '
-          'Actions: ${game.actions.length}',
+          'Flowers: ${game.flowersDelivered}/${game.totalFlowers} • '
+          'Actions: ${game.actionCount}',
           style: const TextStyle(fontSize: 14),
         ),
         trailing: Row(
@@ -383,7 +412,8 @@ class GameListItem extends StatelessWidget {
 ''',
 
         # Game Page
-        'lib/presentation/pages/game/game_page.dart': '''import 'package:flutter/material.dart';
+        'lib/presentation/pages/game/game_page.dart': '''import 'package:flutter/foundation.dart';
+import 'package:flutter/material.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../../../core/theme/app_colors.dart';
 import '../../../domain/value_objects/action_type.dart';
@@ -392,6 +422,7 @@ import '../../providers/current_game_provider.dart';
 import '../../widgets/game_board_widget.dart';
 import '../../widgets/game_info_panel.dart';
 import 'widgets/action_controls.dart';
+import 'widgets/network_metrics_overlay.dart';
 import 'widgets/replay_dialog.dart';
 
 class GamePage extends ConsumerStatefulWidget {
@@ -409,6 +440,7 @@ class GamePage extends ConsumerStatefulWidget {
 class _GamePageState extends ConsumerState<GamePage> {
   Direction? _selectedDirection;
   String? _errorMessage;
+  bool _showMetrics = false;
 
   @override
   void initState() {
@@ -435,57 +467,79 @@ class _GamePageState extends ConsumerState<GamePage> {
           IconButton(
             icon: const Icon(Icons.refresh),
             onPressed: () {
-              ref.read(currentGameProvider.notifier).loadGame(widget.gameId);
+              ref
+                  .read(currentGameProvider.notifier)
+                  .loadGame(widget.gameId, refresh: true);
             },
           ),
           IconButton(
             icon: const Icon(Icons.play_circle_outline),
             onPressed: _showReplayDialog,
           ),
+          if (!kReleaseMode)
+            IconButton(
+              icon: const Icon(Icons.speed),
+              tooltip: 'Network metrics',
+              onPressed: () => setState(() => _showMetrics = !_showMetrics),
+            ),
         ],
       ),
-      body: gameAsync.when(
-        data: (game) {
-          if (game == null) {
-            return const Center(child: Text('Game not found'));
-          }
-
-          return LayoutBuilder(
-            builder: (context, constraints) {
-              final isWideScreen = constraints.maxWidth > 900;
-
-              if (isWideScreen) {
-                return _buildWideLayout(game);
-              } else {
-                return _buildNarrowLayout(game);
+      body: Stack(
+        fit: StackFit.expand,
+        children: [
+          gameAsync.when(
+            data: (game) {
+              if (game == null) {
+                return const Center(child: Text('Game not found'));
               }
+
+              return LayoutBuilder(
+                builder: (context, constraints) {
+                  final isWideScreen = constraints.maxWidth > 900;
+
+                  if (isWideScreen) {
+                    return _buildWideLayout(game);
+                  } else {
+                    return _buildNarrowLayout(game);
+                  }
+                },
+              );
             },
-          );
-        },
-        loading: () => const Center(child: CircularProgressIndicator()),
-        error: (error, stack) {
-          return Center(
-            child: Column(
-              mainAxisAlignment: MainAxisAlignment.center,
-              children: [
-                const Icon(Icons.error_outline, size: 64, color: AppColors.error),
-                const SizedBox(height: 16),
-                Text(
-                  error.toString(),
-                  textAlign: TextAlign.center,
-                  style: const TextStyle(fontSize: 16),
-                ),
-                const SizedBox(height: 24),
-                ElevatedButton(
-                  onPressed: () {
-                    ref.read(currentGameProvider.notifier).loadGame(widget.gameId);
-                  },
-                  child: const Text('Retry'),
+            loading: () => const Center(child: CircularProgressIndicator()),
+            error: (error, stack) {
+              return Center(
+                child: Column(
+                  mainAxisAlignment: MainAxisAlignment.center,
+                  children: [
+                    const Icon(Icons.error_outline, size: 64, color: AppColors.error),
+                    const SizedBox(height: 16),
+                    Text(
+                      error.toString(),
+                      textAlign: TextAlign.center,
+                      style: const TextStyle(fontSize: 16),
+                    ),
+                    const SizedBox(height: 24),
+                    ElevatedButton(
+                      onPressed: () {
+                        ref.read(currentGameProvider.notifier).loadGame(widget.gameId);
+                      },
+                      child: const Text('Retry'),
+                    ),
+                  ],
                 ),
-              ],
+              );
+            },
+          ),
+          if (_showMetrics)
+            Positioned(
+              top: 8,
+              right: 8,
+              width: 380,
+              child: NetworkMetricsOverlay(
+                onClose: () => setState(() => _showMetrics = false),
+              ),
             ),
-          );
-        },
+        ],
       ),
     );
   }
@@ -754,6 +808,109 @@ class ActionControls extends StatelessWidget {
     );
   }
 }
+''',
+
+        'lib/presentation/pages/game/widgets/network_metrics_overlay.dart': '''import 'package:flutter/material.dart';
+import 'package:flutter/services.dart';
+import 'package:flutter_riverpod/flutter_riverpod.dart';
+import '../../../../core/network/network_metrics.dart';
+import '../../../providers/game_provider.dart';
+
+/// Debug panel with the client-side timings of every endpoint.
+///
+/// Shows p50/p95 of network time (until the last body byte), JSON parse
+/// time and model build time in milliseconds, with the median body size and
+/// error rate. Copy puts the full report, histograms included, on the
+/// clipboard as JSON.
+class NetworkMetricsOverlay extends ConsumerWidget {
+  final VoidCallback onClose;
+
+  const NetworkMetricsOverlay({
+    super.key,
+    required this.onClose,
+  });
+
+  @override
+  Widget build(BuildContext context, WidgetRef ref) {
+    final metrics = ref.watch(networkMetricsProvider);
+
+    return Card(
+      color: Colors.black.withOpacity(0.85),
+      elevation: 8,
+      child: Padding(
+        padding: const EdgeInsets.all(12),
+        child: ListenableBuilder(
+          listenable: metrics,
+          builder: (context, _) {
+            final keys = metrics.endpoints.keys.toList()..sort();
+            return DefaultTextStyle(
+              style: const TextStyle(
+                color: Colors.white,
+                fontSize: 11,
+                fontFamily: 'monospace',
+              ),
+              child: Column(
+                mainAxisSize: MainAxisSize.min,
+                crossAxisAlignment: CrossAxisAlignment.start,
+                children: [
+                  Row(
+                    children: [
+                      const Expanded(
+                        child: Text(
+                          'Network metrics (ms p50/p95)',
+                          style: TextStyle(fontWeight: FontWeight.bold),
+                        ),
+                      ),
+                      _button(Icons.copy, 'Copy JSON report', () => _copy(context, metrics)),
+                      _button(Icons.delete_outline, 'Reset', metrics.reset),
+                      _button(Icons.close, 'Close', onClose),
+                    ],
+                  ),
+                  if (keys.isEmpty) const Text('No requests yet'),
+                  for (final key in keys) ..._endpoint(key, metrics.endpoints[key]!),
+                ],
+              ),
+            );
+          },
+        ),
+      ),
+    );
+  }
+
+  Widget _button(IconData icon, String tooltip, VoidCallback onPressed) {
+    return IconButton(
+      icon: Icon(icon, size: 16, color: Colors.white),
+      tooltip: tooltip,
+      visualDensity: VisualDensity.compact,
+      onPressed: onPressed,
+    );
+  }
+
+  static String _p(Histogram histogram) =>
+      '${histogram.percentile(0.5).toStringAsFixed(1)}/'
+      '${histogram.percentile(0.95).toStringAsFixed(1)}';
+
+  List<Widget> _endpoint(String key, EndpointMetrics endpoint) {
+    final size = endpoint.responseBytes.percentile(0.5) / 1024;
+    final errors = (endpoint.errorRate * 100).toStringAsFixed(0);
+    return [
+      const SizedBox(height: 6),
+      Text(key, style: const TextStyle(fontWeight: FontWeight.bold)),
+      Text('n=${endpoint.requests} err=$errors% 304=${endpoint.notModified} '
+          'size=${size.toStringAsFixed(1)}KB'),
+      Text('net ${_p(endpoint.network)}  parse ${_p(endpoint.parse)}  '
+          'build ${_p(endpoint.build)}'),
+    ];
+  }
+
+  Future<void> _copy(BuildContext context, NetworkMetrics metrics) async {
+    await Clipboard.setData(ClipboardData(text: metrics.exportJson()));
+    if (!context.mounted) return;
+    ScaffoldMessenger.of(context).showSnackBar(
+      const SnackBar(content: Text('Network metrics copied as JSON')),
+    );
+  }
+}
 ''',
 
         'lib/presentation/pages/game/widgets/replay_dialog.dart': '''import 'package:flutter/material.dart';
@@ -1018,6 +1175,68 @@ void main() {
     expect(find.text('👑'), findsOneWidget);
   });
 }
+''',
+
+        'test/widget/game_board_widget_benchmark_test.dart': '''import 'dart:convert';
+import 'dart:io';
+
+import 'package:flutter/material.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:robot_flower_princess_front/domain/entities/game_board.dart';
+import 'package:robot_flower_princess_front/presentation/widgets/game_board_widget.dart';
+
+// Fixtures are written by generation/robot_flower_fixtures.py.
+const _fixtures = 'test/fixtures';
+final _missing = !File('$_fixtures/manifest.json').existsSync()
+    ? 'Run robot_flower_fixtures.py to generate test/fixtures'
+    : null;
+
+dynamic _load(String name) =>
+    jsonDecode(File('$_fixtures/$name.json').readAsStringSync());
+
+Widget _host(GameBoard board) => MaterialApp(
+      home: Scaffold(body: GameBoardWidget(board: board)),
+    );
+
+void _report(String label, Duration elapsed, int frames) {
+  final us = elapsed.inMicroseconds / frames;
+  // ignore: avoid_print
+  print('$label: ${us.toStringAsFixed(1)} us/frame');
+}
+
+void main() {
+  testWidgets('GameBoardWidget builds the max fixture board', (tester) async {
+    final board = GameBoard.fromJson(_load('boards/max') as Map<String, dynamic>);
+    const frames = 10;
+
+    final stopwatch = Stopwatch()..start();
+    for (var i = 0; i < frames; i++) {
+      await tester.pumpWidget(_host(board), const Duration(milliseconds: 16));
+      await tester.pumpWidget(const SizedBox());
+    }
+    stopwatch.stop();
+    _report('GameBoardWidget first build 50x50', stopwatch.elapsed, frames);
+
+    await tester.pumpWidget(_host(board));
+    expect(find.byType(GridView), findsOneWidget);
+  }, skip: _missing != null);
+
+  testWidgets('GameBoardWidget rebuilds through a 500-step replay', (tester) async {
+    final boards = (_load('replays/long_replay') as List)
+        .map((b) => GameBoard.fromJson(b as Map<String, dynamic>))
+        .toList();
+    await tester.pumpWidget(_host(boards.first));
+
+    final stopwatch = Stopwatch()..start();
+    for (final board in boards.skip(1)) {
+      await tester.pumpWidget(_host(board), const Duration(milliseconds: 16));
+    }
+    stopwatch.stop();
+    _report('GameBoardWidget replay rebuild', stopwatch.elapsed, boards.length - 1);
+
+    expect(find.text('🤖'), findsOneWidget);
+  }, skip: _missing != null);
+}
 ''',
     }
 
@@ -1054,7 +1273,9 @@ def main():
     print("   - Create game dialog")
     print("   - Game page with controls")
     print("   - Replay functionality")
+    print("   - Network metrics overlay on the game page (debug and profile)")
     print("   - Widget tests added")
+    print("   - Widget benchmarks over test/fixtures (robot_flower_fixtures.py)")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -459,6 +459,18 @@ GET /api/games
 Response: Array of Game objects
 ```
 
+### List Game Summaries (paginated)
+```http
+GET /api/games?view=summary&limit=20&cursor={nextCursor}
+
+Query Parameters:
+- view=summary (required): Return GameSummary objects instead of full games
+- limit (optional): Page size, 1-100 (default: 20)
+- cursor (optional): nextCursor of the previous page; omit for the first page
+
+Response: GameSummaryPage object (newest games first)
+```
+
 ### Get Game by ID
 ```http
 GET /api/games/{gameId}
@@ -479,13 +491,44 @@ Content-Type: application/json
 Response: Updated Game object
 ```
 
+### Execute Actions (batch)
+```http
+POST /api/games/{gameId}/actions
+Content-Type: application/json
+
+{
+  "actions": [
+    { "action": "rotate", "direction": "EAST" },
+    { "action": "move", "direction": "EAST" }
+  ]
+}
+
+Response:
+{
+  "game": Game object,
+  "applied": integer
+}
+```
+
+Applies 1 to 50 actions (`AppConstants.maxActionBatch`) in order, as if
+each had been sent to `/action`. The whole batch is validated first: an
+unknown action or direction, or a game that is already finished, rejects it
+with 400 and nothing is applied. Applying stops at the action that ends the
+game; `applied` counts the actions that were recorded. The app's
+`CurrentGameNotifier` keeps one request in flight per game and sends the
+actions queued meanwhile as one batch.
+
 ### Auto Play
 ```http
 POST /api/games/{gameId}/autoplay
+POST /api/games/{gameId}/autoplay?stream=true
 
 Response: Updated Game object
 ```
 
+With `stream=true` the game accepts no other action until the last step
+(`409 Conflict`); the app uses it while it watches the game stream.
+
 ### Get Replay
 ```http
 GET /api/games/{gameId}/replay
@@ -493,6 +536,31 @@ GET /api/games/{gameId}/replay
 Response: Array of GameBoard objects (step-by-step states)
 ```
 
+### Game Stream
+```http
+GET /api/games/{gameId}/stream
+GET /api/games/{gameId}/stream?compact=true
+Upgrade: websocket
+
+Messages (server to client, one JSON text frame each):
+{"type": "snapshot", "game": Game object}
+{"type": "step", "step": integer, "action": GameAction object,
+ "board": GameBoard object, "status": "playing|won|gameOver",
+ "updatedAt": "ISO 8601 timestamp"}
+```
+
+A WebSocket that pushes the game instead of having viewers poll it. It
+opens with a snapshot; every action applied afterwards (through `/action`,
+`/actions` or a streamed autoplay, by any client) follows as a step event
+carrying the action and the board it left. `step` is the length of the
+game's actions once the action is applied, so a client that sees a step
+more than one ahead of its copy has missed events and resubscribes for a
+new snapshot. `?compact=true` (or an Accept header listing the compact type,
+for clients that can set one) selects the compact encoding for the game,
+board and action. Clients only answer pings and the close handshake. An
+unknown game gets a plain `404` instead of the upgrade, and a subscriber
+too slow to keep up is disconnected.
+
 ## Data Models
 
 ### Game Object
@@ -521,6 +589,33 @@ Response: Array of GameBoard objects (step-by-step states)
 }
 ```
 
+### GameSummary Object
+```json
+{
+  "id": "string",
+  "name": "string",
+  "status": "playing|won|gameOver",
+  "boardWidth": number,
+  "boardHeight": number,
+  "totalFlowers": number,
+  "flowersDelivered": number,
+  "actionCount": number,
+  "createdAt": "ISO8601 datetime",
+  "updatedAt": "ISO8601 datetime?"
+}
+```
+
+### GameSummaryPage Object
+```json
+{
+  "items": [GameSummary],
+  "nextCursor": "string?"
+}
+```
+`nextCursor` is opaque and `null` on the last page. The games list uses this
+view, so a page costs a few hundred bytes per game whatever the board size
+or history length.
+
 ### Robot Object
 ```json
 {
@@ -557,6 +652,80 @@ Response: Array of GameBoard objects (step-by-step states)
 }
 ```
 
+## HTTP Caching
+
+`GET` responses carry an `ETag` (and optionally `Last-Modified`). The client
+stores the validators and the body per URL and revalidates:
+
+```
+GET /api/games
+If-None-Match: "1f3a-8c2d4e10"
+
+HTTP/1.1 304 Not Modified
+ETag: "1f3a-8c2d4e10"
+```
+
+A `304` has no body; the client answers the call from its stored copy, so
+unchanged game lists, games and replays are not transferred again.
+
+Backend requirements:
+- Send `ETag` on every `GET` that returns `200`; it must change whenever the body changes
+- Honour `If-None-Match` (weak comparison, `*` matches any) and, if `Last-Modified` is sent, `If-Modified-Since`
+- For browser clients, expose the header (`Access-Control-Expose-Headers: ETag`) and allow `If-None-Match` in CORS preflights
+
+The local stand-in (`generation/robot_flower_server.py`) implements this.
+
+## Compression and Compact Encoding
+
+Game and replay bodies repeat the same keys for every cell, so two opt-in
+mechanisms shrink them on the wire.
+
+**Content coding.** Bodies of 1 KiB and more may be sent `gzip` or `br`
+encoded when the request's `Accept-Encoding` allows it (`Content-Encoding`
+on the response). Native builds of the app send `Accept-Encoding: gzip`;
+browsers negotiate `gzip`/`br` on their own. Each coding is its own
+representation: the `ETag` differs per coding, and responses carry
+`Vary: Accept, Accept-Encoding`.
+
+**Compact encoding.** A client that lists the compact media type in
+`Accept` gets games and replays with short keys:
+
+```
+GET /api/games/{gameId}
+Accept: application/vnd.rfp.compact+json, application/json;q=0.9
+
+HTTP/1.1 200 OK
+Content-Type: application/vnd.rfp.compact+json
+```
+
+```json
+{
+  "id": "string",
+  "name": "string",
+  "board": {
+    "w": 4, "h": 4,
+    "g": "PR...OO......OFO",
+    "r": [1, 0, "NORTH", 0],
+    "p": [0, 0],
+    "t": 1, "d": 0
+  },
+  "status": "playing",
+  "actions": [["rotate", "EAST", "ISO8601 datetime", null]],
+  "createdAt": "ISO8601 datetime",
+  "updatedAt": "ISO8601 datetime?"
+}
+```
+
+- `w`/`h`: width and height; `t`/`d`: totalFlowers and flowersDelivered
+- `g`: the cells, row-major, one character each: `.` empty, `R` robot, `P` princess, `F` flower, `O` obstacle
+- `r`: robot as `[x, y, orientation, flowersHeld]`; `p`: princess position as `[x, y]`
+- `actions`: `[type, direction, timestamp, errorMessage]`; `success` is `errorMessage == null`
+- Replays are arrays of compact boards; the batch endpoint wraps a compact game
+
+Summaries and errors are the same in both encodings. The app requests the
+compact encoding when built with `--dart-define=COMPACT_WIRE=true`; its
+`GameModel` and `GameBoard` decode either one.
+
 ## Error Handling
 
 ### Error Response Format
@@ -571,8 +740,10 @@ Response: Array of GameBoard objects (step-by-step states)
 ### HTTP Status Codes
 - `200 OK`: Successful request
 - `201 Created`: Resource created
+- `304 Not Modified`: Cached copy is still current (conditional `GET`)
 - `400 Bad Request`: Invalid input
 - `404 Not Found`: Resource not found
+- `409 Conflict`: Game is busy with a streamed autoplay
 - `500 Internal Server Error`: Server error
 
 ## Configuration
@@ -587,6 +758,33 @@ Or via environment variable:
 export API_BASE_URL=http://localhost:8080
 flutter run
 ```
+
+HTTP requests are logged in debug and profile builds, one line per completed
+request and every failure. Tune it with `--dart-define`:
+```bash
+flutter run --dart-define=HTTP_LOG_LEVEL=debug            # off, error, info (default), debug
+flutter run --dart-define=HTTP_LOG_SAMPLE_PERCENT=10      # log 10% of successful requests
+flutter build web --dart-define=STRIP_HTTP_LOGGING=false  # keep logging in a release build
+```
+Release builds leave the logging interceptor out entirely.
+
+`ApiClient` also measures every request per endpoint (`GET /api/games/{id}`):
+network time until the last body byte, JSON parse time, model build time,
+body sizes and error rate, as histograms. In debug and profile builds the
+speed icon on the game page opens an overlay with p50/p95 of each, and its
+copy button exports the full report as JSON.
+
+Requests follow `TransportPolicy`: connects time out after 3s and responses
+after 10s. GETs failing in transit or with 502/503/504 are retried twice
+with jittered exponential backoff. After 5 failures in a row a host's circuit
+opens and requests fail at once for 10s before one probe is let through.
+Opening a game sends a second GET if the first has not answered within
+300ms. Actions, creation and autoplay are never retried.
+
+The open game is followed over its stream, so moves from other viewers and
+autoplay steps appear as they happen. A dropped stream is reopened after 2s,
+backing off to 32s while it keeps failing. Build with
+`--dart-define=GAME_STREAMING=false` for a backend without streams.
 ''',
 
         'docs/DEPLOYMENT.md': '''# Deployment Guide
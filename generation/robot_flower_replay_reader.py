@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Replay Reader
+Memory-mapped, zero-copy access to fixed-record replay archives
+
+Reads archives written by robot_flower_archive.py with --full-frames, where
+every step is a fixed-size record. The offset index gives any step in O(1),
+and the cell grids and robot states of all steps are exposed as NumPy views
+straight over the mmap, so scanning thousands of replays never builds the
+per-step GameBoard JSON.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from robot_flower_archive import FULL_FRAMES, NO_ACTION, RECORD, ArchiveError, ReplayArchive
+from robot_flower_engine import ACTIONS, CLEAN, DIRECTIONS, ROTATE
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required for the views
+    np = None
+
+# RECORD as a NumPy dtype, for a view over every step's robot state
+STATE_DTYPE = None if np is None else np.dtype([
+    ('kind', 'u1'), ('action', 'u1'), ('direction', 'u1'), ('orientation', 'u1'),
+    ('x', 'u1'), ('y', 'u1'), ('flowers_held', 'u1'), ('pad', 'u1'),
+    ('flowers_delivered', '<u2'),
+])
+
+
+class ReplayReader(ReplayArchive):
+    """Fixed-record replay archive with NumPy views over the mapped file
+
+    Views share memory with the mapping: drop them before close().
+    """
+
+    def __init__(self, buffer):
+        if np is None:
+            raise RuntimeError('ReplayReader needs NumPy (pip install numpy)')
+        super().__init__(buffer)
+        if not self.flags & FULL_FRAMES:
+            raise ArchiveError('Replay has delta records; convert it with --full-frames')
+        self.record_size = RECORD.size + self.width * self.height
+        if self.offsets[-1] != self.offsets[0] + (self.frames - 1) * self.record_size:
+            raise ArchiveError('Replay records are not contiguous')
+        if len(buffer) < self.offsets[-1] + self.record_size:
+            raise ArchiveError('Archive is truncated (records)')
+        self.data = np.frombuffer(buffer, dtype=np.uint8)
+
+    def close(self):
+        self.data = None
+        super().close()
+
+    def _view(self, dtype, shape, offset, strides):
+        return np.ndarray(shape, dtype=dtype, buffer=self.data, offset=offset, strides=strides)
+
+    def grid(self, step):
+        """(height, width) uint8 cell codes of one step, without copying"""
+        if not 0 <= step < self.frames:
+            raise IndexError(f'Step {step} out of range (0-{self.frames - 1})')
+        return self._view(np.uint8, (self.height, self.width),
+                          self.offsets[step] + RECORD.size, (self.width, 1))
+
+    def grids(self):
+        """(steps, height, width) view of every grid in the replay"""
+        return self._view(np.uint8, (self.frames, self.height, self.width),
+                          self.offsets[0] + RECORD.size, (self.record_size, self.width, 1))
+
+    def states(self):
+        """Structured view of every step's record (robot, action, flowers)"""
+        return self._view(STATE_DTYPE, (self.frames,), self.offsets[0], (self.record_size,))
+
+    def robot(self, step):
+        """Robot JSON (Robot.fromJson shape) at a step"""
+        _, _, _, orientation, x, y, held, _ = self.record(step)
+        return {'position': {'x': x, 'y': y}, 'orientation': DIRECTIONS[orientation], 'flowersHeld': held}
+
+    def game_board(self, step):
+        """GameBoard JSON at a step"""
+        return self.board(step).to_json()
+
+    def stats(self):
+        """Per-replay analytics computed on the views"""
+        states = self.states()
+        actions = states['action']
+        delivered = states['flowers_delivered']
+        won = np.flatnonzero(delivered >= self.total_flowers)
+        moved = (np.diff(states['x'].astype(np.int16)) != 0) | (np.diff(states['y'].astype(np.int16)) != 0)
+        positions = states['y'].astype(np.int32) * self.width + states['x']
+        return {
+            'steps': self.frames - 1,
+            'won': bool(len(won)),
+            'stepsToWin': int(won[0]) if len(won) else None,
+            'actions': {ACTIONS[a]: int((actions[1:] == a).sum()) for a in range(len(ACTIONS))},
+            # Moves already turn the robot, and a no-op step changes nothing
+            'wastedSteps': int((actions[1:] == ROTATE).sum() + (actions[1:] == NO_ACTION).sum()),
+            'revisits': int(moved.sum() - (len(np.unique(positions)) - 1)),
+            'cellsCleaned': int((actions == CLEAN).sum()),
+            'flowersDelivered': int(delivered[-1]),
+        }
+
+
+def main():
+    """Print analytics for fixed-record replay archives"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('archives', nargs='+', help='.rfpr files written with --full-frames')
+    parser.add_argument('--json', action='store_true', help='one JSON line per archive')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    steps = 0
+    failed = []
+    for path in args.archives:
+        try:
+            with ReplayReader.open(path) as reader:
+                stats = reader.stats()
+        except (OSError, ArchiveError) as e:
+            # Keep --json output to one JSON line per archive
+            print(f"   ❌ {path}: {e}", file=sys.stderr if args.json else sys.stdout)
+            failed.append(path)
+            continue
+        steps += stats['steps']
+        if args.json:
+            print(json.dumps(dict(stats, file=path)))
+        else:
+            outcome = f"won in {stats['stepsToWin']}" if stats['won'] else 'not won'
+            print(f"   {path}: {stats['steps']} steps, {outcome}, "
+                  f"{stats['wastedSteps']} wasted, {stats['revisits']} revisits")
+    if not args.json:
+        elapsed = time.perf_counter() - start
+        read = len(args.archives) - len(failed)
+        print(f"✅ {read:,} replays, {steps:,} steps in {elapsed:.2f}s"
+              + (f", {len(failed):,} failed" if failed else ''))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
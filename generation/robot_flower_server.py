@@ -0,0 +1,1272 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Local Stand-in Backend
+asyncio HTTP/1.1 server implementing the REST contract from docs/API.md
+
+Games live in memory and are stepped with the reference engine. Response
+bodies are cached as bytes and rebuilt only when a game changes; board cells
+are encoded from per-size fragment tables instead of going through json.
+GET responses carry an ETag; a matching If-None-Match gets an empty 304.
+GET /api/games?view=summary pages through GameSummary objects, newest first,
+with an opaque cursor. POST /api/games/{id}/actions applies a batch of
+actions in one request.
+
+Clients that list COMPACT_TYPE in Accept get games and replays in the
+compact encoding (Board.to_compact, actions as arrays), and bodies from
+MIN_COMPRESS_SIZE up are gzip- (or, with the brotli module, br-) encoded
+when Accept-Encoding allows it.
+
+serve --fault-* makes it a flaky backend (stragglers, 503s, dropped
+connections) to measure client retry and hedging policies against.
+
+GET /api/games/{id}/stream upgrades to a WebSocket that pushes a snapshot,
+then one small step event per applied action (including each step of a
+POST .../autoplay?stream=true). Every event is framed once per encoding and
+written to all subscribers of the game; bench-stream measures the fan-out.
+"""
+
+import argparse
+import asyncio
+import base64
+import functools
+import gzip
+import hashlib
+import json
+import multiprocessing
+import random
+import socket
+import struct
+import time
+import uuid
+import zlib
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlencode
+
+from robot_flower_boards import MAX_BOARD_SIZE, MIN_BOARD_SIZE, generate_board
+from robot_flower_engine import (
+    ACTION_CODES, ACTIONS, DIRECTION_CODES, DIRECTIONS, PLAYING, STATUSES,
+    encode_board, encode_compact_board,
+)
+from robot_flower_solver import solve
+
+try:
+    import brotli
+except ImportError:  # br is only offered when the brotli module is installed
+    brotli = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional speed-up
+    uvloop = None
+
+try:
+    import resource
+except ImportError:  # only used to raise the fd limit for bench-stream
+    resource = None
+
+MAX_BODY_SIZE = 1 << 20
+# GET /api/games without a limit (docs/API.md)
+DEFAULT_LIST_LIMIT = 10
+# AppConstants.gamesPageSize / maxGamesPageSize
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+# AppConstants.maxActionBatch
+MAX_ACTION_BATCH = 50
+
+JSON_TYPE = 'application/json'
+# WireFormat.compactType in the generated app
+COMPACT_TYPE = 'application/vnd.rfp.compact+json'
+# Smaller bodies are not worth the compression overhead
+MIN_COMPRESS_SIZE = 1024
+# Pause between the steps of a streamed autoplay (serve --autoplay-step-ms)
+AUTOPLAY_STEP_MS = 50.0
+# A subscriber with more unsent bytes than this is dropped, not buffered
+MAX_SUBSCRIBER_BUFFER = 1 << 20
+
+REASONS = {
+    200: 'OK', 201: 'Created', 204: 'No Content', 304: 'Not Modified', 400: 'Bad Request',
+    404: 'Not Found', 409: 'Conflict', 413: 'Payload Too Large',
+    500: 'Internal Server Error', 503: 'Service Unavailable',
+}
+
+
+class HttpError(Exception):
+    """Error turned into the JSON error format from docs/API.md"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+# -- Encoding --
+
+def encode_action(action, direction, timestamp, error):
+    return json.dumps({
+        'type': action,
+        'direction': direction,
+        'timestamp': timestamp,
+        'success': error is None,
+        'errorMessage': error,
+    }, separators=(',', ':')).encode()
+
+
+def encode_compact_action(action, direction, timestamp, error):
+    return json.dumps([action, direction, timestamp, error], separators=(',', ':')).encode()
+
+
+def encode_error(status, message):
+    return json.dumps({
+        'message': message,
+        'statusCode': status,
+        'error': REASONS.get(status, 'Error'),
+    }, separators=(',', ':')).encode()
+
+
+# -- Game store --
+
+class GameRecord:
+    """One game plus the cached bytes of its JSON representations
+
+    Actions are kept as one growing JSON fragment so that a request never
+    re-joins the whole history. Verbose and compact fragments are kept side
+    by side; bodies are indexed by compact (False, True).
+    """
+
+    __slots__ = ('id', 'key', 'name', 'board', 'actions', 'last_action', 'replay', 'created_at',
+                 'updated_at', '_body', '_replay_body', '_summary_body')
+
+    def __init__(self, game_id, name, board, key=None):
+        self.id = game_id
+        self.key = key
+        self.name = name
+        self.board = board
+        self.actions = (bytearray(), bytearray())
+        self.last_action = None
+        self.replay = ([encode_board(board)], [encode_compact_board(board)])
+        self.created_at = now_iso()
+        self.updated_at = None
+        self._body = [None, None]
+        self._replay_body = [None, None]
+        self._summary_body = None
+
+    @property
+    def status(self):
+        return STATUSES[self.board.status]
+
+    def apply(self, action, direction):
+        timestamp = now_iso()
+        error = self.board.apply(ACTION_CODES[action], DIRECTION_CODES[direction])
+        verbose, compact = self.actions
+        if verbose:
+            verbose += b','
+            compact += b','
+        self.last_action = (encode_action(action, direction, timestamp, error),
+                            encode_compact_action(action, direction, timestamp, error))
+        verbose += self.last_action[0]
+        compact += self.last_action[1]
+        self.replay[0].append(encode_board(self.board))
+        self.replay[1].append(encode_compact_board(self.board))
+        self.updated_at = timestamp
+        self._body = [None, None]
+        self._replay_body = [None, None]
+        self._summary_body = None
+        return error
+
+    def body(self, compact=False):
+        if self._body[compact] is None:
+            self._body[compact] = b''.join((
+                b'{"id":%s,"name":%s,"board":' % (json.dumps(self.id).encode(), json.dumps(self.name).encode()),
+                self.replay[compact][-1],
+                b',"status":"%s","actions":[' % self.status.encode(),
+                self.actions[compact],
+                b'],"createdAt":"%s","updatedAt":%s}' % (
+                    self.created_at.encode(),
+                    b'"%s"' % self.updated_at.encode() if self.updated_at else b'null',
+                ),
+            ))
+        return self._body[compact]
+
+    def snapshot_event(self, compact=False):
+        return b'{"type":"snapshot","game":%s}' % self.body(compact)
+
+    def step_event(self, compact=False):
+        """The last applied action as a stream event; step is the length of
+        the actions list once it is applied"""
+        return b'{"type":"step","step":%d,"action":%s,"board":%s,"status":"%s","updatedAt":"%s"}' % (
+            len(self.replay[0]) - 1, self.last_action[compact], self.replay[compact][-1],
+            self.status.encode(), self.updated_at.encode())
+
+    def summary_body(self):
+        """GameSummary JSON: what the games list shows, no cells or history"""
+        if self._summary_body is None:
+            board = self.board
+            self._summary_body = json.dumps({
+                'id': self.id,
+                'name': self.name,
+                'status': self.status,
+                'boardWidth': board.width,
+                'boardHeight': board.height,
+                'totalFlowers': board.total_flowers,
+                'flowersDelivered': board.flowers_delivered,
+                'actionCount': len(self.replay[0]) - 1,
+                'createdAt': self.created_at,
+                'updatedAt': self.updated_at,
+            }, separators=(',', ':')).encode()
+        return self._summary_body
+
+    def replay_body(self, compact=False):
+        if self._replay_body[compact] is None:
+            self._replay_body[compact] = b'[' + b','.join(self.replay[compact]) + b']'
+        return self._replay_body[compact]
+
+
+class GameStore:
+    """In-memory games keyed by id, with a cached list body
+
+    owns is an optional predicate on new ids; sharded workers use it so that
+    every game they create is routed back to them.
+    """
+
+    def __init__(self, seed=None, owns=None):
+        self.games = {}
+        self.rng = random.Random(seed)
+        self.owns = owns
+        self._list_body = [None, None]
+        # Creation order for cursor pagination; keys only ever grow
+        self.ordered = []
+        self.keys = []
+        self._last_ns = 0
+
+    def new_id(self):
+        while True:
+            game_id = str(uuid.uuid4())
+            if self.owns is None or self.owns(game_id):
+                return game_id
+
+    def next_key(self, game_id):
+        """Sort key of a new game: creation time (kept strictly increasing)
+        plus the id, so keys from different shards merge in creation order"""
+        self._last_ns = max(time.time_ns(), self._last_ns + 1)
+        return '%016x.%s' % (self._last_ns, game_id)
+
+    def create(self, name, size):
+        game_id = self.new_id()
+        game = GameRecord(game_id, name, generate_board(size, self.rng), self.next_key(game_id))
+        self.games[game.id] = game
+        self.ordered.append(game)
+        self.keys.append(game.key)
+        self._list_body = [None, None]
+        return game
+
+    def summary_page(self, cursor, limit):
+        """Up to limit games created before cursor, newest first, and the
+        cursor of the following page (None on the last one)"""
+        end = bisect_left(self.keys, cursor) if cursor else len(self.keys)
+        start = max(0, end - limit)
+        games = self.ordered[start:end][::-1]
+        return games, games[-1].key if start > 0 else None
+
+    def get(self, game_id):
+        game = self.games.get(game_id)
+        if game is None:
+            raise HttpError(404, f'Game {game_id} not found')
+        return game
+
+    def touched(self):
+        self._list_body = [None, None]
+
+    def newest(self, limit):
+        """The newest limit games, in creation order"""
+        return self.ordered[-limit:]
+
+    def list_body(self, compact=False, limit=DEFAULT_LIST_LIMIT):
+        """The newest limit games; the body of all of them is cached"""
+        if limit < len(self.ordered):
+            return b'[' + b','.join(game.body(compact) for game in self.newest(limit)) + b']'
+        if self._list_body[compact] is None:
+            self._list_body[compact] = b'[' + b','.join(
+                game.body(compact) for game in self.games.values()) + b']'
+        return self._list_body[compact]
+
+
+# -- HTTP --
+
+def encode_page(items, next_cursor):
+    return b'{"items":[%s],"nextCursor":%s}' % (
+        b','.join(items), json.dumps(next_cursor).encode())
+
+
+def parse_page_query(path, max_limit=MAX_PAGE_SIZE):
+    """(cursor, limit) of a summary list request"""
+    query = parse_qs(path.partition('?')[2])
+    cursor = query.get('cursor', [None])[0]
+    try:
+        limit = int(query.get('limit', [DEFAULT_PAGE_SIZE])[0])
+    except ValueError:
+        raise HttpError(400, 'limit must be an integer')
+    if not 1 <= limit <= max_limit:
+        raise HttpError(400, f'limit must be between 1 and {max_limit}')
+    if cursor is not None and '.' not in cursor:
+        raise HttpError(400, 'Invalid cursor')
+    return cursor, limit
+
+
+def parse_list_limit(path):
+    """limit of a full list request"""
+    value = parse_qs(path.partition('?')[2]).get('limit', [DEFAULT_LIST_LIMIT])[0]
+    try:
+        limit = int(value)
+    except ValueError:
+        raise HttpError(400, 'limit must be an integer')
+    if limit < 1:
+        raise HttpError(400, 'limit must be at least 1')
+    return limit
+
+
+def _board_size(data):
+    """boardSize, or the square cols x rows board of docs/API.md"""
+    if 'boardSize' in data or not ('cols' in data or 'rows' in data):
+        return data.get('boardSize')
+    if data.get('cols') != data.get('rows'):
+        raise HttpError(400, 'Only square boards are supported: cols must equal rows')
+    return data.get('cols')
+
+
+def _is_summary_view(path):
+    return 'view=summary' in path.partition('?')[2].split('&')
+
+
+def _query_flag(path, name):
+    return f'{name}=true' in path.partition('?')[2].split('&')
+
+
+def _parse_json(body):
+    try:
+        data = json.loads(body) if body else {}
+    except ValueError:
+        raise HttpError(400, 'Request body is not valid JSON')
+    if not isinstance(data, dict):
+        raise HttpError(400, 'Request body must be a JSON object')
+    return data
+
+
+def _parse_action(data):
+    action = data.get('action')
+    direction = data.get('direction')
+    if action not in ACTION_CODES:
+        raise HttpError(400, f'Unknown action: {action}')
+    if direction not in DIRECTION_CODES:
+        raise HttpError(400, f'Unknown direction: {direction}')
+    return action, direction
+
+
+class Api:
+    """Routes requests from docs/API.md onto a GameStore
+
+    Every applied action is published to the game's stream subscribers.
+    """
+
+    def __init__(self, store, autoplay_step_ms=AUTOPLAY_STEP_MS):
+        self.store = store
+        self.hub = StreamHub()
+        self.autoplay_step_ms = autoplay_step_ms
+        # Games with a streamed autoplay in progress accept no other writes
+        self.autoplaying = set()
+
+    async def dispatch(self, method, path, body, compact=False):
+        parts = path.split('?', 1)[0].strip('/').split('/')
+        if (method == 'POST' and len(parts) == 4 and parts[:2] == ['api', 'games']
+                and parts[3] == 'autoplay' and _query_flag(path, 'stream')):
+            game = self.writable(parts[2])
+            await self.stream_autoplay(game)
+            return 200, game.body(compact)
+        return self.handle(method, path, body, compact)
+
+    def handle(self, method, path, body, compact=False):
+        """Return (status, body bytes) for one request; compact selects the
+        compact encoding of games and replays"""
+        parts = path.split('?', 1)[0].strip('/').split('/')
+        if parts[:2] != ['api', 'games']:
+            raise HttpError(404, f'No route for {path}')
+        if len(parts) == 2:
+            if method == 'GET' and _is_summary_view(path):
+                games, next_cursor = self.store.summary_page(*parse_page_query(path))
+                return 200, encode_page([game.summary_body() for game in games], next_cursor)
+            if method == 'GET':
+                return 200, self.store.list_body(compact, parse_list_limit(path))
+            if method == 'POST':
+                status, game = self.create(_parse_json(body))
+                return status, game.body(compact)
+        elif len(parts) == 3 and method == 'GET':
+            return 200, self.store.get(parts[2]).body(compact)
+        elif len(parts) == 4:
+            game = self.writable(parts[2]) if method == 'POST' else self.store.get(parts[2])
+            if parts[3] == 'action' and method == 'POST':
+                self.action(game, _parse_json(body))
+                return 200, game.body(compact)
+            if parts[3] == 'actions' and method == 'POST':
+                applied = self.actions(game, _parse_json(body))
+                return 200, b'{"game":%s,"applied":%d}' % (game.body(compact), applied)
+            if parts[3] == 'autoplay' and method == 'POST':
+                self.autoplay(game)
+                return 200, game.body(compact)
+            if parts[3] == 'replay' and method == 'GET':
+                return 200, game.replay_body(compact)
+        raise HttpError(404, f'No route for {method} {path}')
+
+    def writable(self, game_id):
+        game = self.store.get(game_id)
+        if game_id in self.autoplaying:
+            raise HttpError(409, 'Game is being autoplayed')
+        return game
+
+    def apply(self, game, action, direction):
+        game.apply(action, direction)
+        self.hub.publish(game)
+
+    def create(self, data):
+        name = data.get('name')
+        if not isinstance(name, str) or not name:
+            raise HttpError(400, 'Game name cannot be empty')
+        size = _board_size(data)
+        if not isinstance(size, int) or not MIN_BOARD_SIZE <= size <= MAX_BOARD_SIZE:
+            raise HttpError(400, f'Board size must be between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}')
+        return 201, self.store.create(name, size)
+
+    def action(self, game, data):
+        action, direction = _parse_action(data)
+        if game.board.status != PLAYING:
+            raise HttpError(400, 'Game is already finished')
+        self.apply(game, action, direction)
+        self.store.touched()
+
+    def actions(self, game, data):
+        """Apply a batch in order, stopping at the action that ends the game;
+        the whole batch is validated before any of it is applied. Returns the
+        number of actions applied."""
+        batch = data.get('actions')
+        if not isinstance(batch, list) or not 1 <= len(batch) <= MAX_ACTION_BATCH:
+            raise HttpError(400, f'actions must hold 1 to {MAX_ACTION_BATCH} actions')
+        batch = [_parse_action(item if isinstance(item, dict) else {}) for item in batch]
+        if game.board.status != PLAYING:
+            raise HttpError(400, 'Game is already finished')
+        applied = 0
+        for action, direction in batch:
+            self.apply(game, action, direction)
+            applied += 1
+            if game.board.status != PLAYING:
+                break
+        self.store.touched()
+        return applied
+
+    def autoplay(self, game):
+        if game.board.status != PLAYING:
+            raise HttpError(400, 'Game is already finished')
+        for action, direction in solve(game.board):
+            self.apply(game, ACTIONS[action], DIRECTIONS[direction])
+        self.store.touched()
+
+    async def stream_autoplay(self, game):
+        """Autoplay one step every autoplay_step_ms, so subscribers watch the
+        robot play; the request is answered with the final game"""
+        if game.board.status != PLAYING:
+            raise HttpError(400, 'Game is already finished')
+        self.autoplaying.add(game.id)
+        try:
+            for step, (action, direction) in enumerate(solve(game.board)):
+                if step:
+                    await asyncio.sleep(self.autoplay_step_ms / 1000)
+                self.apply(game, ACTIONS[action], DIRECTIONS[direction])
+                self.store.touched()
+        finally:
+            self.autoplaying.discard(game.id)
+
+
+def _head(status, length, keep_alive, etag=None, content_type=JSON_TYPE, coding=None):
+    return (
+        b'HTTP/1.1 %d %s\r\n'
+        b'Content-Type: %s\r\n'
+        b'Content-Length: %d\r\n'
+        b'%s%s'
+        b'Vary: Accept, Accept-Encoding\r\n'
+        b'Access-Control-Allow-Origin: *\r\n'
+        b'Access-Control-Expose-Headers: ETag\r\n'
+        b'Connection: %s\r\n\r\n'
+        % (status, REASONS.get(status, 'Error').encode(), content_type.encode(), length,
+           b'ETag: %s\r\n' % etag if etag else b'',
+           b'Content-Encoding: %s\r\n' % coding.encode() if coding else b'',
+           b'keep-alive' if keep_alive else b'close')
+    )
+
+
+def etag_for(body, coding=None):
+    """Strong validator for a response body; stable across processes, so
+    every shard hands out the same tag for the same representation. Each
+    content coding is a representation of its own, so it gets its own tag."""
+    tag = b'%x-%08x' % (len(body), zlib.crc32(body))
+    return b'"%s-%s"' % (tag, coding.encode()) if coding else b'"%s"' % tag
+
+
+def _qvalues(header):
+    """{token: q} of an Accept or Accept-Encoding header"""
+    values = {}
+    for item in header.split(','):
+        token, *params = [part.strip() for part in item.split(';')]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if token:
+            values[token.lower()] = q
+    return values
+
+
+def wants_compact(accept):
+    """True if Accept ranks COMPACT_TYPE at least as high as plain JSON"""
+    if not accept or COMPACT_TYPE not in accept:
+        return False
+    q = _qvalues(accept)
+    return q.get(COMPACT_TYPE, 0) > 0 and q[COMPACT_TYPE] >= q.get(JSON_TYPE, 0)
+
+
+def content_coding(accept_encoding):
+    """Best coding we can produce for an Accept-Encoding, or None"""
+    if not accept_encoding:
+        return None
+    q = _qvalues(accept_encoding)
+    if brotli is not None and q.get('br', 0) > 0:
+        return 'br'
+    if q.get('gzip', 0) > 0:
+        return 'gzip'
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def compress(body, coding):
+    """Encoded body; cached, since the same cached game or replay bytes are
+    served many times between changes"""
+    if coding == 'br':
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def not_modified(etag, if_none_match):
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.encode('latin-1').split(b',')]
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return b'*' in tags or etag in tags or b'W/' + etag in tags
+
+
+def _not_modified_head(keep_alive, etag):
+    return (
+        b'HTTP/1.1 304 Not Modified\r\n'
+        b'ETag: %s\r\n'
+        b'Vary: Accept, Accept-Encoding\r\n'
+        b'Access-Control-Allow-Origin: *\r\n'
+        b'Access-Control-Expose-Headers: ETag\r\n'
+        b'Connection: %s\r\n\r\n'
+        % (etag, b'keep-alive' if keep_alive else b'close')
+    )
+
+
+PREFLIGHT = (
+    b'HTTP/1.1 204 No Content\r\n'
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+    b'Access-Control-Allow-Headers: Content-Type, Accept, If-None-Match\r\n'
+    b'Content-Length: 0\r\n\r\n'
+)
+
+
+class Faults:
+    """Failures injected into API requests (not preflights)
+
+    Each request independently has its connection closed unanswered with
+    drop_rate, gets a 503 with error_rate, and is otherwise answered slow_ms
+    late with slow_rate: the stragglers that make up a latency tail.
+    """
+
+    def __init__(self, drop_rate=0.0, error_rate=0.0, slow_rate=0.0, slow_ms=1000.0, seed=None):
+        self.drop_rate = drop_rate
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self.rng = random.Random(seed)
+
+    def __bool__(self):
+        return bool(self.drop_rate or self.error_rate or self.slow_rate)
+
+    async def inject(self):
+        """'drop', 'error' or None, after sleeping for a straggler"""
+        roll = self.rng.random()
+        if roll < self.drop_rate:
+            return 'drop'
+        if roll < self.drop_rate + self.error_rate:
+            return 'error'
+        if self.rng.random() < self.slow_rate:
+            await asyncio.sleep(self.slow_ms / 1000)
+        return None
+
+
+# -- Streaming (RFC 6455 WebSocket) --
+
+WS_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+WS_TEXT, WS_CLOSE, WS_PING, WS_PONG = 0x1, 0x8, 0x9, 0xA
+
+
+def ws_accept(key):
+    return base64.b64encode(hashlib.sha1(key.encode() + WS_GUID).digest())
+
+
+def ws_frame(payload, opcode=WS_TEXT):
+    """One unmasked, unfragmented frame, as servers send them"""
+    length = len(payload)
+    if length < 126:
+        head = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 1 << 16:
+        head = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        head = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return head + payload
+
+
+async def read_ws_frame(reader):
+    """(opcode, payload) of the next frame, unmasking client frames"""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack('!H', await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack('!Q', await reader.readexactly(8))
+    if length > MAX_BODY_SIZE:
+        raise ConnectionError('WebSocket frame too large')
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+    return first & 0x0F, payload
+
+
+class StreamHub:
+    """WebSocket subscribers per game
+
+    publish() frames the game's last step once per encoding and writes the
+    same bytes to every subscriber without awaiting them; a subscriber
+    whose transport holds more than max_buffer unsent bytes has fallen
+    behind and is disconnected, so it resubscribes and gets a fresh
+    snapshot instead of an ever-growing backlog.
+    """
+
+    def __init__(self, max_buffer=MAX_SUBSCRIBER_BUFFER):
+        self.max_buffer = max_buffer
+        self.subscribers = {}  # game id -> {writer: compact}
+        self.delivered = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return sum(len(writers) for writers in self.subscribers.values())
+
+    def publish(self, game):
+        writers = self.subscribers.get(game.id)
+        if not writers:
+            return
+        frames = [None, None]
+        for writer, compact in list(writers.items()):
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                del writers[writer]
+                writer.close()
+                self.dropped += 1
+                continue
+            if frames[compact] is None:
+                frames[compact] = ws_frame(game.step_event(compact))
+            writer.write(frames[compact])
+            self.delivered += 1
+
+    async def subscribe(self, game, reader, writer, compact=False):
+        """Send the snapshot, then serve pings and the close handshake until
+        the client goes away; events are written by publish()"""
+        writer.write(ws_frame(game.snapshot_event(compact)))
+        self.subscribers.setdefault(game.id, {})[writer] = compact
+        try:
+            while True:
+                opcode, payload = await read_ws_frame(reader)
+                if opcode == WS_CLOSE:
+                    writer.write(ws_frame(payload[:2], WS_CLOSE))
+                    break
+                if opcode == WS_PING:
+                    writer.write(ws_frame(payload, WS_PONG))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writers = self.subscribers.get(game.id)
+            if writers is not None:
+                writers.pop(writer, None)
+                if not writers:
+                    del self.subscribers[game.id]
+
+
+async def serve_stream(api, path, headers, reader, writer):
+    """Upgrade GET /api/games/{id}/stream to a WebSocket subscription
+
+    Browsers cannot set Accept on a WebSocket, so ?compact=true also
+    selects the compact encoding. Unknown games get a plain 404.
+    """
+    parts = path.split('?', 1)[0].strip('/').split('/')
+    key = headers.get('sec-websocket-key')
+    try:
+        if len(parts) != 4 or parts[:2] != ['api', 'games'] or parts[3] != 'stream':
+            raise HttpError(404, f'No route for {path}')
+        if not key:
+            raise HttpError(400, 'Missing Sec-WebSocket-Key')
+        game = api.store.get(parts[2])
+    except HttpError as e:
+        body = encode_error(e.status, e.message)
+        writer.write(_head(e.status, len(body), False) + body)
+        await writer.drain()
+        return
+    writer.write(
+        b'HTTP/1.1 101 Switching Protocols\r\n'
+        b'Upgrade: websocket\r\n'
+        b'Connection: Upgrade\r\n'
+        b'Sec-WebSocket-Accept: %s\r\n\r\n' % ws_accept(key)
+    )
+    compact = _query_flag(path, 'compact') or wants_compact(headers.get('accept'))
+    await api.hub.subscribe(game, reader, writer, compact)
+
+
+async def serve_connection(api, reader, writer, faults=None):
+    """Serve keep-alive HTTP/1.1 requests on one connection"""
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                break
+            lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, path, version = lines[0].split(' ', 2)
+            except ValueError:
+                break
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                if name:
+                    headers[name.strip().lower()] = value.strip()
+            keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+            if method == 'GET' and headers.get('upgrade', '').lower() == 'websocket':
+                await serve_stream(api, path, headers, reader, writer)
+                break
+
+            length = int(headers.get('content-length') or 0)
+            if length > MAX_BODY_SIZE:
+                body = encode_error(413, 'Request body too large')
+                writer.write(_head(413, len(body), False) + body)
+                break
+            payload = await reader.readexactly(length) if length else b''
+
+            if method == 'OPTIONS':
+                writer.write(PREFLIGHT)
+            else:
+                fault = await faults.inject() if faults else None
+                if fault == 'drop':
+                    break
+                compact = wants_compact(headers.get('accept'))
+                try:
+                    if fault == 'error':
+                        raise HttpError(503, 'Injected fault')
+                    status, body = await api.dispatch(method, path, payload, compact)
+                except HttpError as e:
+                    status, body = e.status, encode_error(e.status, e.message)
+                except Exception as e:  # keep serving other requests
+                    status, body = 500, encode_error(500, str(e))
+                # Errors (including relayed ones) are plain JSON either way
+                content_type = COMPACT_TYPE if compact and status < 400 else JSON_TYPE
+                coding = content_coding(headers.get('accept-encoding')) if len(body) >= MIN_COMPRESS_SIZE else None
+                etag = etag_for(body, coding) if method == 'GET' and status == 200 else None
+                if etag and not_modified(etag, headers.get('if-none-match')):
+                    writer.write(_not_modified_head(keep_alive, etag))
+                else:
+                    if coding:
+                        body = compress(body, coding)
+                    writer.write(_head(status, len(body), keep_alive, etag, content_type, coding) + body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host, port, api=None, reuse_port=False, faults=None):
+    api = api or Api(GameStore())
+    return await asyncio.start_server(
+        lambda r, w: serve_connection(api, r, w, faults), host, port,
+        reuse_port=reuse_port, backlog=1024,
+    )
+
+
+async def read_response(reader):
+    """Read one response from our own server; returns (status, body)"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head[9:12])
+    if status == 304:
+        return status, b''
+    length = int(head.split(b'Content-Length: ', 1)[1].split(b'\r\n', 1)[0])
+    return status, await reader.readexactly(length)
+
+
+def encode_request(method, path, body=b'', etag=None, compact=False, coding=None):
+    return (b'%s %s HTTP/1.1\r\nHost: stand-in\r\n%s%s%s'
+            b'Content-Type: application/json\r\nContent-Length: %d\r\n\r\n%s'
+            % (method.encode(), path.encode(),
+               b'If-None-Match: %s\r\n' % etag if etag else b'',
+               b'Accept: %s\r\n' % COMPACT_TYPE.encode() if compact else b'',
+               b'Accept-Encoding: %s\r\n' % coding.encode() if coding else b'',
+               len(body), body))
+
+
+# -- Sharding --
+
+def shard_for(game_id, shards):
+    """Owning shard of a game id; stable across processes (unlike hash())"""
+    return zlib.crc32(game_id.encode()) % shards
+
+
+class ShardPeer:
+    """Pooled keep-alive connections to another worker's private port"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.idle = deque()
+
+    async def request(self, method, path, body=b'', compact=False):
+        if self.idle:
+            reader, writer = self.idle.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(encode_request(method, path, body, compact=compact))
+            response = await read_response(reader)
+        except BaseException:
+            writer.close()
+            raise
+        self.idle.append((reader, writer))
+        return response
+
+
+class ShardedApi(Api):
+    """Api for one shard: serves games it owns, forwards the rest
+
+    Workers share nothing. A request for another shard's game is relayed to
+    that shard's private port; the game list is gathered from every shard,
+    and summary pages are merged by creation key.
+    Shard-aware clients can skip the relay by connecting to the owner's
+    private port directly (see shard_for). Streams are not relayed: a game
+    is only streamed by its owner, so subscribe on the owner's private port.
+    """
+
+    LOCAL_LIST = '/_shard/games'
+    LOCAL_SUMMARIES = '/_shard/summaries'
+
+    def __init__(self, index, peers, seed=None):
+        super().__init__(GameStore(seed, owns=lambda game_id: shard_for(game_id, len(peers)) == index))
+        self.index = index
+        self.peers = peers
+
+    async def dispatch(self, method, path, body, compact=False):
+        route = path.split('?', 1)[0].strip('/').split('/')
+        if route == ['_shard', 'games']:
+            games = self.store.newest(parse_list_limit(path))
+            return 200, json.dumps([[game.key, game.body(compact).decode()] for game in games]).encode()
+        if route == ['_shard', 'summaries']:
+            games, _ = self.store.summary_page(*parse_page_query(path, MAX_PAGE_SIZE + 1))
+            return 200, json.dumps([[game.key, game.summary_body().decode()] for game in games]).encode()
+        if route == ['api', 'games'] and method == 'GET' and _is_summary_view(path):
+            return 200, await self._gather_summaries(path)
+        if route == ['api', 'games'] and method == 'GET':
+            return 200, await self._gather_list(parse_list_limit(path), compact)
+        if len(route) >= 3 and route[:2] == ['api', 'games']:
+            owner = shard_for(route[2], len(self.peers))
+            if owner != self.index:
+                return await self.peers[owner].request(method, path, body, compact)
+        return await super().dispatch(method, path, body, compact)
+
+    async def _gather_summaries(self, path):
+        """Merge every shard's newest-first page into one global page"""
+        cursor, limit = parse_page_query(path)
+        # One extra entry per shard tells whether anything follows this page
+        query = urlencode({'limit': min(limit + 1, MAX_PAGE_SIZE + 1), **({'cursor': cursor} if cursor else {})})
+        local, _ = self.store.summary_page(cursor, limit + 1)
+        pages = await asyncio.gather(*[
+            peer.request('GET', f'{self.LOCAL_SUMMARIES}?{query}')
+            for i, peer in enumerate(self.peers) if i != self.index
+        ])
+        entries = [(game.key, game.summary_body()) for game in local]
+        for _, body in pages:
+            entries.extend((key, item.encode()) for key, item in json.loads(body))
+        entries.sort(reverse=True)
+        page = entries[:limit]
+        next_cursor = page[-1][0] if len(entries) > limit else None
+        return encode_page([item for _, item in page], next_cursor)
+
+    async def _gather_list(self, limit, compact=False):
+        """The newest limit games across every shard, merged in creation order"""
+        lists = await asyncio.gather(*[
+            peer.request('GET', f'{self.LOCAL_LIST}?limit={limit}', compact=compact)
+            for i, peer in enumerate(self.peers) if i != self.index
+        ])
+        entries = [(game.key, game.body(compact)) for game in self.store.newest(limit)]
+        for _, body in lists:
+            entries.extend((key, item.encode()) for key, item in json.loads(body))
+        entries.sort()
+        return b'[' + b','.join(item for _, item in entries[-limit:]) + b']'
+
+
+def _run_shard(index, shards, host, port, shard_port, seed):
+    """Worker process: public SO_REUSEPORT listener plus a private one"""
+    async def serve():
+        peers = [ShardPeer('127.0.0.1', shard_port + i) for i in range(shards)]
+        api = ShardedApi(index, peers, None if seed is None else seed + index)
+        public = await start_server(host, port, api, reuse_port=True)
+        private = await start_server('127.0.0.1', shard_port + index, api)
+        async with public, private:
+            await asyncio.gather(public.serve_forever(), private.serve_forever())
+
+    try:
+        run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def start_shards(shards, host, port, shard_port, seed=None):
+    """Fork one worker process per shard; returns the processes"""
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        raise RuntimeError('Sharded mode needs SO_REUSEPORT (Linux, BSD or macOS)')
+    context = multiprocessing.get_context('fork')
+    workers = [
+        context.Process(target=_run_shard, args=(i, shards, host, port, shard_port, seed), daemon=True)
+        for i in range(shards)
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+# -- Benchmark --
+
+async def _bench_worker(host, port, request, deadline, counter):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            writer.write(request)
+            _, body = await read_response(reader)
+            counter[0] += 1
+            counter[1] += len(body)
+    finally:
+        writer.close()
+
+
+# Actions per request for --endpoint actions
+BENCH_BATCH = 10
+
+
+def bench_request(endpoint, game_id, etag=None, compact=False, coding=None):
+    """Raw request bytes for the benchmarked endpoint"""
+    if endpoint == 'action':
+        # Rotations never end the game, so every request does the full work
+        return encode_request('POST', f'/api/games/{game_id}/action',
+                              b'{"action":"rotate","direction":"EAST"}', compact=compact, coding=coding)
+    if endpoint == 'actions':
+        return encode_request('POST', f'/api/games/{game_id}/actions', json.dumps({
+            'actions': [{'action': 'rotate', 'direction': 'EAST'}] * BENCH_BATCH,
+        }).encode(), compact=compact, coding=coding)
+    return encode_request('GET', f'/api/games/{game_id}', etag=etag, compact=compact, coding=coding)
+
+
+async def bench(connections, seconds, size, endpoint, conditional=False, compact=False, coding=None):
+    store = GameStore(seed=1)
+    # One game per connection keeps action histories at realistic lengths
+    games = [store.create(f'bench-{i}', size) for i in range(connections)]
+    server = await start_server('127.0.0.1', 0, Api(store))
+    port = server.sockets[0].getsockname()[1]
+    counter = [0, 0]
+    deadline = time.perf_counter() + seconds
+
+    def etag(game):
+        body = game.body(compact)
+        return etag_for(body, coding if len(body) >= MIN_COMPRESS_SIZE else None)
+
+    async with server:
+        await asyncio.gather(*[
+            _bench_worker('127.0.0.1', port, bench_request(
+                endpoint, game.id, etag(game) if conditional else None, compact, coding), deadline, counter)
+            for game in games
+        ])
+    batched = f" ({counter[0] * BENCH_BATCH / seconds:,.0f} actions/s)" if endpoint == 'actions' else ''
+    options = ''.join([', If-None-Match' if conditional else '', ', compact' if compact else '',
+                       f', {coding}' if coding else ''])
+    print(f"   {endpoint} ({size}x{size}{options}): "
+          f"{counter[0] / seconds:,.0f} req/s{batched}, {counter[1] / max(counter[0], 1):,.0f} body bytes/response "
+          f"over {connections} keep-alive connections")
+
+
+async def _shard_client(port, shard_port, shards, connections, seconds, size, endpoint):
+    """Shard-aware load: create games on the public port, drive their owners"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    games = []
+    for i in range(connections):
+        writer.write(encode_request('POST', '/api/games',
+                                    json.dumps({'name': f'bench-{i}', 'boardSize': size}).encode()))
+        _, body = await read_response(reader)
+        games.append(json.loads(body)['id'])
+    writer.close()
+    counter = [0, 0]
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*[
+        _bench_worker('127.0.0.1', shard_port + shard_for(game_id, shards),
+                      bench_request(endpoint, game_id), deadline, counter)
+        for game_id in games
+    ])
+    return counter[0]
+
+
+def _shard_client_process(args):
+    return run(_shard_client(*args))
+
+
+def bench_shards(max_workers, connections, seconds, size, endpoint, port, shard_port):
+    """Throughput for 1..max_workers shards, with one client process per shard"""
+    counts = sorted({1, max_workers} | {n for n in (2, 4, 8, 16, 32, 64) if n < max_workers})
+    baseline = None
+    for shards in counts:
+        workers = start_shards(shards, '127.0.0.1', port, shard_port)
+        try:
+            _wait_for_port(port)
+            for i in range(shards):
+                _wait_for_port(shard_port + i)
+            context = multiprocessing.get_context('fork')
+            with context.Pool(shards) as pool:
+                totals = pool.map(_shard_client_process, [
+                    (port, shard_port, shards, connections, seconds, size, endpoint)
+                ] * shards)
+        finally:
+            for worker in workers:
+                worker.terminate()
+                worker.join()
+        rate = sum(totals) / seconds
+        baseline = baseline or rate
+        print(f"   {shards:>2} worker(s): {rate:>10,.0f} req/s  (x{rate / baseline:.2f})")
+
+
+STREAM_REQUEST = (
+    'GET /api/games/%s/stream HTTP/1.1\r\n'
+    'Host: stand-in\r\n'
+    'Upgrade: websocket\r\n'
+    'Connection: Upgrade\r\n'
+    'Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n'
+    'Sec-WebSocket-Version: 13\r\n\r\n'
+)
+
+
+async def _subscriber(port, game_id, sent, latencies):
+    """Subscribe, then time every event against its publish time"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write((STREAM_REQUEST % game_id).encode())
+    await reader.readuntil(b'\r\n\r\n')
+    await read_ws_frame(reader)  # snapshot
+    return asyncio.ensure_future(_receive(reader, writer, game_id, sent, latencies))
+
+
+async def _receive(reader, writer, game_id, sent, latencies):
+    try:
+        while True:
+            await read_ws_frame(reader)
+            latencies.append(time.perf_counter() - sent[game_id])
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _raise_fd_limit(needed):
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+async def bench_stream(subscribers, games, events, interval_ms, size):
+    """Fan-out of step events from games to subscribers spread over them"""
+    # A client and a server socket per subscriber
+    _raise_fd_limit(2 * subscribers + 256)
+    store = GameStore(seed=1)
+    api = Api(store)
+    records = [store.create(f'bench-{i}', size) for i in range(games)]
+    server = await start_server('127.0.0.1', 0, api)
+    port = server.sockets[0].getsockname()[1]
+    sent, latencies, receivers = {}, [], []
+    async with server:
+        for start in range(0, subscribers, 500):
+            receivers += await asyncio.gather(*[
+                _subscriber(port, records[i % games].id, sent, latencies)
+                for i in range(start, min(start + 500, subscribers))
+            ])
+        print(f"   {len(api.hub):,} subscribers on {games:,} games")
+        expected = events * subscribers
+        began = time.perf_counter()
+        for _ in range(events):
+            for game in records:
+                sent[game.id] = time.perf_counter()
+                # Rotations never end the game
+                api.action(game, {'action': 'rotate', 'direction': 'EAST'})
+            await asyncio.sleep(interval_ms / 1000)
+        deadline = time.perf_counter() + 10
+        while len(latencies) < expected - api.hub.dropped * events and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - began
+        for receiver in receivers:
+            receiver.cancel()
+        await asyncio.gather(*receivers, return_exceptions=True)
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+    print(f"   {len(latencies):,}/{expected:,} events delivered in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} events/s), {api.hub.dropped:,} slow subscribers dropped")
+    print(f"   publish -> receive latency: p50 {percentile(0.5):.1f}ms, p99 {percentile(0.99):.1f}ms, "
+          f"max {percentile(1.0):.1f}ms")
+
+
+def _wait_for_port(port, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def run(coroutine):
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(coroutine)
+
+
+async def serve_forever(host, port, seed, faults=None, autoplay_step_ms=AUTOPLAY_STEP_MS):
+    server = await start_server(host, port, Api(GameStore(seed), autoplay_step_ms), faults=faults)
+    print(f"🚀 Stand-in backend listening on http://{host}:{port}")
+    if faults:
+        print(f"   ⚠️  Injecting faults: {faults.drop_rate:.1%} dropped, {faults.error_rate:.1%} 503, "
+              f"{faults.slow_rate:.1%} delayed by {faults.slow_ms:g}ms")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Run the stand-in backend, or benchmark it in-process"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='command')
+    serve = sub.add_parser('serve', help='serve the API (default)')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8080)
+    serve.add_argument('--seed', type=int, default=None)
+    serve.add_argument('--workers', type=int, default=1,
+                       help='shard games across this many SO_REUSEPORT worker processes')
+    serve.add_argument('--shard-port', type=int, default=None,
+                       help='first private shard port (default: port + 1)')
+    serve.add_argument('--fault-drop-rate', type=float, default=0.0,
+                       help='share of requests whose connection is closed unanswered')
+    serve.add_argument('--fault-error-rate', type=float, default=0.0,
+                       help='share of requests answered with a 503')
+    serve.add_argument('--fault-slow-rate', type=float, default=0.0,
+                       help='share of requests answered --fault-slow-ms late')
+    serve.add_argument('--fault-slow-ms', type=float, default=1000.0)
+    serve.add_argument('--autoplay-step-ms', type=float, default=AUTOPLAY_STEP_MS,
+                       help='pause between the steps of a streamed autoplay')
+    bench_cmd = sub.add_parser('bench', help='measure single-core throughput')
+    bench_cmd.add_argument('--connections', type=int, default=50)
+    bench_cmd.add_argument('--seconds', type=float, default=5.0)
+    bench_cmd.add_argument('--size', type=int, default=10)
+    bench_cmd.add_argument('--endpoint', choices=('get', 'action', 'actions'), default='get')
+    bench_cmd.add_argument('--conditional', action='store_true',
+                           help='send the current ETag, so every get is a 304')
+    bench_cmd.add_argument('--compact', action='store_true', help='ask for the compact encoding')
+    bench_cmd.add_argument('--encoding', choices=('gzip', 'br'), default=None,
+                           help='ask for a compressed response (br needs the brotli module)')
+    shards_cmd = sub.add_parser('bench-shards', help='measure scaling from 1 to N workers')
+    shards_cmd.add_argument('--max-workers', type=int, default=multiprocessing.cpu_count())
+    shards_cmd.add_argument('--connections', type=int, default=50)
+    shards_cmd.add_argument('--seconds', type=float, default=5.0)
+    shards_cmd.add_argument('--size', type=int, default=10)
+    shards_cmd.add_argument('--endpoint', choices=('get', 'action', 'actions'), default='action')
+    shards_cmd.add_argument('--port', type=int, default=18080)
+    stream_cmd = sub.add_parser('bench-stream', help='measure WebSocket fan-out to many subscribers')
+    stream_cmd.add_argument('--subscribers', type=int, default=5000)
+    stream_cmd.add_argument('--games', type=int, default=100)
+    stream_cmd.add_argument('--events', type=int, default=50, help='actions applied per game')
+    stream_cmd.add_argument('--interval-ms', type=float, default=20.0,
+                            help='pause between rounds of one action per game')
+    stream_cmd.add_argument('--size', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == 'bench':
+        print("🚀 Benchmarking stand-in backend...")
+        if args.encoding == 'br' and brotli is None:
+            raise SystemExit("❌ --encoding br needs the brotli module (pip install brotli)")
+        run(bench(args.connections, args.seconds, args.size, args.endpoint, args.conditional,
+                  args.compact, args.encoding))
+    elif args.command == 'bench-shards':
+        print(f"🚀 Benchmarking sharded backend ({args.endpoint}, {multiprocessing.cpu_count()} cores)...")
+        bench_shards(args.max_workers, args.connections, args.seconds, args.size,
+                     args.endpoint, args.port, args.port + 1)
+    elif args.command == 'bench-stream':
+        print("🚀 Benchmarking stream fan-out...")
+        run(bench_stream(args.subscribers, args.games, args.events, args.interval_ms, args.size))
+    elif args.command == 'serve' and args.workers > 1:
+        if args.fault_drop_rate or args.fault_error_rate or args.fault_slow_rate:
+            raise SystemExit("❌ Fault injection runs with --workers 1")
+        shard_port = args.shard_port or args.port + 1
+        workers = start_shards(args.workers, args.host, args.port, shard_port, args.seed)
+        print(f"🚀 Stand-in backend listening on http://{args.host}:{args.port} "
+              f"({args.workers} shards, private ports {shard_port}-{shard_port + args.workers - 1})")
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            print("\n👋 Stand-in backend stopped")
+    else:
+        faults = None
+        if args.command == 'serve':
+            faults = Faults(args.fault_drop_rate, args.fault_error_rate, args.fault_slow_rate,
+                            args.fault_slow_ms, args.seed)
+        try:
+            run(serve_forever(getattr(args, 'host', '127.0.0.1'),
+                              getattr(args, 'port', 8080),
+                              getattr(args, 'seed', None), faults,
+                              getattr(args, 'autoplay_step_ms', AUTOPLAY_STEP_MS)))
+        except KeyboardInterrupt:
+            print("\n👋 Stand-in backend stopped")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Robot Flower Princess - Autoplay Solver
+Deterministic planner driven by incrementally maintained distance fields
+
+Two fields are kept for the whole game: the cost to reach the princess and
+the cost to reach the nearest flower, counted in actions (moving onto an
+empty cell costs 1, onto an obstacle 2 because it has to be cleaned first).
+The robot walks down the field it is following, so every step is a constant
+time lookup. When a cell opens up (an obstacle is cleaned, a flower picked)
+only the cells whose cost can change are relaxed again, instead of running
+BFS over the board from scratch.
+"""
+
+import argparse
+import functools
+import random
+import time
+
+from robot_flower_boards import generate_board
+from robot_flower_engine import (
+    CLEAN, DX, DY, EMPTY, FLOWER, GIVE_FLOWER, MAX_FLOWERS_HELD, MOVE,
+    OBSTACLE, PICK_FLOWER, PLAYING, ROBOT,
+)
+
+INF = float('inf')
+
+# Cost of stepping onto a cell, by cell code; anything else is never walkable
+ENTER_COST = {EMPTY: 1, ROBOT: 1, OBSTACLE: 2}
+BLOCKED = 255
+
+
+class DistanceField:
+    """Action cost from every cell to the nearest source, kept up to date
+
+    A source is a cell the robot acts on from a neighbouring cell (a flower
+    to pick, the princess to give to); sources themselves are never entered.
+    Each cell remembers which source it leads to, so removing a source only
+    recomputes the cells that were routed to it.
+    """
+
+    def __init__(self, board, sources):
+        self.board = board
+        self.princess = board.princess_y * board.width + board.princess_x
+        self.sources = set(sources)
+        size = board.width * board.height
+        self.cost = bytearray(BLOCKED if i == self.princess else ENTER_COST.get(c, BLOCKED)
+                              for i, c in enumerate(board.cells))
+        self.dist = [INF] * size
+        self.origin = [-1] * size
+        self.neighbours = _neighbours(board.width, board.height)
+        for source in self.sources:
+            self.cost[source] = 0
+            self.dist[source] = 0
+            self.origin[source] = source
+        self._relax(self.sources)
+
+    def enter_cost(self, index):
+        """Actions to step onto (or act on, for a source) a cell; None if blocked"""
+        cost = self.cost[index]
+        return None if cost == BLOCKED else cost
+
+    def _update_cost(self, index):
+        if index in self.sources:
+            self.cost[index] = 0
+        elif index == self.princess:
+            self.cost[index] = BLOCKED
+        else:
+            self.cost[index] = ENTER_COST.get(self.board.cells[index], BLOCKED)
+
+    def _relax(self, seeds):
+        """Dial's algorithm (bucket queue) from already-settled seed cells"""
+        dist, origin, neighbours, cost = self.dist, self.origin, self.neighbours, self.cost
+        buckets = {}
+        for cell in seeds:
+            buckets.setdefault(dist[cell], []).append(cell)
+        pending = len(seeds)
+        level = min(buckets) if buckets else 0
+        while pending:
+            bucket = buckets.pop(level, None)
+            if bucket is None:
+                level += 1
+                continue
+            for cell in bucket:
+                pending -= 1
+                if dist[cell] != level:
+                    continue  # stale entry, a cheaper one was settled already
+                step = cost[cell]
+                if step == BLOCKED:
+                    continue
+                reach = level + step
+                for neighbour in neighbours[cell]:
+                    if reach < dist[neighbour] and cost[neighbour] != BLOCKED:
+                        dist[neighbour] = reach
+                        origin[neighbour] = origin[cell]
+                        buckets.setdefault(reach, []).append(neighbour)
+                        pending += 1
+
+    def opened(self, index):
+        """A cell got cheaper to cross (obstacle cleaned, flower picked)"""
+        self._update_cost(index)
+        dist = self.dist
+        best, via = dist[index], self.origin[index]
+        if index not in self.sources:
+            for neighbour in self.neighbours[index]:
+                step = self.enter_cost(neighbour)
+                if step is not None and dist[neighbour] + step < best:
+                    best, via = dist[neighbour] + step, self.origin[neighbour]
+        dist[index], self.origin[index] = best, via
+        if best < INF:
+            self._relax([index])
+
+    def remove_source(self, source):
+        """Drop a source; cells routed to it are re-derived from their borders"""
+        self.sources.discard(source)
+        self._update_cost(source)
+        dist, origin, neighbours = self.dist, self.origin, self.neighbours
+        # Cells routed to a source form a connected region around it
+        stale = [source]
+        origin[source] = -1
+        for cell in stale:
+            for neighbour in neighbours[cell]:
+                if origin[neighbour] == source:
+                    origin[neighbour] = -1
+                    stale.append(neighbour)
+        for cell in stale:
+            dist[cell] = INF
+        border = set()
+        for cell in stale:
+            for neighbour in neighbours[cell]:
+                if dist[neighbour] < INF:
+                    border.add(neighbour)
+        self._relax(sorted(border))
+
+    def rebuild(self):
+        """Recompute from scratch (reference for the incremental updates)"""
+        self.__init__(self.board, self.sources)
+
+
+@functools.lru_cache(maxsize=64)
+def _neighbours(width, height):
+    """Neighbour indices per cell, in NORTH, EAST, SOUTH, WEST order"""
+    table = []
+    for y in range(height):
+        for x in range(width):
+            table.append([
+                (y + dy) * width + x + dx
+                for dx, dy in zip(DX, DY)
+                if 0 <= x + dx < width and 0 <= y + dy < height
+            ])
+    return table
+
+
+class Solver:
+    """Greedy autoplay: pick the nearest flower until full or none is left,
+    then deliver; obstacles on the way are cleaned"""
+
+    def __init__(self, board, incremental=True):
+        self.board = board.copy()
+        self.incremental = incremental
+        board = self.board
+        self.flowers = DistanceField(board, [i for i, c in enumerate(board.cells) if c == FLOWER])
+        self.princess = DistanceField(board, [board.princess_y * board.width + board.princess_x])
+        self.plan = []
+
+    def solve(self, max_actions=None):
+        """Plan until the game ends or nothing is reachable; returns the plan"""
+        board = self.board
+        limit = max_actions or 8 * board.width * board.height + 64
+        while board.status == PLAYING and len(self.plan) < limit:
+            robot = board.robot_y * board.width + board.robot_x
+            can_pick = board.flowers_held < MAX_FLOWERS_HELD and self.flowers.dist[robot] < INF
+            if can_pick:
+                field = self.flowers
+            elif board.flowers_held > 0 and self.princess.dist[robot] < INF:
+                field = self.princess
+            else:
+                break
+            if not self._step(field, robot):
+                break
+        return self.plan
+
+    def _step(self, field, robot):
+        """Take the cheapest move toward the field's nearest source"""
+        board = self.board
+        best, best_direction = INF, None
+        for direction in range(4):
+            x, y = board.robot_x + DX[direction], board.robot_y + DY[direction]
+            if not (0 <= x < board.width and 0 <= y < board.height):
+                continue
+            neighbour = y * board.width + x
+            step = field.enter_cost(neighbour)
+            if step is not None and field.dist[neighbour] + step < best:
+                best, best_direction = field.dist[neighbour] + step, direction
+        if best_direction is None:
+            return False
+        x, y = board.robot_x + DX[best_direction], board.robot_y + DY[best_direction]
+        target = y * board.width + x
+        if target in field.sources:
+            if field is self.flowers:
+                self._act(PICK_FLOWER, best_direction)
+                self._changed(target, picked=True)
+            else:
+                self._act(GIVE_FLOWER, best_direction)
+            return True
+        if board.cells[target] == OBSTACLE:
+            self._act(CLEAN, best_direction)
+            self._changed(target)
+        self._act(MOVE, best_direction)
+        return True
+
+    def _act(self, action, direction):
+        error = self.board.apply(action, direction)
+        if error is not None:
+            raise AssertionError(f'Solver planned an invalid action: {error}')
+        self.plan.append((action, direction))
+
+    def _changed(self, index, picked=False):
+        if not self.incremental:
+            if picked:
+                self.flowers.sources.discard(index)
+            self.flowers.rebuild()
+            self.princess.rebuild()
+            return
+        if picked:
+            self.flowers.remove_source(index)
+        else:
+            self.flowers.opened(index)
+        self.princess.opened(index)
+
+
+def solve(board, incremental=True):
+    """(action, direction) code pairs that play the board; board is untouched"""
+    return Solver(board, incremental).solve()
+
+
+def benchmark(count, sizes, seed):
+    rng = random.Random(seed)
+    for size in sizes:
+        boards = [generate_board(size, rng) for _ in range(count)]
+        results = {}
+        for incremental in (True, False):
+            won = actions = 0
+            start = time.perf_counter()
+            for board in boards:
+                solver = Solver(board, incremental)
+                actions += len(solver.solve())
+                won += solver.board.status != PLAYING and solver.board.is_complete
+            elapsed = time.perf_counter() - start
+            results[incremental] = elapsed
+        mode = f"{results[True] * 1000 / count:.2f} ms/board incremental, " \
+               f"{results[False] * 1000 / count:.2f} ms from scratch"
+        print(f"   {size:>2}x{size:<2}: {mode}; won {won}/{count}, "
+              f"{actions / count:.0f} actions/board")
+
+
+def main():
+    """Benchmark the solver over a seeded board corpus"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--boards', type=int, default=100)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 25, 50])
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("🚀 Benchmarking autoplay solver...")
+    benchmark(args.boards, args.sizes, args.seed)
+
+
+if __name__ == '__main__':
+    main()